@@ -13,19 +13,21 @@ import time
 import cv2
 import numpy as np
 import logging
+from typing import Optional
 
 # Add project root to path
 sys.path.append(str(Path(__file__).parent))
 
 from core.playwright_controller import PlaywrightController
 from core.canonical_vision import CanonicalBoardVision
-from core.strategy import BasicStrategy
+from core.strategy import BasicStrategy, DIRECTIONS
 from production.error_handler import ProductionErrorHandler, RobustConnectionManager, error_handler
 
 class Complete2048Bot:
     """Complete autonomous 2048 playing bot"""
 
-    def __init__(self, headless: bool = False, debug: bool = True, log_level: str = "INFO"):
+    def __init__(self, headless: bool = False, debug: bool = True, log_level: str = "INFO",
+                 screenshot_dir: Optional[str] = None):
         """
         Initialize the complete 2048 bot
 
@@ -33,8 +35,12 @@ class Complete2048Bot:
             headless: Run browser in headless mode
             debug: Enable debug output and screenshots
             log_level: Logging level for production error handling
+            screenshot_dir: Directory for move screenshots (default: current directory);
+                            give concurrent bots separate directories
         """
         self.debug = debug
+        self.screenshot_dir = Path(screenshot_dir) if screenshot_dir else Path(".")
+        self.screenshot_dir.mkdir(parents=True, exist_ok=True)
 
         # Initialize production error handling
         self.error_handler = ProductionErrorHandler(
@@ -71,6 +77,10 @@ class Complete2048Bot:
             print("   🧠 Strategy AI: Ready")
             print("   🛡️ Error Handler: Ready")
 
+    def _screenshot_path(self, filename: str) -> str:
+        """Path for a screenshot file inside this bot's screenshot directory"""
+        return str(self.screenshot_dir / filename)
+
     @error_handler("Game connection", max_retries=2)
     def connect_to_game(self, url: str = "https://2048game.com/") -> bool:
         """Connect to 2048 game with robust error handling"""
@@ -84,26 +94,51 @@ class Complete2048Bot:
 
         if success:
             self.error_handler.logger.info("✅ Connected successfully!")
-
-            # Wait for game to fully load and initial tiles to appear
-            for attempt in range(10):  # Try for up to 10 seconds
-                time.sleep(1)
-                try:
-                    screenshot = self.controller.take_screenshot("init_check.png")
-                    if screenshot is not None:
-                        result = self.vision.analyze_board(screenshot)
-                        if result['success'] and np.sum(result['board_state']) > 0:
-                            self.error_handler.logger.info(f"✅ Game initialized! Found tiles after {attempt + 1} seconds")
-                            return True
-                except Exception as e:
-                    self.error_handler.handle_error(e, f"Game initialization check (attempt {attempt + 1})")
-
-            self.error_handler.logger.warning("⚠️ Game may not have initialized properly, proceeding anyway...")
+            self._wait_for_initial_tiles()
             return True
         else:
             self.error_handler.logger.error("❌ All connection attempts failed!")
             return False
 
+    def _wait_for_initial_tiles(self, max_wait: int = 10) -> bool:
+        """Wait for the game to load until vision finds the starting tiles"""
+        for attempt in range(max_wait):  # One check per second
+            time.sleep(1)
+            try:
+                screenshot = self.controller.take_screenshot(self._screenshot_path("init_check.png"))
+                if screenshot is not None:
+                    result = self.vision.analyze_board(screenshot)
+                    if result['success'] and np.sum(result['board_state']) > 0:
+                        self.error_handler.logger.info(f"✅ Game initialized! Found tiles after {attempt + 1} seconds")
+                        return True
+            except Exception as e:
+                self.error_handler.handle_error(e, f"Game initialization check (attempt {attempt + 1})")
+
+        self.error_handler.logger.warning("⚠️ Game may not have initialized properly, proceeding anyway...")
+        return False
+
+    @error_handler("Game reset", max_retries=1)
+    def reset_for_new_game(self) -> bool:
+        """
+        Start a new game in the already running browser
+
+        Reloads the game page and clears per-game statistics, keeping the
+        Playwright browser alive. Connects first if no browser is running.
+        """
+        self.move_count = 0
+        self.score = 0
+        self.max_tile = 0
+        self.game_history = []
+        self.consecutive_failures = 0
+
+        if not self.controller.is_connected:
+            return self.connect_to_game()
+
+        self.error_handler.logger.info("🔄 Reloading game for a new round...")
+        self.controller.page.goto(self.controller.page.url, timeout=60000)
+        self._wait_for_initial_tiles()
+        return True
+
     @error_handler("Board analysis", max_retries=2)
     def analyze_current_state(self) -> dict:
         """Analyze current game state using computer vision"""
@@ -111,7 +146,7 @@ class Complete2048Bot:
             print("\n👁️  Analyzing game state...")
 
         # Take screenshot
-        screenshot = self.controller.take_screenshot(f"bot_move_{self.move_count:03d}_before.png")
+        screenshot = self.controller.take_screenshot(self._screenshot_path(f"bot_move_{self.move_count:03d}_before.png"))
         if screenshot is None:
             if self.debug:
                 print("❌ Screenshot failed!")
@@ -161,13 +196,11 @@ class Complete2048Bot:
         try:
             # Get move recommendation from strategy
             move_scores = self.strategy.get_move_scores(board_state)
-            best_move = self.strategy.recommend_move(board_state)
+            best_move = self.strategy.recommend_from_scores(move_scores)
 
             if self.debug:
                 print("📊 Move analysis:")
-                directions = ['UP', 'DOWN', 'LEFT', 'RIGHT']
-                for i, direction in enumerate(directions):
-                    score = move_scores[i] if i < len(move_scores) else 0
+                for direction, score in zip(DIRECTIONS, move_scores):
                     marker = " 🎯" if direction == best_move else ""
                     print(f"   {direction:>5}: {score:8.1f}{marker}")
 
@@ -203,7 +236,7 @@ class Complete2048Bot:
             time.sleep(1.5)
 
             # Take after screenshot
-            self.controller.take_screenshot(f"bot_move_{self.move_count:03d}_after.png")
+            self.controller.take_screenshot(self._screenshot_path(f"bot_move_{self.move_count:03d}_after.png"))
 
             return True
         else:
@@ -250,7 +283,7 @@ class Complete2048Bot:
         print("🚀 STARTING AUTONOMOUS 2048 GAMEPLAY!")
         print("=" * 50)
 
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         while self.move_count < max_moves:
             print(f"\n{'='*20} MOVE {self.move_count + 1} {'='*20}")
@@ -288,7 +321,7 @@ class Complete2048Bot:
             time.sleep(0.5)
 
         # Game completion
-        end_time = time.time()
+        end_time = time.perf_counter()
         duration = end_time - start_time
 
         # Final results
@@ -342,7 +375,7 @@ class Complete2048Bot:
                 self.controller.cleanup()
 
             # Clean up temporary files (but keep logs)
-            temp_files = Path(".").glob("bot_move_*.png")
+            temp_files = self.screenshot_dir.glob("bot_move_*.png")
             cleaned_count = 0
             for temp_file in temp_files:
                 try:
@@ -0,0 +1,151 @@
+# cython: boundscheck=False, wraparound=False, cdivision=True, language_level=3
+"""
+Strategy Kernels (Cython)
+Ahead-of-time build of core.strategy_kernels for deployments without Numba
+
+Build in place with:
+
+    cythonize -i core/_strategy_cy.pyx
+
+The loops mirror core/strategy_kernels.py and give identical features.
+"""
+
+import numpy as np
+
+cdef void _features(const int[:, ::1] a, double[::1] out) noexcept nogil:
+    """Heuristic features of one board into out (see strategy_kernels._board_features_loops)"""
+    cdef int i, j, k, axis, line, v, count, previous
+    cdef int empty = 0, merges = 0, max_tile = 0
+    cdef bint descending, ascending
+    cdef double corner = 0.0, monotonic = 0.0
+
+    for i in range(4):
+        for j in range(4):
+            v = a[i, j]
+            if v == 0:
+                empty += 1
+            if v > max_tile:
+                max_tile = v
+            if j < 3 and v != 0 and v == a[i, j + 1]:
+                merges += 1
+            if i < 3 and v != 0 and v == a[i + 1, j]:
+                merges += 1
+
+    if max_tile != 0 and (a[0, 0] == max_tile or a[0, 3] == max_tile
+                          or a[3, 0] == max_tile or a[3, 3] == max_tile):
+        corner = 1.0
+
+    for axis in range(2):
+        for line in range(4):
+            count = 0
+            previous = 0
+            descending = True
+            ascending = True
+            for k in range(4):
+                v = a[line, k] if axis == 0 else a[k, line]
+                if v == 0:
+                    continue
+                if count > 0:
+                    if v > previous:
+                        descending = False
+                    if v < previous:
+                        ascending = False
+                previous = v
+                count += 1
+            if count > 1:
+                if descending:
+                    monotonic += 1.0
+                elif ascending:
+                    monotonic += 0.5
+
+    out[0] = empty
+    out[1] = merges
+    out[2] = corner
+    out[3] = monotonic
+    out[4] = max_tile
+
+def board_features_kernel(const int[:, ::1] a):
+    """Heuristic features of one 4x4 int32 board as a float64 array of 5"""
+    features = np.empty(5, dtype=np.float64)
+    cdef double[::1] out = features
+    with nogil:
+        _features(a, out)
+    return features
+
+cdef bint _slide(const int[:, ::1] a, int direction, int[:, ::1] result) noexcept nogil:
+    """Slide and merge one direction into result (see strategy_kernels._slide_loops)"""
+    cdef int tiles[4]
+    cdef int merged[4]
+    cdef int line, k, v, count, size, i, r, c
+    cdef bint moved = False
+
+    for line in range(4):
+        count = 0
+        for k in range(4):
+            if direction == 0:
+                v = a[k, line]
+            elif direction == 1:
+                v = a[3 - k, line]
+            elif direction == 2:
+                v = a[line, k]
+            else:
+                v = a[line, 3 - k]
+            if v != 0:
+                tiles[count] = v
+                count += 1
+
+        size = 0
+        i = 0
+        while i < count:
+            if i + 1 < count and tiles[i] == tiles[i + 1]:
+                merged[size] = tiles[i] * 2
+                i += 2
+            else:
+                merged[size] = tiles[i]
+                i += 1
+            size += 1
+        for k in range(size, 4):
+            merged[k] = 0
+
+        for k in range(4):
+            if direction == 0:
+                r = k
+                c = line
+            elif direction == 1:
+                r = 3 - k
+                c = line
+            elif direction == 2:
+                r = line
+                c = k
+            else:
+                r = line
+                c = 3 - k
+            result[r, c] = merged[k]
+            if merged[k] != a[r, c]:
+                moved = True
+
+    return moved
+
+def slide_kernel(const int[:, ::1] a, int direction, int[:, ::1] result):
+    """Slide and merge one direction into result; True if any tile moved"""
+    cdef bint moved
+    with nogil:
+        moved = _slide(a, direction, result)
+    return moved
+
+def move_features_kernel(const int[:, ::1] a):
+    """Slide in all four directions and featurize each result (see strategy_kernels._move_features_loops)"""
+    moved_array = np.zeros(4, dtype=np.bool_)
+    features_array = np.zeros((4, 5), dtype=np.float64)
+    cdef char[::1] moved = moved_array.view(np.int8)
+    cdef double[:, ::1] features = features_array
+    cdef int[:, ::1] result = np.empty((4, 4), dtype=np.intc)
+    cdef int direction
+
+    with nogil:
+        for direction in range(4):
+            if _slide(a, direction, result):
+                moved[direction] = 1
+                _features(result, features[direction])
+
+    return moved_array, features_array
@@ -0,0 +1,116 @@
+"""
+Browser Pool
+Process-wide warm Playwright browsers shared by PlaywrightController instances.
+Controllers get an isolated BrowserContext each instead of launching a browser.
+"""
+
+import os
+import atexit
+from typing import Dict, List, Optional, Tuple
+
+# Try to import Playwright, but make it optional for testing
+try:
+    from playwright.sync_api import sync_playwright
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    PLAYWRIGHT_AVAILABLE = False
+
+# A browser is relaunched after serving this many contexts to curb native memory drift
+BROWSER_POOL_RECYCLE_AFTER = 100
+
+_BrowserKey = Tuple[str, bool, Tuple[str, ...]]
+
+_owner_pid: Optional[int] = None
+_playwright = None
+_browsers: Dict[_BrowserKey, object] = {}
+_contexts_served: Dict[_BrowserKey, int] = {}
+
+def _ensure_playwright():
+    """Start the shared Playwright driver for this process"""
+    global _owner_pid, _playwright
+
+    # A forked worker inherits the parent's handles, which only work in the parent
+    if _owner_pid != os.getpid():
+        _playwright = None
+        _browsers.clear()
+        _contexts_served.clear()
+        _owner_pid = os.getpid()
+
+    if _playwright is None:
+        if not PLAYWRIGHT_AVAILABLE:
+            raise ImportError("Playwright is not installed. Run: pip install playwright && playwright install")
+        _playwright = sync_playwright().start()
+    return _playwright
+
+def get_browser(browser_type: str = "chromium", headless: bool = True,
+                args: Optional[List[str]] = None):
+    """
+    Return a running browser for the given settings, launching it on first use
+
+    Args:
+        browser_type: chromium, firefox or webkit
+        headless: Run the browser without a window
+        args: Extra launch arguments (part of the pool key)
+
+    Returns:
+        Shared Playwright Browser handle
+    """
+    playwright = _ensure_playwright()
+    key = (browser_type, headless, tuple(args or ()))
+
+    browser = _browsers.get(key)
+    if browser is not None:
+        worn_out = _contexts_served[key] >= BROWSER_POOL_RECYCLE_AFTER and not browser.contexts
+        if browser.is_connected() and not worn_out:
+            return browser
+        try:
+            browser.close()
+        except Exception:
+            pass
+
+    if browser_type not in ("chromium", "firefox", "webkit"):
+        raise ValueError(f"Unsupported browser type: {browser_type}")
+
+    launcher = getattr(playwright, browser_type)
+    browser = launcher.launch(headless=headless, args=list(args) if args else None)
+    _browsers[key] = browser
+    _contexts_served[key] = 0
+    return browser
+
+def new_context(browser_type: str = "chromium", headless: bool = True,
+                args: Optional[List[str]] = None, **context_options):
+    """Open an isolated context on the pooled browser; close it with release_context()"""
+    browser = get_browser(browser_type, headless, args)
+    _contexts_served[(browser_type, headless, tuple(args or ()))] += 1
+    return browser.new_context(**context_options)
+
+def release_context(context):
+    """Close a context, leaving its browser running for the next controller"""
+    try:
+        context.close()
+    except Exception as e:
+        print(f"⚠️  Context close warning: {str(e)}")
+
+def shutdown_pool():
+    """Close every pooled browser and stop the Playwright driver"""
+    global _playwright
+
+    if _owner_pid != os.getpid():
+        return
+
+    for browser in _browsers.values():
+        try:
+            browser.close()
+        except Exception:
+            pass
+    _browsers.clear()
+    _contexts_served.clear()
+
+    if _playwright is not None:
+        try:
+            _playwright.stop()
+        except Exception:
+            pass
+        _playwright = None
+
+atexit.register(shutdown_pool)
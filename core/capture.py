@@ -5,13 +5,30 @@ Handles real-world screen capture for 2048 game board detection.
 NO SIMULATIONS - all functionality uses real screen capture.
 """
 
+import sys
 import time
+import threading
+from collections import deque
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 import numpy as np
 import mss
 import cv2
-from typing import Optional, Tuple, Dict, Any
+from typing import Deque, Iterator, Optional, Tuple, Dict, Any
+
+# DXGI Desktop Duplication on Windows is optional
+try:
+    import dxcam
+    DXCAM_AVAILABLE = True
+except ImportError:
+    DXCAM_AVAILABLE = False
+
+# Full-screen buffers kept for reuse between captures
+FRAME_POOL_SIZE = 4
+
+# Lossy but much faster to encode than PNG; fine for test artifacts
+WEBP_QUALITY = 85
 
 class GameCapture:
     """Real-world screen capture for 2048 game board"""
@@ -24,6 +41,14 @@ class GameCapture:
             'successful_captures': 0,
             'average_capture_time_ms': 0
         }
+        # Capture handles are opened on first use and kept across captures
+        # MSS handles hold per-thread display/DC state, so each thread gets its own
+        self._sct_local = threading.local()
+        self._sct_handles = []
+        self._dxgi = None
+        self._last_dxgi_frame: Optional[np.ndarray] = None
+        # Reusable full-screen buffers handed back through release_frame()
+        self._pool: Deque[np.ndarray] = deque(maxlen=FRAME_POOL_SIZE)
 
     def _load_config(self, config_path: Optional[str]) -> Dict[str, Any]:
         """Load capture configuration"""
@@ -41,53 +66,73 @@ class GameCapture:
     def get_monitor_info(self) -> Dict[str, Any]:
         """Get real monitor information - no simulation"""
         try:
-            with mss.mss() as sct:
-                monitors = sct.monitors
-                return {
-                    'monitor_count': len(monitors) - 1,  # First is "all monitors"
-                    'primary_monitor': monitors[0],
-                    'individual_monitors': monitors[1:],
-                    'total_screen_area': monitors[0]
-                }
+            monitors = self._get_sct().monitors
+            return {
+                'monitor_count': len(monitors) - 1,  # First is "all monitors"
+                'primary_monitor': monitors[0],
+                'individual_monitors': monitors[1:],
+                'total_screen_area': monitors[0]
+            }
         except Exception as e:
             raise RuntimeError(f"Failed to get monitor info: {e}")
 
-    def capture_full_screen(self, save_path: Optional[str] = None) -> np.ndarray:
+    def capture_full_screen(self, save_path: Optional[str] = None,
+                            out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Capture full screen - REAL capture only
         Uses Wayland-compatible methods when needed
 
+        Args:
+            save_path: Optional file to save the capture to
+            out: Optional (H, W, 3) uint8 buffer to fill in place; without it a
+                 pooled buffer is reused when one fits
+
         Returns:
             numpy.ndarray: RGB image array of captured screen
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
 
-        # Try MSS first (works on X11)
+        # Try DXGI Desktop Duplication on Windows, then MSS (works on X11)
         try:
-            with mss.mss() as sct:
-                # Capture primary monitor
-                monitor = sct.monitors[self.config['monitor_index']]
-                screenshot = sct.grab(monitor)
-
-                # Convert to numpy array (RGB)
-                img_array = np.frombuffer(screenshot.rgb, dtype=np.uint8)
-                img_array = img_array.reshape((screenshot.height, screenshot.width, 3))
+            img_array = self._grab_dxgi_full_screen(out)
+            if img_array is None:
+                img_array = self._grab_rgb(self._get_sct().monitors[self.config['monitor_index']], out)
 
-                # Update statistics
-                capture_time = (time.time() - start_time) * 1000
-                self._update_capture_stats(capture_time, success=True)
+            # Update statistics
+            capture_time = (time.perf_counter() - start_time) * 1000
+            self._update_capture_stats(capture_time, success=True)
 
-                # Save if requested
-                if save_path:
-                    self._save_capture(img_array, save_path)
+            # Save if requested
+            if save_path:
+                self.save_capture(img_array, save_path)
 
-                self.last_capture_time = time.time()
-                return img_array
+            self.last_capture_time = time.time()
+            return img_array
 
         except Exception as mss_error:
             # Fall back to Wayland-compatible method
             return self._capture_wayland_fallback(save_path, start_time)
 
+    @contextmanager
+    def frame(self) -> Iterator[np.ndarray]:
+        """Capture the full screen into a pooled buffer that is returned to the pool on exit"""
+        image = self.capture_full_screen()
+        try:
+            yield image
+        finally:
+            self.release_frame(image)
+
+    def release_frame(self, image: np.ndarray) -> None:
+        """Hand a full-screen capture back for reuse; the caller must not use it afterwards"""
+        if image.dtype == np.uint8 and image.flags.c_contiguous and image.flags.writeable:
+            self._pool.append(image)
+
+    def _take_buffer(self, height: int, width: int) -> np.ndarray:
+        """Pooled (height, width, 3) buffer, allocating one when none fits"""
+        if self._pool and self._pool[-1].shape == (height, width, 3):
+            return self._pool.pop()
+        return np.empty((height, width, 3), dtype=np.uint8)
+
     def capture_board_region(self, save_path: Optional[str] = None) -> Optional[np.ndarray]:
         """
         Capture specific board region if configured
@@ -102,31 +147,26 @@ class GameCapture:
         try:
             region = self.config['board_region']
 
-            with mss.mss() as sct:
-                # Define capture region
-                capture_area = {
-                    'top': region['top'],
-                    'left': region['left'],
-                    'width': region['width'],
-                    'height': region['height']
-                }
-
-                start_time = time.time()
-                screenshot = sct.grab(capture_area)
+            # Define capture region
+            capture_area = {
+                'top': region['top'],
+                'left': region['left'],
+                'width': region['width'],
+                'height': region['height']
+            }
 
-                # Convert to numpy array
-                img_array = np.frombuffer(screenshot.rgb, dtype=np.uint8)
-                img_array = img_array.reshape((screenshot.height, screenshot.width, 3))
+            start_time = time.perf_counter()
+            img_array = self._grab_rgb(capture_area)
 
-                # Update statistics
-                capture_time = (time.time() - start_time) * 1000
-                self._update_capture_stats(capture_time, success=True)
+            # Update statistics
+            capture_time = (time.perf_counter() - start_time) * 1000
+            self._update_capture_stats(capture_time, success=True)
 
-                # Save if requested
-                if save_path:
-                    self._save_capture(img_array, save_path)
+            # Save if requested
+            if save_path:
+                self.save_capture(img_array, save_path)
 
-                return img_array
+            return img_array
 
         except Exception as e:
             self._update_capture_stats(0, success=False)
@@ -214,12 +254,99 @@ class GameCapture:
         """Get real capture performance statistics"""
         return self.capture_stats.copy()
 
-    def _save_capture(self, image: np.ndarray, save_path: str) -> None:
-        """Save captured image to file"""
+    def close(self) -> None:
+        """Release the persistent capture handles"""
+        for sct in self._sct_handles:
+            try:
+                sct.close()
+            except Exception:
+                pass
+        self._sct_handles = []
+        self._sct_local = threading.local()
+        if self._dxgi is not None:
+            try:
+                self._dxgi.release()
+            except Exception:
+                pass
+            self._dxgi = None
+            self._last_dxgi_frame = None
+        self._pool.clear()
+
+    def _get_sct(self):
+        """MSS handle for this thread, opened once so each capture skips the display connection setup"""
+        sct = getattr(self._sct_local, 'sct', None)
+        if sct is None:
+            sct = mss.mss()
+            self._sct_local.sct = sct
+            self._sct_handles.append(sct)
+        return sct
+
+    def _grab_rgb(self, area: Dict[str, int], out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Grab a screen area with MSS as an RGB array, written into out or a pooled buffer"""
+        screenshot = self._get_sct().grab(area)
+        height, width = screenshot.height, screenshot.width
+        if out is None or out.shape != (height, width, 3):
+            out = self._take_buffer(height, width)
+
+        # MSS returns BGRA rows; one OpenCV pass drops alpha and swaps channels
+        bgra = np.frombuffer(screenshot.raw, dtype=np.uint8).reshape((height, width, 4))
+        return cv2.cvtColor(bgra, cv2.COLOR_BGRA2RGB, dst=out)
+
+    def _grab_dxgi_full_screen(self, out: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+        """
+        Grab the screen through DXGI Desktop Duplication (Windows with dxcam only)
+
+        Args:
+            out: Optional buffer to copy the frame into
+
+        Returns:
+            RGB image array, or None when this backend is unavailable
+        """
+        if sys.platform != 'win32' or not DXCAM_AVAILABLE:
+            return None
+
+        if self._dxgi is None:
+            # MSS index 0 is "all monitors"; DXGI outputs start at the primary
+            output_idx = max(self.config['monitor_index'] - 1, 0)
+            self._dxgi = dxcam.create(output_idx=output_idx, output_color="RGB")
+            if self._dxgi is None:
+                return None
+
+        frame = self._dxgi.grab()
+        if frame is None:
+            # No new frame since the last grab: the screen is unchanged
+            frame = self._last_dxgi_frame
+            if frame is None:
+                return None
+        self._last_dxgi_frame = frame
+
+        height, width = frame.shape[:2]
+        if out is None or out.shape != (height, width, 3):
+            out = self._take_buffer(height, width)
+        np.copyto(out, frame)
+        return out
+
+    def save_capture(self, image: np.ndarray, save_path: str) -> None:
+        """
+        Save a captured RGB image, choosing the encoding from the file extension
+
+        .npy writes the raw array (no encoding cost), .webp encodes at quality 85,
+        and any other extension (e.g. .png) goes through cv2.imwrite as before.
+        """
         try:
+            suffix = Path(save_path).suffix.lower()
+            if suffix == '.npy':
+                np.save(save_path, image)
+                return
+
             # Convert RGB to BGR for OpenCV
             bgr_image = cv2.cvtColor(image, cv2.COLOR_RGB2BGR)
-            cv2.imwrite(save_path, bgr_image)
+            if suffix == '.webp':
+                written = cv2.imwrite(save_path, bgr_image, [cv2.IMWRITE_WEBP_QUALITY, WEBP_QUALITY])
+            else:
+                written = cv2.imwrite(save_path, bgr_image)
+            if not written:
+                raise RuntimeError(f"cv2.imwrite could not write {save_path}")
         except Exception as e:
             raise RuntimeError(f"Failed to save capture: {e}")
 
@@ -250,8 +377,8 @@ class GameCapture:
         import tempfile
 
         try:
-            # Use temporary file if no save path provided
-            if save_path is None:
+            # gnome-screenshot writes PNG; capture to a temporary file for any other target
+            if save_path is None or Path(save_path).suffix.lower() != '.png':
                 temp_file = tempfile.NamedTemporaryFile(suffix='.png', delete=False)
                 capture_path = temp_file.name
                 temp_file.close()
@@ -277,11 +404,14 @@ class GameCapture:
             img_array = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2RGB)
 
             # Update statistics
-            capture_time = (time.time() - start_time) * 1000
+            capture_time = (time.perf_counter() - start_time) * 1000
             self._update_capture_stats(capture_time, success=True)
 
+            if save_path is not None and capture_path != save_path:
+                self.save_capture(img_array, save_path)
+
             # Clean up temp file if used
-            if save_path is None:
+            if capture_path != save_path:
                 import os
                 try:
                     os.unlink(capture_path)
@@ -21,8 +21,20 @@ class GameBotError(Exception):
     """Custom exception for game bot errors"""
     pass
 
+# Move column codes for GameSession's move log
+_MOVES = tuple(Move)
+_MOVE_CODES = {move: code for code, move in enumerate(_MOVES)}
+
 class GameSession:
-    """Tracks data for a single game session"""
+    """
+    Tracks data for a single game session
+
+    move_log and board_states are rebuilt from the recorded columns on each
+    access, so they are read-only snapshots; record moves through add_move().
+    """
+
+    # Initial move log capacity; the columns double when full
+    LOG_CAPACITY = 256
 
     def __init__(self):
         self.start_time = datetime.now()
@@ -31,32 +43,96 @@ class GameSession:
         self.final_score = 0
         self.highest_tile = 0
         self.efficiency = 0.0
-        self.board_states = []
-        self.move_log = []
         self.completed = False
 
+        # Move log stored column-wise; move_log and board_states build views on demand.
+        # Boards are kept as given in the object columns and copied into the int
+        # columns when they are 4x4, which board_states and highest_tile read.
+        self._log_len = 0
+        self._log_moves = np.empty(self.LOG_CAPACITY, dtype=np.uint8)
+        self._log_before_raw = np.empty(self.LOG_CAPACITY, dtype=object)
+        self._log_after_raw = np.empty(self.LOG_CAPACITY, dtype=object)
+        self._log_before = np.zeros((self.LOG_CAPACITY, 4, 4), dtype=np.int32)
+        self._log_after = np.zeros((self.LOG_CAPACITY, 4, 4), dtype=np.int32)
+        self._log_has_after = np.zeros(self.LOG_CAPACITY, dtype=np.bool_)
+        self._log_stored = np.zeros(self.LOG_CAPACITY, dtype=np.bool_)
+        self._log_scores = np.empty(self.LOG_CAPACITY, dtype=np.int64)
+        self._log_times = np.empty(self.LOG_CAPACITY, dtype=np.float64)
+
+    def _grow_log(self):
+        """Double the move log columns"""
+        for name in ('_log_moves', '_log_before_raw', '_log_after_raw', '_log_before', '_log_after',
+                     '_log_has_after', '_log_stored', '_log_scores', '_log_times'):
+            column = getattr(self, name)
+            grown = np.empty((column.shape[0] * 2,) + column.shape[1:], dtype=column.dtype)
+            grown[:column.shape[0]] = column
+            setattr(self, name, grown)
+
     def add_move(self, move: Move, board_before: List[List[int]], board_after: Optional[List[List[int]]], score: int):
         """Record a move"""
+        i = self._log_len
+        if i == self._log_moves.shape[0]:
+            self._grow_log()
+
+        self._log_moves[i] = _MOVE_CODES[move]
+        self._log_before_raw[i] = board_before
+        self._log_after_raw[i] = board_after
+        before_stored = self._store_board(self._log_before, i, board_before)
+        after_stored = bool(board_after) and self._store_board(self._log_after, i, board_after)
+        self._log_has_after[i] = bool(board_after)
+        self._log_stored[i] = after_stored if board_after else before_stored
+        self._log_scores[i] = score
+        self._log_times[i] = time.time()
+        self._log_len += 1
         self.moves += 1
-        self.move_log.append({
-            'move_number': self.moves,
-            'move': move.value,
-            'board_before': board_before,
-            'board_after': board_after,
-            'score': score,
-            'timestamp': datetime.now()
-        })
-
-        # Track known board states for later analysis/GUI updates
-        if board_after:
-            self.board_states.append([row[:] for row in board_after])
-        else:
-            self.board_states.append([row[:] for row in board_before])
 
         # Update highest achieved tile using the most reliable board snapshot
-        candidate_boards = [state for state in (board_after, board_before) if state]
-        for state in candidate_boards:
-            self.highest_tile = max(self.highest_tile, max(max(row) for row in state))
+        for board, stored, column in ((board_before, before_stored, self._log_before),
+                                      (board_after, after_stored, self._log_after)):
+            if stored:
+                tile = int(column[i].max())
+            elif board:
+                tile = max((max(row) for row in board if row), default=0)
+            else:
+                continue
+            self.highest_tile = max(self.highest_tile, tile)
+
+    @staticmethod
+    def _store_board(column: np.ndarray, i: int, board: Optional[List[List[int]]]) -> bool:
+        """Copy a board into a log column; False (and an empty row) if it is missing or not 4x4"""
+        try:
+            column[i] = board
+            return True
+        except (TypeError, ValueError):
+            column[i] = 0
+            return False
+
+    @property
+    def move_log(self) -> List[Dict[str, Any]]:
+        """Recorded moves as one dict per move, with the boards as they were passed in"""
+        log = []
+        for i in range(self._log_len):
+            log.append({
+                'move_number': i + 1,
+                'move': _MOVES[self._log_moves[i]].value,
+                'board_before': self._log_before_raw[i],
+                'board_after': self._log_after_raw[i],
+                'score': int(self._log_scores[i]),
+                'timestamp': datetime.fromtimestamp(self._log_times[i])
+            })
+        return log
+
+    @property
+    def board_states(self) -> List[List[List[int]]]:
+        """Known board after each move (the board before it when the result was not seen)"""
+        n = self._log_len
+        states = np.where(self._log_has_after[:n, None, None], self._log_after[:n], self._log_before[:n]).tolist()
+
+        # Boards that did not fit the 4x4 columns are copied from the raw log
+        for i in np.flatnonzero(~self._log_stored[:n]):
+            board = self._log_after_raw[i] if self._log_has_after[i] else self._log_before_raw[i]
+            states[i] = [list(row) for row in board or []]
+        return states
 
     def finish_game(self, final_score: int):
         """Mark game as finished"""
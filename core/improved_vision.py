@@ -265,6 +265,9 @@ class ImprovedBoardVision:
             'grid_extracted': False,
             'board_state': [[0 for _ in range(4)] for _ in range(4)],
             'confidence_scores': [[0.0 for _ in range(4)] for _ in range(4)],
+            # Same values as contiguous arrays for vectorized consumers
+            'board_array': np.zeros((4, 4), dtype=np.int32),
+            'confidence_array': np.zeros((4, 4), dtype=np.float32),
             'board_region': None,
             'recognition_method': 'improved_color_profiles',
             'debug_info': {}
@@ -296,6 +299,8 @@ class ImprovedBoardVision:
             results['grid_extracted'] = True
 
             # Step 4: Recognize each tile using improved method
+            board_array = results['board_array']
+            confidence_array = np.zeros((4, 4), dtype=np.float64)
             recognition_stats = {'successful': 0, 'total': 16}
             tile_positions = []
             tile_mapping: Dict[Tuple[int, int], int] = {}
@@ -313,11 +318,11 @@ class ImprovedBoardVision:
 
                         if tile_image.size > 0:
                             tile_value, match_score = self.recognize_tile_value(tile_image)
-                            results['board_state'][row][col] = tile_value
+                            board_array[row, col] = tile_value
                             tile_mapping[(row, col)] = tile_value
 
                             confidence = max(0.0, min(1.0, 1.0 - (match_score / 400.0)))
-                            results['confidence_scores'][row][col] = confidence
+                            confidence_array[row, col] = confidence
                             confidence_mapping[(row, col)] = confidence
 
                             threshold = self.match_threshold if tile_value > 0 else self.empty_threshold
@@ -332,6 +337,11 @@ class ImprovedBoardVision:
                                     'predicted': tile_value
                                 })
 
+            # Nested lists for existing consumers (JSON reports, strategy input)
+            results['board_state'] = board_array.tolist()
+            results['confidence_scores'] = confidence_array.tolist()
+            results['confidence_array'] = confidence_array.astype(np.float32)
+
             # Calculate success metrics
             recognition_rate = recognition_stats['successful'] / recognition_stats['total']
             results['debug_info']['recognition_rate'] = recognition_rate
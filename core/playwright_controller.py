@@ -7,7 +7,8 @@ Drop-in replacement for previous Selenium-based approach.
 import cv2
 import numpy as np
 from pathlib import Path
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, List
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 import time
 
 # Try to import Playwright, but make it optional for testing
@@ -18,6 +19,42 @@ except ImportError:
     PLAYWRIGHT_AVAILABLE = False
     print("⚠️  Playwright not available in this environment")
 
+from .browser_pool import new_context, release_context
+
+
+# Requests from these domains are always allowed through the ad blocker
+ALLOWED_DOMAINS = (
+    '2048game.com',
+    'www.2048game.com',
+    'githubusercontent.com'
+)
+
+# Known ad and tracking URL patterns
+AD_PATTERNS = (
+    'googlesyndication',
+    'doubleclick',
+    'googletagmanager',
+    'google-analytics',
+    'facebook.com/tr',
+    'googleadservices',
+    'adsystem',
+    'amazon-adsystem',
+    'scorecardresearch'
+)
+
+# True once no CSS animation or transition is running on the tiles. Tiles keep
+# their tile-new/tile-merged classes until the next move, so those can't be used.
+BOARD_STABLE_JS = (
+    "() => { const c = document.querySelector('.tile-container');"
+    " return !c || c.getAnimations({subtree: true}).length === 0; }"
+)
+
+def should_block_request(url: str) -> bool:
+    """Check whether a request URL is an ad or tracker (everything else is allowed)"""
+    url = url.lower()
+    if any(domain in url for domain in ALLOWED_DOMAINS):
+        return False
+    return any(pattern in url for pattern in AD_PATTERNS)
 
 class PlaywrightController:
     """Minimal Playwright controller for 2048 automation"""
@@ -39,8 +76,14 @@ class PlaywrightController:
         self.block_ads = block_ads
         self.playwright = None
         self.browser = None
+        self.context = None
         self.page = None
         self.is_connected = False
+        self._board_box: Optional[Tuple[int, int, int, int]] = None  # Cached (x, y, w, h) of the board
+
+        # Saved screenshots are written to disk off the calling thread
+        self._write_pool: Optional[ThreadPoolExecutor] = None
+        self._pending_writes: List[Future] = []
 
     def connect(self, url: str = "https://2048game.com/") -> bool:
         """
@@ -55,12 +98,9 @@ class PlaywrightController:
         try:
             print(f"🌐 Connecting to browser ({self.browser_type})...")
 
-            # Start Playwright
-            self.playwright = sync_playwright().start()
-
             # Configure browser launch arguments for ad blocking
             launch_args = []
-            if self.block_ads:
+            if self.block_ads and self.browser_type == "chromium":
                 # Add ad blocking arguments
                 launch_args.extend([
                     '--disable-background-networking',
@@ -77,63 +117,23 @@ class PlaywrightController:
                     '--disable-features=VizDisplayCompositor'
                 ])
 
-            # Launch browser with ad blocking
-            if self.browser_type == "chromium":
-                self.browser = self.playwright.chromium.launch(
-                    headless=self.headless,
-                    args=launch_args if self.block_ads else None
-                )
-            elif self.browser_type == "firefox":
-                # Firefox uses different approach - we'll use page-level blocking
-                self.browser = self.playwright.firefox.launch(headless=self.headless)
-            elif self.browser_type == "webkit":
-                # WebKit uses different approach - we'll use page-level blocking
-                self.browser = self.playwright.webkit.launch(headless=self.headless)
-            else:
-                raise ValueError(f"Unsupported browser type: {self.browser_type}")
+            # Check out an isolated context on a warm pooled browser; Firefox and
+            # WebKit take no launch arguments and rely on page-level blocking
+            self.context = new_context(self.browser_type, self.headless, launch_args)
+            self.browser = self.context.browser
 
             # Create new page
-            self.page = self.browser.new_page()
+            self.page = self.context.new_page()
 
             # Set up page-level ad blocking for all browsers
             if self.block_ads:
                 # Block common ad domains and tracking
                 def block_ads(route, request):
                     """Block ads and tracking requests"""
-                    url = request.url
-
-                    # Allow the main game domain and essential resources
-                    allowed_domains = [
-                        '2048game.com',
-                        'www.2048game.com',
-                        'githubusercontent.com'
-                    ]
-
-                    # Allow if from allowed domain
-                    if any(domain in url.lower() for domain in allowed_domains):
-                        route.continue_()
-                        return
-
-                    # Block known ad patterns
-                    ad_patterns = [
-                        'googlesyndication',
-                        'doubleclick',
-                        'googletagmanager',
-                        'google-analytics',
-                        'facebook.com/tr',
-                        'googleadservices',
-                        'adsystem',
-                        'amazon-adsystem',
-                        'scorecardresearch'
-                    ]
-
-                    # Block if URL contains ad patterns
-                    if any(pattern in url.lower() for pattern in ad_patterns):
+                    if should_block_request(request.url):
                         route.abort()
-                        return
-
-                    # Allow everything else (more permissive for game functionality)
-                    route.continue_()
+                    else:
+                        route.continue_()
 
                 # Set up request interception
                 self.page.route('**/*', block_ads)
@@ -162,12 +162,16 @@ class PlaywrightController:
             self.cleanup()
             return False
 
-    def take_screenshot(self, save_path: Optional[str] = None) -> Optional[np.ndarray]:
+    def take_screenshot(self, save_path: Optional[str] = None,
+                        out: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
         """
         Take screenshot of current page
 
         Args:
-            save_path: Optional path to save screenshot
+            save_path: Optional path to save screenshot; the file is written in the
+                       background, call flush_writes() before reading it back
+            out: Optional preallocated BGR buffer to decode into; reused when the
+                 page size matches, otherwise a new array is returned
 
         Returns:
             Screenshot as numpy array (BGR format for OpenCV)
@@ -177,43 +181,71 @@ class PlaywrightController:
             return None
 
         try:
-            # Take screenshot
+            screenshot_bytes = self.page.screenshot(full_page=True, type='png')
+
             if save_path:
-                self.page.screenshot(path=save_path, full_page=True)
+                if self._write_pool is None:
+                    self._write_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="screenshot-writer")
+                self._pending_writes = [f for f in self._pending_writes if not f.done()]
+                self._pending_writes.append(self._write_pool.submit(Path(save_path).write_bytes, screenshot_bytes))
                 print(f"📸 Screenshot saved: {save_path}")
 
-                # Load with OpenCV for consistency with vision system
-                image = cv2.imread(save_path)
-                return image
-            else:
-                # Get screenshot as bytes and convert to numpy array
-                screenshot_bytes = self.page.screenshot(full_page=True)
+            # Decode the PNG bytes straight to BGR for OpenCV
+            image_bgr = cv2.imdecode(np.frombuffer(screenshot_bytes, dtype=np.uint8), cv2.IMREAD_COLOR)
+
+            # Copy into the caller's buffer so it can be reused frame after frame
+            if out is not None and image_bgr is not None and out.shape == image_bgr.shape and out.dtype == image_bgr.dtype:
+                np.copyto(out, image_bgr)
+                return out
+
+            return image_bgr
 
-                # Convert bytes to numpy array
-                import io
-                from PIL import Image
+        except Exception as e:
+            print(f"❌ Screenshot failed: {str(e)}")
+            return None
 
-                # Convert bytes to PIL Image
-                image_pil = Image.open(io.BytesIO(screenshot_bytes))
+    def flush_writes(self):
+        """Wait until every saved screenshot is on disk"""
+        pending, self._pending_writes = self._pending_writes, []
+        for future in wait(pending).done:
+            if future.exception() is not None:
+                print(f"⚠️  Screenshot write failed: {future.exception()}")
 
-                # Convert PIL to numpy array
-                image_np = np.array(image_pil)
+    def get_board_crop(self, screenshot: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Get the game board region of a full-page screenshot
 
-                # Convert RGBA/RGB to BGR for OpenCV
-                if len(image_np.shape) == 3:
-                    if image_np.shape[2] == 4:  # RGBA
-                        image_bgr = cv2.cvtColor(image_np, cv2.COLOR_RGBA2BGR)
-                    else:  # RGB
-                        image_bgr = cv2.cvtColor(image_np, cv2.COLOR_RGB2BGR)
-                else:
-                    image_bgr = image_np
+        The board position is looked up once and cached; the crop is a view
+        into the screenshot, cheap enough for pixel-level change detection.
 
-                return image_bgr
+        Args:
+            screenshot: Full-page screenshot from take_screenshot()
 
-        except Exception as e:
-            print(f"❌ Screenshot failed: {str(e)}")
+        Returns:
+            Board region as a numpy view, or None if the board cannot be located
+        """
+        if screenshot is None:
             return None
 
+        if self._board_box is None:
+            if not self.is_connected or not self.page:
+                return None
+            try:
+                box = self.page.locator(".game-container").bounding_box()
+                if not box:
+                    return None
+                # bounding_box() is viewport-relative; full-page screenshots start at the document origin
+                scroll_x, scroll_y = self.page.evaluate("() => [window.scrollX, window.scrollY]")
+                self._board_box = (int(box['x'] + scroll_x), int(box['y'] + scroll_y),
+                                   int(box['width']), int(box['height']))
+            except Exception as e:
+                print(f"⚠️  Board location unavailable: {str(e)}")
+                return None
+
+        x, y, w, h = self._board_box
+        crop = screenshot[y:y + h, x:x + w]
+        return crop if crop.size else None
+
     def send_key(self, key: str) -> bool:
         """
         Send key press to game
@@ -275,8 +307,15 @@ class PlaywrightController:
                 new_game_button.click()
                 print("🔄 Game reset")
 
-                # Wait for reset to complete
-                time.sleep(0.5)
+                # Wait for the score to return to zero rather than a fixed delay
+                try:
+                    self.page.wait_for_function(
+                        "() => { const s = document.querySelector('.score-container');"
+                        " return !s || s.textContent.trim() === '0'; }",
+                        timeout=2000
+                    )
+                except Exception:
+                    print("⚠️  Score did not reset within 2s")
                 return True
             else:
                 print("❌ Reset button not found")
@@ -286,6 +325,32 @@ class PlaywrightController:
             print(f"❌ Reset failed: {str(e)}")
             return False
 
+    def wait_for_board_stable(self, timeout: float = 2.0) -> bool:
+        """
+        Wait until tile animations on the board have finished
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if the board settled before the timeout
+        """
+        if not self.is_connected or not self.page:
+            print("❌ Not connected to browser")
+            return False
+
+        try:
+            self.page.wait_for_function(
+                BOARD_STABLE_JS,
+                timeout=timeout * 1000,
+                polling="raf"
+            )
+            return True
+
+        except Exception as e:
+            print(f"⚠️  Board did not settle: {str(e)}")
+            return False
+
     def get_game_info(self) -> Dict[str, Any]:
         """
         Get current game information
@@ -321,18 +386,28 @@ class PlaywrightController:
 
     def cleanup(self):
         """Clean up browser resources"""
+        self.flush_writes()
+        if self._write_pool is not None:
+            self._write_pool.shutdown()
+            self._write_pool = None
+
         try:
             if self.page:
                 self.page.close()
-            if self.browser:
+            if self.context:
+                # Pooled browser keeps running for the next controller
+                release_context(self.context)
+            elif self.browser:
                 self.browser.close()
             if self.playwright:
                 self.playwright.stop()
 
             self.page = None
+            self.context = None
             self.browser = None
             self.playwright = None
             self.is_connected = False
+            self._board_box = None
 
             print("🧹 Browser cleanup completed")
 
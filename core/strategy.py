@@ -9,10 +9,54 @@ Focuses on proven fundamentals:
 - Monotonic sequence building
 """
 
-import copy
+from pathlib import Path
 from typing import List, Dict, Tuple, Optional
 from enum import Enum
 import logging
+import numpy as np
+
+from .strategy_kernels import COMPILED_KERNELS, board_features_kernel, move_features_kernel
+
+# Marks an unused transposition table slot (would be a board of sixteen 32768 tiles)
+_TT_EMPTY = np.uint64(0xFFFFFFFFFFFFFFFF)
+
+# Order of get_move_scores() results
+DIRECTIONS = ("UP", "DOWN", "LEFT", "RIGHT")
+
+# Index pairs (i < j) within a row or column, for the vectorized monotonicity check
+_PAIR_I, _PAIR_J = np.triu_indices(4, 1)
+_CORNER_ROWS = [0, 0, 3, 3]
+_CORNER_COLS = [0, 3, 0, 3]
+
+def board_features_batch(boards) -> np.ndarray:
+    """
+    Heuristic features of many boards at once, matching BasicStrategy's helpers
+
+    Args:
+        boards: Boards as a (N, 4, 4) array or a list of 4x4 lists
+
+    Returns:
+        (N, 5) float array of (empty tiles, merge potential, corner, monotonicity, max tile)
+    """
+    a = np.asarray(boards, dtype=np.int64).reshape(-1, 4, 4)
+    nonzero = a != 0
+
+    empty = (~nonzero).sum(axis=(1, 2))
+    max_tile = a.max(axis=(1, 2))
+    merges = (((a[:, :, :-1] == a[:, :, 1:]) & nonzero[:, :, :-1]).sum(axis=(1, 2))
+              + ((a[:, :-1, :] == a[:, 1:, :]) & nonzero[:, :-1, :]).sum(axis=(1, 2)))
+    corner = (a[:, _CORNER_ROWS, _CORNER_COLS] == max_tile[:, None]).any(axis=1) & (max_tile > 0)
+
+    # Rows then columns; a line's non-zero tiles are sorted iff every non-zero pair is ordered
+    lines = np.concatenate((a, a.transpose(0, 2, 1)), axis=1)
+    first, second = lines[:, :, _PAIR_I], lines[:, :, _PAIR_J]
+    unordered = (first == 0) | (second == 0)
+    descending = (unordered | (first >= second)).all(axis=2)
+    ascending = (unordered | (first <= second)).all(axis=2)
+    counted = (lines != 0).sum(axis=2) > 1
+    monotonic = np.where(counted, np.where(descending, 1.0, np.where(ascending, 0.5, 0.0)), 0.0).sum(axis=1)
+
+    return np.column_stack((empty, merges, corner, monotonic, max_tile)).astype(np.float64)
 
 class Move(Enum):
     """Valid 2048 moves"""
@@ -27,10 +71,21 @@ class BasicStrategy:
     Uses proven fundamentals with clear, testable scoring
     """
 
-    def __init__(self, debug_mode: bool = False):
+    def __init__(self, debug_mode: bool = False, tt_bits: int = 16):
+        """
+        Args:
+            debug_mode: Log the breakdown of every board evaluation
+            tt_bits: Transposition table holds 2**tt_bits board entries
+        """
         self.debug_mode = debug_mode
         self.logger = logging.getLogger(__name__)
 
+        # Transposition table of board features, keyed by the packed board.
+        # Features do not depend on the weights, so re-weighting keeps it valid.
+        self._tt_mask = (1 << tt_bits) - 1
+        self._tt_keys = np.full(1 << tt_bits, _TT_EMPTY, dtype=np.uint64)
+        self._tt_features = np.zeros((1 << tt_bits, 5), dtype=np.float64)
+
         # Optimized heuristic weights (tuned for maximum performance)
         self.weights = {
             'empty_tiles': 150.0,      # +50% empty space focus
@@ -48,33 +103,146 @@ class BasicStrategy:
         if not self._is_valid_board(board):
             return -1000.0  # Invalid board
 
-        score = 0.0
+        return self._score_features(self._board_features(board))
 
-        # Count empty tiles
-        empty_count = self._count_empty_tiles(board)
-        score += empty_count * self.weights['empty_tiles']
+    def _score_features(self, features: Tuple[float, float, float, float, float]) -> float:
+        """Weighted sum of board features (see _board_features)"""
+        empty_count, merge_score, corner_score, monotonic_score, max_tile = features
 
-        # Evaluate merge potential
-        merge_score = self._evaluate_merge_potential(board)
+        score = 0.0
+        score += empty_count * self.weights['empty_tiles']
         score += merge_score * self.weights['merge_potential']
-
-        # Corner bonus (prefer highest tile in corner)
-        corner_score = self._evaluate_corner_strategy(board)
         score += corner_score * self.weights['corner_bonus']
-
-        # Monotonicity bonus
-        monotonic_score = self._evaluate_monotonicity(board)
         score += monotonic_score * self.weights['monotonicity']
-
-        # Max tile bonus
-        max_tile = self._get_max_tile(board)
         score += max_tile * self.weights['max_tile_value']
 
         if self.debug_mode:
-            self.logger.info(f"Board evaluation: empty={empty_count}, merge={merge_score:.1f}, corner={corner_score:.1f}, mono={monotonic_score:.1f}, max={max_tile}, total={score:.1f}")
+            self.logger.info(f"Board evaluation: empty={empty_count:.0f}, merge={merge_score:.1f}, corner={corner_score:.1f}, mono={monotonic_score:.1f}, max={max_tile:.0f}, total={score:.1f}")
 
         return score
 
+    def _board_features(self, board: List[List[int]]) -> Tuple[float, float, float, float, float]:
+        """
+        Heuristic features of a board, served from the transposition table when possible
+        Returns (empty tiles, merge potential, corner, monotonicity, max tile)
+        """
+        key = self._board_key(board)
+        if key is not None:
+            cached = self._tt_lookup(key)
+            if cached is not None:
+                return cached
+
+        if key is not None and COMPILED_KERNELS:
+            # Packable boards fit int32, so the compiled kernel can take them
+            features = tuple(board_features_kernel(np.array(board, dtype=np.int32)).tolist())
+            self._tt_store(key, features)
+            return features
+
+        features = (
+            float(self._count_empty_tiles(board)),
+            self._evaluate_merge_potential(board),
+            self._evaluate_corner_strategy(board),
+            self._evaluate_monotonicity(board),
+            float(self._get_max_tile(board))
+        )
+
+        if key is not None:
+            self._tt_store(key, features)
+        return features
+
+    def _tt_lookup(self, key: int) -> Optional[Tuple[float, float, float, float, float]]:
+        """Two-probe lookup: low bits, then high bits of the key"""
+        for slot in (key & self._tt_mask, (key >> 32) & self._tt_mask):
+            if int(self._tt_keys[slot]) == key:
+                return tuple(self._tt_features[slot].tolist())
+        return None
+
+    def _tt_store(self, key: int, features) -> None:
+        """Store features, preferring a free slot and otherwise replacing the first probe"""
+        first, second = key & self._tt_mask, (key >> 32) & self._tt_mask
+        first_used = self._tt_keys[first] != _TT_EMPTY
+        slot = second if first_used and self._tt_keys[second] == _TT_EMPTY else first
+        self._tt_keys[slot] = key
+        self._tt_features[slot] = features
+
+    def evaluate_boards(self, boards: List[List[List[int]]]) -> List[float]:
+        """
+        Evaluate many boards in one pass (same scores as evaluate_board)
+        Transposition table misses are featurized together with NumPy.
+        """
+        features: List[Optional[Tuple[float, ...]]] = [None] * len(boards)
+        misses = []
+        keys = []
+
+        for i, board in enumerate(boards):
+            if not self._is_valid_board(board):
+                continue
+            key = self._board_key(board)
+            cached = self._tt_lookup(key) if key is not None else None
+            if cached is None:
+                misses.append(i)
+                keys.append(key)
+            else:
+                features[i] = cached
+
+        if misses:
+            batch = board_features_batch([boards[i] for i in misses])
+            for i, key, row in zip(misses, keys, batch):
+                features[i] = tuple(row.tolist())
+                if key is not None:
+                    self._tt_store(key, row)
+
+        scores = []
+        for board_features in features:
+            if board_features is None:
+                scores.append(-1000.0)  # Invalid board
+            else:
+                scores.append(self._score_features(board_features))
+        return scores
+
+    @staticmethod
+    def _board_key(board: List[List[int]]) -> Optional[int]:
+        """Pack the board into 64 bits (4-bit log2 per tile); None if it cannot be packed"""
+        key = 0
+        for row in board:
+            for tile in row:
+                if tile & (tile - 1):
+                    return None  # Not a power of two
+                exponent = tile.bit_length() - 1 if tile else 0
+                if exponent > 15:
+                    return None
+                key = (key << 4) | exponent
+        return key
+
+    def load_tt(self, path: str) -> bool:
+        """
+        Warm the transposition table from a file written by save_tt()
+
+        Returns:
+            True if the table was loaded
+        """
+        if not Path(path).exists():
+            return False
+        try:
+            with np.load(path) as data:
+                keys, features = data['keys'], data['features']
+        except (OSError, ValueError, KeyError) as e:
+            self.logger.warning(f"Could not load transposition table {path}: {e}")
+            return False
+
+        if keys.shape != self._tt_keys.shape or features.shape != self._tt_features.shape:
+            self.logger.warning(f"Transposition table {path} has a different size, ignoring it")
+            return False
+
+        self._tt_keys[:] = keys
+        self._tt_features[:] = features
+        return True
+
+    def save_tt(self, path: str):
+        """Persist the transposition table so later runs start warm"""
+        with open(path, 'wb') as f:
+            np.savez(f, keys=self._tt_keys, features=self._tt_features)
+
     def get_best_move(self, board: List[List[int]]) -> Tuple[Move, Dict]:
         """
         Determine best move for given board state
@@ -96,14 +264,15 @@ class BasicStrategy:
                 move_scores[move] = -999.0
                 move_analysis[move] = {"possible": False, "reason": "No tiles can move"}
             else:
-                # Evaluate resulting board
-                score = self.evaluate_board(new_board)
+                # Evaluate resulting board; the empty count comes from the same features
+                features = self._board_features(new_board)
+                score = self._score_features(features)
                 move_scores[move] = score
                 move_analysis[move] = {
                     "possible": True,
                     "score": score,
                     "resulting_board": new_board,
-                    "empty_tiles": self._count_empty_tiles(new_board)
+                    "empty_tiles": int(features[0])
                 }
 
         # Find best move
@@ -128,12 +297,17 @@ class BasicStrategy:
         if not self._is_valid_board(board):
             return [-999.0, -999.0, -999.0, -999.0]
 
-        directions = ["UP", "DOWN", "LEFT", "RIGHT"]
+        if COMPILED_KERNELS and self._get_max_tile(board) < (1 << 30):
+            # All four slides and their features in one compiled call; tiles below
+            # 2**30 keep every merged tile within int32
+            moved, features = move_features_kernel(np.array(board, dtype=np.int32))
+            return [self._score_features(tuple(features[i].tolist())) if moved[i] else -999.0
+                    for i in range(4)]
+
         scores = []
 
-        for move_str in directions:
-            move_enum = Move(move_str)
-            new_board = self._simulate_move(board, move_enum)
+        for move_str in DIRECTIONS:
+            new_board = self._simulate_move(board, Move(move_str))
 
             if new_board is not None:
                 # Move is valid - evaluate the resulting board using full heuristics
@@ -150,19 +324,20 @@ class BasicStrategy:
         Recommend best move (interface expected by complete bot)
         Returns move as string: "UP", "DOWN", "LEFT", "RIGHT"
         """
-        scores = self.get_move_scores(board)
-        directions = ["UP", "DOWN", "LEFT", "RIGHT"]
+        return self.recommend_from_scores(self.get_move_scores(board))
 
-        # Find index of highest scoring move
-        best_index = max(range(len(scores)), key=lambda i: scores[i])
-        return directions[best_index]
+    def recommend_from_scores(self, scores: List[float]) -> str:
+        """Best move for scores already returned by get_move_scores()"""
+        # Find index of highest scoring move (first one on ties)
+        best_index = max(range(len(scores)), key=scores.__getitem__)
+        return DIRECTIONS[best_index]
 
     def _simulate_move(self, board: List[List[int]], move: Move) -> Optional[List[List[int]]]:
         """
         Simulate a move and return resulting board state
         Returns None if move is not possible
         """
-        new_board = copy.deepcopy(board)
+        new_board = [list(row) for row in board]  # Rows hold ints, so a shallow row copy suffices
         moved = False
 
         if move == Move.LEFT:
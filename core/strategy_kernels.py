@@ -0,0 +1,218 @@
+"""
+Strategy Kernels
+Compiled board heuristics for BasicStrategy, with a plain Python fallback
+
+A Cython build of the same kernels (core/_strategy_cy.pyx) is preferred when
+it has been compiled, then Numba; with neither, BasicStrategy keeps its
+list-based helpers.
+"""
+
+import numpy as np
+from typing import Optional
+
+# Numba is optional
+try:
+    from numba import njit, boolean, float64, int32, int64, types
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# The Cython extension exists only after: cythonize -i core/_strategy_cy.pyx
+try:
+    from . import _strategy_cy
+    CYTHON_AVAILABLE = True
+except ImportError:
+    CYTHON_AVAILABLE = False
+
+COMPILED_KERNELS = CYTHON_AVAILABLE or NUMBA_AVAILABLE
+
+def _board_features_loops(a):
+    """
+    Heuristic features of one 4x4 board, written as plain loops for Numba
+
+    Args:
+        a: Board as an int32 array of shape (4, 4)
+
+    Returns:
+        float64 array of (empty tiles, merge potential, corner, monotonicity, max tile)
+    """
+    empty = 0
+    merges = 0
+    max_tile = 0
+    for i in range(4):
+        for j in range(4):
+            v = a[i, j]
+            if v == 0:
+                empty += 1
+            if v > max_tile:
+                max_tile = v
+            if j < 3 and v != 0 and v == a[i, j + 1]:
+                merges += 1
+            if i < 3 and v != 0 and v == a[i + 1, j]:
+                merges += 1
+
+    corner = 0.0
+    if max_tile != 0 and (a[0, 0] == max_tile or a[0, 3] == max_tile
+                          or a[3, 0] == max_tile or a[3, 3] == max_tile):
+        corner = 1.0
+
+    # Rows (axis 0) then columns (axis 1): compare consecutive non-zero tiles
+    monotonic = 0.0
+    for axis in range(2):
+        for line in range(4):
+            count = 0
+            previous = 0
+            descending = True
+            ascending = True
+            for k in range(4):
+                v = a[line, k] if axis == 0 else a[k, line]
+                if v == 0:
+                    continue
+                if count > 0:
+                    if v > previous:
+                        descending = False
+                    if v < previous:
+                        ascending = False
+                previous = v
+                count += 1
+            if count > 1:
+                if descending:
+                    monotonic += 1.0
+                elif ascending:
+                    monotonic += 0.5
+
+    features = np.empty(5, dtype=np.float64)
+    features[0] = empty
+    features[1] = merges
+    features[2] = corner
+    features[3] = monotonic
+    features[4] = max_tile
+    return features
+
+if NUMBA_AVAILABLE:
+    # Fixed signature: compiled once at import and cached on disk afterwards
+    _board_features_nb = njit(float64[:](int32[:, :]), cache=True)(_board_features_loops)
+else:
+    _board_features_nb = _board_features_loops
+
+def _slide_loops(a, direction, result):
+    """
+    Slide and merge the board in one direction, written as plain loops for Numba
+
+    Every direction is the same slide-and-merge, reading each row or column
+    from the edge the tiles move towards.
+
+    Args:
+        a: Board as an int32 array of shape (4, 4)
+        direction: Index into UP, DOWN, LEFT, RIGHT
+        result: int32 (4, 4) array that receives the new board
+
+    Returns:
+        True if any tile moved
+    """
+    tiles = np.empty(4, dtype=np.int32)
+    merged = np.empty(4, dtype=np.int32)
+    moved = False
+
+    for line in range(4):
+        # Gather the line's tiles, nearest to the target edge first
+        count = 0
+        for k in range(4):
+            if direction == 0:
+                v = a[k, line]
+            elif direction == 1:
+                v = a[3 - k, line]
+            elif direction == 2:
+                v = a[line, k]
+            else:
+                v = a[line, 3 - k]
+            if v != 0:
+                tiles[count] = v
+                count += 1
+
+        # Merge adjacent equal tiles, then pad with zeros
+        size = 0
+        i = 0
+        while i < count:
+            if i + 1 < count and tiles[i] == tiles[i + 1]:
+                merged[size] = tiles[i] * 2
+                i += 2
+            else:
+                merged[size] = tiles[i]
+                i += 1
+            size += 1
+        for k in range(size, 4):
+            merged[k] = 0
+
+        for k in range(4):
+            if direction == 0:
+                r, c = k, line
+            elif direction == 1:
+                r, c = 3 - k, line
+            elif direction == 2:
+                r, c = line, k
+            else:
+                r, c = line, 3 - k
+            result[r, c] = merged[k]
+            if merged[k] != a[r, c]:
+                moved = True
+
+    return moved
+
+if NUMBA_AVAILABLE:
+    _slide_nb = njit(boolean(int32[:, :], int64, int32[:, :]), cache=True)(_slide_loops)
+else:
+    _slide_nb = _slide_loops
+
+def _move_features_loops(a):
+    """
+    Slide the board in all four directions and featurize each result in one pass
+
+    Args:
+        a: Board as an int32 array of shape (4, 4)
+
+    Returns:
+        Tuple of (moved flags, (4, 5) features) in the order UP, DOWN, LEFT, RIGHT;
+        features of a direction that does not move are left at zero
+    """
+    moved = np.zeros(4, dtype=np.bool_)
+    features = np.zeros((4, 5), dtype=np.float64)
+    result = np.empty((4, 4), dtype=np.int32)
+
+    for direction in range(4):
+        if _slide_nb(a, direction, result):
+            moved[direction] = True
+            features[direction, :] = _board_features_nb(result)
+
+    return moved, features
+
+if CYTHON_AVAILABLE:
+    board_features_kernel = _strategy_cy.board_features_kernel
+    move_features_kernel = _strategy_cy.move_features_kernel
+    slide_kernel = _strategy_cy.slide_kernel
+elif NUMBA_AVAILABLE:
+    board_features_kernel = _board_features_nb
+    move_features_kernel = njit(types.Tuple((boolean[:], float64[:, :]))(int32[:, :]),
+                                cache=True)(_move_features_loops)
+    slide_kernel = _slide_nb
+else:
+    board_features_kernel = _board_features_loops
+    move_features_kernel = _move_features_loops
+    slide_kernel = _slide_loops
+
+def simulate_move(board, direction: int) -> Optional[np.ndarray]:
+    """
+    Simulate one move with the compiled slide kernel
+
+    Args:
+        board: 4x4 board (nested lists or array) with tiles below 2**30,
+               so merged tiles stay within int32
+        direction: Index into UP, DOWN, LEFT, RIGHT
+
+    Returns:
+        New board as an int32 (4, 4) array, or None if the move is not possible
+    """
+    # Allocation stays here so the kernel itself is loops only
+    a = np.ascontiguousarray(board, dtype=np.int32)
+    result = np.empty((4, 4), dtype=np.int32)
+    return result if slide_kernel(a, direction, result) else None
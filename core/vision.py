@@ -313,6 +313,9 @@ class BoardVision:
             'grid_extracted': False,
             'board_state': [[0 for _ in range(4)] for _ in range(4)],
             'confidence_scores': [[0.0 for _ in range(4)] for _ in range(4)],
+            # Same values as contiguous arrays for vectorized consumers
+            'board_array': np.zeros((4, 4), dtype=np.int32),
+            'confidence_array': np.zeros((4, 4), dtype=np.float32),
             'board_region': None,
             'debug_info': {}
         }
@@ -342,6 +345,8 @@ class BoardVision:
             results['grid_extracted'] = True
 
             # Step 4: Recognize each tile
+            board_array = results['board_array']
+            confidence_array = np.zeros((4, 4), dtype=np.float64)
             for row in range(4):
                 for col in range(4):
                     tile_region = grid[row][col]
@@ -349,13 +354,18 @@ class BoardVision:
 
                     if tile_image is not None:
                         tile_value = self.recognize_tile_value(tile_image)
-                        results['board_state'][row][col] = tile_value
+                        board_array[row, col] = tile_value
 
                         # Basic confidence scoring
                         if tile_value > 0:
-                            results['confidence_scores'][row][col] = 0.8  # Medium confidence
+                            confidence_array[row, col] = 0.8  # Medium confidence
                         else:
-                            results['confidence_scores'][row][col] = 0.9  # High confidence for empty
+                            confidence_array[row, col] = 0.9  # High confidence for empty
+
+            # Nested lists for existing consumers (JSON reports, strategy input)
+            results['board_state'] = board_array.tolist()
+            results['confidence_scores'] = confidence_array.tolist()
+            results['confidence_array'] = confidence_array.astype(np.float32)
 
             results['success'] = True
 
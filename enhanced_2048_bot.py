@@ -10,12 +10,14 @@ import time
 import cv2
 import numpy as np
 import logging
+from typing import Optional
 
 # Add project root to path
 sys.path.append(str(Path(__file__).parent))
 
 from core.playwright_controller import PlaywrightController
 from core.canonical_vision import CanonicalBoardVision
+from core.strategy import DIRECTIONS
 from production.error_handler import ProductionErrorHandler, RobustConnectionManager, error_handler
 from algorithms import AlgorithmManager, BaseAlgorithm
 
@@ -27,7 +29,8 @@ class Enhanced2048Bot:
     """
 
     def __init__(self, headless: bool = False, debug: bool = True, log_level: str = "INFO",
-                 algorithm_id: str = None):
+                 algorithm_id: str = None, screenshot_dir: str = None,
+                 controller: Optional[PlaywrightController] = None):
         """
         Initialize enhanced bot with algorithm selection
 
@@ -36,8 +39,14 @@ class Enhanced2048Bot:
             debug: Enable debug output and screenshots
             log_level: Logging level for error handling
             algorithm_id: Specific algorithm to use (if None, uses default)
+            screenshot_dir: Directory for move screenshots (default: current directory);
+                            give concurrent bots separate directories
+            controller: Existing controller to drive instead of launching a browser;
+                        the caller keeps ownership and cleans it up
         """
         self.debug = debug
+        self.screenshot_dir = Path(screenshot_dir) if screenshot_dir else Path(".")
+        self.screenshot_dir.mkdir(parents=True, exist_ok=True)
 
         # Initialize production error handling
         self.error_handler = ProductionErrorHandler(
@@ -47,8 +56,9 @@ class Enhanced2048Bot:
         self.connection_manager = RobustConnectionManager(self.error_handler)
 
         # Initialize core systems
+        self._owns_controller = controller is None
         try:
-            self.controller = PlaywrightController(
+            self.controller = controller or PlaywrightController(
                 headless=headless,
                 browser_type="chromium",
                 block_ads=True
@@ -173,9 +183,19 @@ class Enhanced2048Bot:
         else:
             self.error_handler.logger.warning("⚠️ No algorithms available")
 
+    def _screenshot_path(self, filename: str) -> str:
+        """Path for a screenshot file inside this bot's screenshot directory"""
+        return str(self.screenshot_dir / filename)
+
     @error_handler("Game connection", max_retries=2)
     def connect_to_game(self, url: str = "https://2048game.com/") -> bool:
         """Connect to 2048 game with robust error handling"""
+        if not self._owns_controller and self.controller.is_connected:
+            # A shared controller is already on the game page
+            self.error_handler.logger.info("♻️ Reusing the connected browser")
+            self._wait_for_initial_tiles()
+            return True
+
         self.error_handler.logger.info(f"🌐 Connecting to {url}...")
 
         # Use robust connection manager for fallback URLs
@@ -188,24 +208,52 @@ class Enhanced2048Bot:
             self.error_handler.logger.info("✅ Connected successfully!")
 
             # Wait for game to fully load and initial tiles to appear
-            for attempt in range(10):
-                time.sleep(1)
-                try:
-                    screenshot = self.controller.take_screenshot("init_check.png")
-                    if screenshot is not None:
-                        result = self.vision.analyze_board(screenshot)
-                        if result['success'] and np.sum(result['board_state']) > 0:
-                            self.error_handler.logger.info(f"✅ Game initialized! Found tiles after {attempt + 1} seconds")
-                            return True
-                except Exception as e:
-                    self.error_handler.handle_error(e, f"Game initialization check (attempt {attempt + 1})")
-
-            self.error_handler.logger.warning("⚠️ Game may not have initialized properly, proceeding anyway...")
+            self._wait_for_initial_tiles()
             return True
         else:
             self.error_handler.logger.error("❌ All connection attempts failed!")
             return False
 
+    def _wait_for_initial_tiles(self, max_wait: int = 10) -> bool:
+        """Wait for the game to load until vision finds the starting tiles"""
+        for attempt in range(max_wait):  # One check per second
+            time.sleep(1)
+            try:
+                screenshot = self.controller.take_screenshot(self._screenshot_path("init_check.png"))
+                if screenshot is not None:
+                    result = self.vision.analyze_board(screenshot)
+                    if result['success'] and np.sum(result['board_state']) > 0:
+                        self.error_handler.logger.info(f"✅ Game initialized! Found tiles after {attempt + 1} seconds")
+                        return True
+            except Exception as e:
+                self.error_handler.handle_error(e, f"Game initialization check (attempt {attempt + 1})")
+
+        self.error_handler.logger.warning("⚠️ Game may not have initialized properly, proceeding anyway...")
+        return False
+
+    @error_handler("Game reset", max_retries=1)
+    def reset_for_new_game(self) -> bool:
+        """
+        Start a new game in the already running browser
+
+        Reloads the game page and clears per-game statistics, keeping the
+        Playwright browser and the selected algorithm. Connects first if no
+        browser is running.
+        """
+        self.move_count = 0
+        self.score = 0
+        self.max_tile = 0
+        self.game_history = []
+        self.consecutive_failures = 0
+
+        if not self.controller.is_connected:
+            return self.connect_to_game()
+
+        self.error_handler.logger.info("🔄 Reloading game for a new round...")
+        self.controller.page.goto(self.controller.page.url, timeout=60000)
+        self._wait_for_initial_tiles()
+        return True
+
     @error_handler("Board analysis", max_retries=2)
     def analyze_current_state(self) -> dict:
         """Analyze current game state using computer vision"""
@@ -213,7 +261,7 @@ class Enhanced2048Bot:
             print("\n👁️  Analyzing game state...")
 
         # Take screenshot
-        screenshot = self.controller.take_screenshot(f"bot_move_{self.move_count:03d}_before.png")
+        screenshot = self.controller.take_screenshot(self._screenshot_path(f"bot_move_{self.move_count:03d}_before.png"))
         if screenshot is None:
             if self.debug:
                 print("❌ Screenshot failed!")
@@ -253,10 +301,9 @@ class Enhanced2048Bot:
                 # Get detailed scores if available
                 try:
                     scores = self.current_algorithm.get_move_scores(board_state)
-                    directions = ["UP", "DOWN", "LEFT", "RIGHT"]
                     print("   Move scores:")
-                    for i, direction in enumerate(directions):
-                        print(f"     {direction}: {scores[i]:.1f}")
+                    for direction, score in zip(DIRECTIONS, scores):
+                        print(f"     {direction}: {score:.1f}")
                 except Exception:
                     pass
 
@@ -304,7 +351,7 @@ class Enhanced2048Bot:
                 time.sleep(0.5)
 
                 # Take after screenshot and analyze
-                self.controller.take_screenshot(f"bot_move_{self.move_count:03d}_after.png")
+                self.controller.take_screenshot(self._screenshot_path(f"bot_move_{self.move_count:03d}_after.png"))
                 self.move_count += 1
                 moves_completed += 1
 
@@ -390,7 +437,10 @@ class Enhanced2048Bot:
             self.error_handler.logger.info("🧹 Starting bot cleanup...")
 
             if hasattr(self, 'controller'):
-                self.controller.cleanup()
+                if self._owns_controller:
+                    self.controller.cleanup()
+                else:
+                    self.controller.flush_writes()  # Finish writes before removing the files
 
             # Save algorithm performance data
             if hasattr(self, 'algorithm_manager'):
@@ -399,7 +449,7 @@ class Enhanced2048Bot:
                 self.algorithm_manager.save_performance_data(performance_file)
 
             # Clean up temporary files (but keep logs)
-            temp_files = Path(".").glob("bot_move_*.png")
+            temp_files = self.screenshot_dir.glob("bot_move_*.png")
             cleaned_count = 0
             for temp_file in temp_files:
                 try:
@@ -17,6 +17,7 @@ from typing import Optional, Dict, Any
 sys.path.append(str(Path(__file__).parent))
 
 from enhanced_2048_bot import Enhanced2048Bot
+from core.playwright_controller import PlaywrightController
 from gui import DebugInterface, GUIConfig
 from gui.bot_controls import BotState
 from core.screenshot_manager import screenshot_manager
@@ -29,7 +30,8 @@ class GUIEnhanced2048Bot(Enhanced2048Bot):
     """
 
     def __init__(self, headless: bool = False, debug: bool = True, log_level: str = "INFO",
-                 algorithm_id: str = None, gui_enabled: bool = False):
+                 algorithm_id: str = None, gui_enabled: bool = False,
+                 controller: Optional[PlaywrightController] = None):
         """
         Initialize GUI-enhanced bot
 
@@ -39,13 +41,14 @@ class GUIEnhanced2048Bot(Enhanced2048Bot):
             log_level: Logging level
             algorithm_id: Algorithm to use
             gui_enabled: Enable debug GUI interface
+            controller: Existing controller to drive (see Enhanced2048Bot)
         """
         # Force non-headless when GUI is enabled
         if gui_enabled:
             headless = False
 
         super().__init__(headless=headless, debug=debug, log_level=log_level,
-                        algorithm_id=algorithm_id)
+                        algorithm_id=algorithm_id, controller=controller)
 
         # GUI components
         self.gui_enabled = gui_enabled
@@ -101,6 +104,7 @@ class GUIEnhanced2048Bot(Enhanced2048Bot):
 
         # Save to organized screenshot system
         if filename:
+            self.controller.flush_writes()  # The file is copied from disk below
             # Extract move number and type from filename
             import re
             match = re.search(r'bot_move_(\d+)_(\w+)', filename)
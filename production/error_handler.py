@@ -4,13 +4,37 @@ Production Error Handler for 2048 Bot
 Comprehensive error handling, logging, and recovery mechanisms
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import traceback
 import time
 from typing import Optional, Dict, Any, Callable
 from functools import wraps
 from pathlib import Path
 
+# tenacity is optional; retry_on_failure falls back to a plain loop with the same policy
+try:
+    from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type, retry_if_result
+    TENACITY_AVAILABLE = True
+except ImportError:
+    TENACITY_AVAILABLE = False
+
+# Background listener that formats and writes log records off the calling thread
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+def _stop_log_listener():
+    """Flush pending records and stop the background log listener"""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        for handler in _log_listener.handlers:
+            handler.close()
+        _log_listener = None
+
+atexit.register(_stop_log_listener)
+
 class ProductionErrorHandler:
     """Comprehensive error handling for production deployment"""
 
@@ -32,11 +56,14 @@ class ProductionErrorHandler:
 
     def _setup_logging(self, level: str) -> logging.Logger:
         """Setup comprehensive logging system"""
+        global _log_listener
+
         logger = logging.getLogger("2048_bot")
         logger.setLevel(getattr(logging, level.upper()))
 
-        # Clear existing handlers
+        # Clear existing handlers and drain the previous listener
         logger.handlers.clear()
+        _stop_log_listener()
 
         # Console handler
         console_handler = logging.StreamHandler()
@@ -45,7 +72,6 @@ class ProductionErrorHandler:
             datefmt='%H:%M:%S'
         )
         console_handler.setFormatter(console_formatter)
-        logger.addHandler(console_handler)
 
         # File handler for errors
         log_dir = Path("logs")
@@ -58,7 +84,15 @@ class ProductionErrorHandler:
             '%(asctime)s | %(levelname)s | %(funcName)s:%(lineno)d | %(message)s'
         )
         file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+
+        # Only the queue handler runs on the caller's thread; console and
+        # file output are handled by the listener thread
+        log_queue = queue.SimpleQueue()
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        _log_listener = logging.handlers.QueueListener(
+            log_queue, console_handler, file_handler, respect_handler_level=True
+        )
+        _log_listener.start()
 
         return logger
 
@@ -182,6 +216,46 @@ def error_handler(operation: str, recovery_func: Optional[Callable] = None,
         return wrapper
     return decorator
 
+def _backoff_delay(attempt: int, multiplier: float, max_wait: float) -> float:
+    """Exponential backoff delay in seconds after the given zero-based attempt"""
+    return min(max_wait, multiplier * 2 ** attempt)
+
+def retry_on_failure(func: Callable, attempts: int = 3, multiplier: float = 0.2,
+                     max_wait: float = 2.0) -> Callable:
+    """
+    Wrap a call so it is retried with exponential backoff when it raises or returns a falsy value
+
+    Args:
+        func: Callable to retry, e.g. a bound connect method
+        attempts: Maximum number of calls
+        multiplier: First backoff delay in seconds, doubled per attempt
+        max_wait: Upper bound on a single backoff delay
+
+    Returns:
+        Wrapped callable giving the last attempt's result, or re-raising its exception
+    """
+    if TENACITY_AVAILABLE:
+        return retry(
+            stop=stop_after_attempt(attempts),
+            wait=wait_exponential(multiplier=multiplier, max=max_wait),
+            retry=retry_if_exception_type() | retry_if_result(lambda result: not result),
+            retry_error_callback=lambda state: state.outcome.result()
+        )(func)
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        for attempt in range(attempts):
+            last_attempt = attempt == attempts - 1
+            try:
+                result = func(*args, **kwargs)
+                if result or last_attempt:
+                    return result
+            except Exception:
+                if last_attempt:
+                    raise
+            time.sleep(_backoff_delay(attempt, multiplier, max_wait))
+    return wrapper
+
 class RobustConnectionManager:
     """Manages robust connections with automatic retry and fallback"""
 
@@ -228,7 +302,7 @@ class RobustConnectionManager:
                     self.error_handler.handle_error(e, f"Connection to {url}", max_retries=1)
 
                 if attempt < max_attempts - 1:
-                    time.sleep(2)  # Wait between attempts
+                    time.sleep(_backoff_delay(attempt, 0.2, 2.0))  # Back off between attempts
 
         self.error_handler.logger.error("❌ All connection attempts failed")
         return False
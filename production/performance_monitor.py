@@ -7,14 +7,37 @@ Real-time monitoring of resource usage, performance metrics, and optimization
 import time
 import psutil
 import os
+import sys
+import select
 import threading
-from typing import Dict, List, Optional, Callable
-from dataclasses import dataclass, asdict
+import numpy as np
+from collections import deque
+from typing import Deque, Dict, List, Optional, Callable, Tuple
+from dataclasses import dataclass, fields
 from pathlib import Path
 import json
 import logging
 
-@dataclass
+from .performance_monitor_kernels import window_means
+
+# orjson is optional; fall back to the stdlib encoder when it is missing
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# prometheus_client is optional; only needed for enable_prometheus()
+try:
+    from prometheus_client import CollectorRegistry, Gauge, start_http_server
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+
+# Slotted dataclasses need Python 3.10+
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_OPTIONS)
 class PerformanceMetrics:
     """Performance metrics snapshot"""
     timestamp: float
@@ -35,23 +58,112 @@ class PerformanceMetrics:
     analysis_time: float = 0.0
     strategy_time: float = 0.0
 
+# Field names in declaration order, for building plain dicts without asdict()
+_FIELD_NAMES = tuple(f.name for f in fields(PerformanceMetrics))
+
+def _metrics_to_dict(metrics: PerformanceMetrics) -> Dict:
+    """Shallow dict of a metrics snapshot (all fields are scalars)"""
+    return {name: getattr(metrics, name) for name in _FIELD_NAMES}
+
+# Column dtypes for the metrics history ring buffer (one array per field)
+_COLUMN_DTYPES = {
+    'timestamp': np.float64,
+    'cpu_percent': np.float32,
+    'memory_mb': np.float32,
+    'memory_percent': np.float32,
+    'disk_io_read': np.int64,
+    'disk_io_write': np.int64,
+    'network_sent': np.int64,
+    'network_recv': np.int64,
+    'move_count': np.int64,
+    'game_score': np.int64,
+    'efficiency': np.float32,
+    'fps': np.float32,
+    'screenshot_time': np.float32,
+    'analysis_time': np.float32,
+    'strategy_time': np.float32,
+}
+
+# Fields reported by get_average_metrics (stored together as one 2-D block)
+_AVERAGE_FIELDS = (
+    'cpu_percent', 'memory_mb', 'memory_percent', 'efficiency',
+    'fps', 'screenshot_time', 'analysis_time', 'strategy_time'
+)
+
+# Upper-bound threshold alerts as (metric, message format)
+_UPPER_ALERTS = (
+    ('cpu_percent', "High CPU usage: {:.1f}%"),
+    ('memory_mb', "High memory usage: {:.1f} MB"),
+    ('memory_percent', "High memory percentage: {:.1f}%"),
+    ('screenshot_time', "Slow screenshot: {:.2f}s"),
+    ('analysis_time', "Slow analysis: {:.2f}s"),
+    ('strategy_time', "Slow strategy: {:.2f}s"),
+)
+_UPPER_ALERT_NAMES = tuple(name for name, _ in _UPPER_ALERTS)
+
+# Metrics published as Prometheus gauges (named bot_<metric>)
+_GAUGE_DESCRIPTIONS = {
+    'cpu_percent': "Bot process CPU usage (%)",
+    'memory_mb': "Bot resident memory (MB)",
+    'memory_percent': "Bot resident memory (% of system)",
+    'move_count': "Moves played in the current game",
+    'game_score': "Current game score",
+    'efficiency': "Points per move",
+    'fps': "Moves per second",
+    'screenshot_time': "Last screenshot duration (s)",
+    'analysis_time': "Last board analysis duration (s)",
+    'strategy_time': "Last strategy decision duration (s)",
+}
+
 class PerformanceMonitor:
     """Real-time performance monitoring and optimization"""
 
-    def __init__(self, log_interval: float = 5.0, enable_alerts: bool = True):
+    def __init__(self, log_interval: float = 5.0, enable_alerts: bool = True,
+                 collect_disk_io: bool = True, collect_network: bool = False,
+                 net_poll_interval: float = 30.0, include_children: bool = False,
+                 children_refresh_ticks: int = 10):
         """
         Initialize performance monitor
 
         Args:
             log_interval: Seconds between performance logs
             enable_alerts: Enable performance alert system
+            collect_disk_io: Record per-process disk I/O counters
+            collect_network: Record system-wide network counters
+            net_poll_interval: Minimum seconds between network counter refreshes
+            include_children: Add child process memory (e.g. browser) to memory metrics
+            children_refresh_ticks: Samples between rescans of the child process list
         """
         self.log_interval = log_interval
         self.enable_alerts = enable_alerts
+        self.collect_disk_io = collect_disk_io
+        self.collect_network = collect_network
+        self.net_poll_interval = net_poll_interval
+        self.include_children = include_children
+        self.children_refresh_ticks = children_refresh_ticks
         self.monitoring = False
-        self.metrics_history: List[PerformanceMetrics] = []
         self.max_history = 1000  # Keep last 1000 measurements
 
+        # Metrics history stored column-wise as a ring buffer; the averaged
+        # columns are row views of one block so they aggregate in one pass
+        self._averaged = np.zeros((len(_AVERAGE_FIELDS), self.max_history), dtype=np.float32)
+        self._cols: Dict[str, np.ndarray] = {
+            name: np.zeros(self.max_history, dtype=dtype)
+            for name, dtype in _COLUMN_DTYPES.items()
+        }
+        for row, name in enumerate(_AVERAGE_FIELDS):
+            self._cols[name] = self._averaged[row]
+        self._head = 0   # Next write position
+        self._count = 0  # Number of valid samples
+        self._latest: Optional[PerformanceMetrics] = None  # Last stored snapshot, as collected
+
+        # Phase labels as (start timestamp, label), set by tag_phase()
+        self._phases: List[Tuple[float, str]] = []
+
+        # Bot metric updates pushed by the bot thread and folded in by the
+        # monitor thread (deque append/popleft are atomic, so no lock needed)
+        self._bot_events: Deque[Dict[str, float]] = deque(maxlen=4096)
+
         # Performance thresholds
         self.thresholds = {
             'cpu_percent': 80.0,        # CPU usage %
@@ -62,18 +174,30 @@ class PerformanceMonitor:
             'strategy_time': 0.5,       # Strategy time seconds
             'fps': 0.5                  # Minimum FPS (moves per second)
         }
+        self._threshold_vec = self._build_threshold_vec()
 
         # System info
         self.process = psutil.Process(os.getpid())
         self.system = psutil.virtual_memory()
 
+        # Last network reading as (monotonic time, (bytes_sent, bytes_recv))
+        self._net_cache = (0.0, (0, 0))
+
+        # Cached child processes, rescanned every children_refresh_ticks samples
+        self._children: List[psutil.Process] = []
+        self._children_age = 0
+
         # Monitoring thread
         self.monitor_thread = None
         self.stop_event = threading.Event()
+        self._wake_fd: Optional[int] = None  # Write end of the timerfd loop's wake-up pipe
 
         # Alert callbacks
         self.alert_callbacks: List[Callable] = []
 
+        # Prometheus gauges, set up by enable_prometheus()
+        self._gauges: Dict[str, "Gauge"] = {}
+
         # Setup logging
         self.logger = logging.getLogger("performance_monitor")
 
@@ -84,7 +208,19 @@ class PerformanceMonitor:
 
         self.monitoring = True
         self.stop_event.clear()
-        self.monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
+
+        # Prime the CPU baseline so the first sample is meaningful
+        self.process.cpu_percent(interval=None)
+
+        # On Linux (Python 3.13+) pace samples with a kernel timer; a pipe
+        # lets stop_monitoring interrupt the select() immediately
+        if hasattr(os, 'timerfd_create'):
+            wake_read, self._wake_fd = os.pipe()
+            target, args = self._timerfd_loop, (wake_read,)
+        else:
+            target, args = self._monitor_loop, ()
+
+        self.monitor_thread = threading.Thread(target=target, args=args, daemon=True)
         self.monitor_thread.start()
         self.logger.info("🚀 Performance monitoring started")
 
@@ -95,6 +231,10 @@ class PerformanceMonitor:
 
         self.monitoring = False
         self.stop_event.set()
+        if self._wake_fd is not None:
+            os.write(self._wake_fd, b'\0')
+            os.close(self._wake_fd)
+            self._wake_fd = None
         if self.monitor_thread:
             self.monitor_thread.join(timeout=2.0)
         self.logger.info("⏹️ Performance monitoring stopped")
@@ -102,35 +242,59 @@ class PerformanceMonitor:
     def _monitor_loop(self):
         """Main monitoring loop"""
         while not self.stop_event.wait(self.log_interval):
-            try:
-                metrics = self._collect_metrics()
-                self._process_metrics(metrics)
-            except Exception as e:
-                self.logger.error(f"Performance monitoring error: {e}")
+            self._sample()
+
+    def _timerfd_loop(self, wake_fd: int):
+        """Monitoring loop driven by a timerfd, sampling on fixed interval boundaries"""
+        timer_fd = os.timerfd_create(time.CLOCK_MONOTONIC)
+        try:
+            os.timerfd_settime(timer_fd, initial=self.log_interval, interval=self.log_interval)
+            while not self.stop_event.is_set():
+                ready, _, _ = select.select([timer_fd, wake_fd], [], [])
+                if wake_fd in ready:
+                    break
+                os.read(timer_fd, 8)
+                self._sample()
+        finally:
+            os.close(timer_fd)
+            os.close(wake_fd)
+
+    def _sample(self):
+        """Collect and process a single metrics sample"""
+        try:
+            metrics = self._collect_metrics()
+            self._process_metrics(metrics)
+        except Exception as e:
+            self.logger.error(f"Performance monitoring error: {e}")
 
     def _collect_metrics(self) -> PerformanceMetrics:
         """Collect current performance metrics"""
-        # System metrics
-        cpu_percent = self.process.cpu_percent()
-        memory_info = self.process.memory_info()
-        memory_mb = memory_info.rss / 1024 / 1024
-        memory_percent = self.process.memory_percent()
-
-        # I/O metrics (if available)
-        try:
-            io_counters = self.process.io_counters()
-            disk_read = io_counters.read_bytes
-            disk_write = io_counters.write_bytes
-        except (AttributeError, OSError):
+        # oneshot() shares a single /proc read across the process queries
+        with self.process.oneshot():
+            # System metrics
+            cpu_percent = self.process.cpu_percent(interval=None)
+            memory_info = self.process.memory_info()
+            memory_mb = memory_info.rss / 1024 / 1024
+            memory_percent = self.process.memory_percent()
+
+            # I/O metrics (if available)
             disk_read = disk_write = 0
+            if self.collect_disk_io:
+                try:
+                    io_counters = self.process.io_counters()
+                    disk_read = io_counters.read_bytes
+                    disk_write = io_counters.write_bytes
+                except (AttributeError, OSError):
+                    pass
+
+        # Child process memory (browser processes usually dominate RSS)
+        if self.include_children:
+            children_rss = self._children_rss()
+            memory_mb += children_rss / 1024 / 1024
+            memory_percent += children_rss / self.system.total * 100
 
         # Network metrics (system-wide)
-        try:
-            net_io = psutil.net_io_counters()
-            net_sent = net_io.bytes_sent
-            net_recv = net_io.bytes_recv
-        except (AttributeError, OSError):
-            net_sent = net_recv = 0
+        net_sent, net_recv = self._network_counters()
 
         return PerformanceMetrics(
             timestamp=time.time(),
@@ -143,14 +307,56 @@ class PerformanceMonitor:
             network_recv=net_recv
         )
 
+    def _children_rss(self) -> int:
+        """Total resident memory of the cached child processes"""
+        if self._children_age == 0:
+            try:
+                self._children = self.process.children(recursive=True)
+            except psutil.Error:
+                self._children = []
+        self._children_age = (self._children_age + 1) % max(1, self.children_refresh_ticks)
+
+        rss = 0
+        for child in self._children:
+            try:
+                with child.oneshot():
+                    rss += child.memory_info().rss
+            except psutil.Error:
+                # Child exited or is inaccessible; rescan on the next sample
+                self._children_age = 0
+        return rss
+
+    def _network_counters(self) -> Tuple[int, int]:
+        """Get system-wide network counters, refreshed at most every net_poll_interval"""
+        if not self.collect_network:
+            return 0, 0
+
+        now = time.monotonic()
+        last_poll, counters = self._net_cache
+        if last_poll and now - last_poll < self.net_poll_interval:
+            return counters
+
+        try:
+            net_io = psutil.net_io_counters()
+            counters = (net_io.bytes_sent, net_io.bytes_recv)
+        except (AttributeError, OSError):
+            counters = (0, 0)
+
+        self._net_cache = (now, counters)
+        return counters
+
     def _process_metrics(self, metrics: PerformanceMetrics):
         """Process and store metrics"""
-        # Add to history
-        self.metrics_history.append(metrics)
+        # Fold pending bot updates into the new sample
+        self._apply_bot_events(metrics)
+
+        # Add to history (overwrites the oldest sample once full)
+        self._store_metrics(metrics)
+        self._latest = metrics
 
-        # Trim history if too long
-        if len(self.metrics_history) > self.max_history:
-            self.metrics_history = self.metrics_history[-self.max_history:]
+        # Publish to Prometheus (scrapes read these without rebuilding a report)
+        for name, gauge in self._gauges.items():
+            gauge.set(getattr(metrics, name))
 
         # Check thresholds
         if self.enable_alerts:
@@ -159,113 +365,191 @@ class PerformanceMonitor:
         # Log significant changes
         self._log_metrics(metrics)
 
-    def _check_alerts(self, metrics: PerformanceMetrics):
-        """Check performance thresholds and trigger alerts"""
-        alerts = []
+    def _apply_bot_events(self, metrics: PerformanceMetrics):
+        """Drain queued bot updates into a metrics snapshot"""
+        events = self._bot_events
+        moved = False
+        while events:
+            event = events.popleft()
+            moved = moved or 'move_count' in event
+            for name, value in event.items():
+                setattr(metrics, name, value)
+
+        if not moved:
+            # No move update this tick (none, or timings only): the counters are
+            # unchanged, so carry them forward and leave FPS at zero
+            if self._count:
+                previous = self._index(0)
+                metrics.move_count = int(self._cols['move_count'][previous])
+                metrics.game_score = int(self._cols['game_score'][previous])
+                metrics.efficiency = float(self._cols['efficiency'][previous])
+            return
+
+        # Calculate efficiency and FPS
+        if metrics.move_count > 0:
+            metrics.efficiency = metrics.game_score / metrics.move_count
 
-        if metrics.cpu_percent > self.thresholds['cpu_percent']:
-            alerts.append(f"High CPU usage: {metrics.cpu_percent:.1f}%")
+        # Calculate FPS against the previous sample
+        if self._count:
+            previous = self._index(0)
+            time_diff = metrics.timestamp - self._cols['timestamp'][previous]
+            move_diff = metrics.move_count - self._cols['move_count'][previous]
+            if time_diff > 0:
+                metrics.fps = float(move_diff / time_diff)
 
-        if metrics.memory_mb > self.thresholds['memory_mb']:
-            alerts.append(f"High memory usage: {metrics.memory_mb:.1f} MB")
+    def _store_metrics(self, metrics: PerformanceMetrics):
+        """Write a metrics snapshot into the ring buffer columns"""
+        for name, column in self._cols.items():
+            column[self._head] = getattr(metrics, name)
 
-        if metrics.memory_percent > self.thresholds['memory_percent']:
-            alerts.append(f"High memory percentage: {metrics.memory_percent:.1f}%")
+        self._head = (self._head + 1) % self.max_history
+        self._count = min(self._count + 1, self.max_history)
 
-        if metrics.screenshot_time > self.thresholds['screenshot_time']:
-            alerts.append(f"Slow screenshot: {metrics.screenshot_time:.2f}s")
+    def _index(self, age: int) -> int:
+        """Ring buffer index of the sample `age` steps back from the newest"""
+        return (self._head - 1 - age) % self.max_history
 
-        if metrics.analysis_time > self.thresholds['analysis_time']:
-            alerts.append(f"Slow analysis: {metrics.analysis_time:.2f}s")
+    def _row_dict(self, index: int) -> Dict:
+        """Read one ring buffer row as a plain dict"""
+        return {name: column[index].item() for name, column in self._cols.items()}
+
+    def _row(self, index: int) -> PerformanceMetrics:
+        """Build a metrics snapshot from one ring buffer row"""
+        return PerformanceMetrics(**self._row_dict(index))
+
+    def _check_alerts(self, metrics: PerformanceMetrics):
+        """Check performance thresholds and trigger alerts"""
+        alerts = []
 
-        if metrics.strategy_time > self.thresholds['strategy_time']:
-            alerts.append(f"Slow strategy: {metrics.strategy_time:.2f}s")
+        # Compare all upper-bound metrics in one vectorized check
+        values = np.array([getattr(metrics, name) for name in _UPPER_ALERT_NAMES])
+        for i in np.flatnonzero(values > self._threshold_vec):
+            alerts.append(_UPPER_ALERTS[i][1].format(values[i]))
 
         if metrics.fps > 0 and metrics.fps < self.thresholds['fps']:
             alerts.append(f"Low FPS: {metrics.fps:.2f}")
 
         # Trigger alert callbacks
         for alert in alerts:
-            self.logger.warning(f"⚠️ Performance Alert: {alert}")
+            self.logger.warning("⚠️ Performance Alert: %s", alert)
             for callback in self.alert_callbacks:
                 try:
                     callback(alert, metrics)
                 except Exception as e:
                     self.logger.error(f"Alert callback error: {e}")
 
+    def _build_threshold_vec(self) -> np.ndarray:
+        """Pack upper-bound thresholds in _UPPER_ALERTS order"""
+        return np.array([self.thresholds[name] for name in _UPPER_ALERT_NAMES])
+
+    def set_threshold(self, name: str, value: float):
+        """Change an alert threshold (use this rather than editing self.thresholds)"""
+        if name not in self.thresholds:
+            raise KeyError(f"Unknown threshold: {name}")
+        self.thresholds[name] = value
+        self._threshold_vec = self._build_threshold_vec()
+
     def _log_metrics(self, metrics: PerformanceMetrics):
         """Log performance metrics"""
         self.logger.debug(
-            f"📊 CPU: {metrics.cpu_percent:.1f}% | "
-            f"Memory: {metrics.memory_mb:.1f}MB ({metrics.memory_percent:.1f}%) | "
-            f"Moves: {metrics.move_count} | "
-            f"Score: {metrics.game_score} | "
-            f"Efficiency: {metrics.efficiency:.2f}"
+            "📊 CPU: %.1f%% | Memory: %.1fMB (%.1f%%) | Moves: %d | Score: %d | Efficiency: %.2f",
+            metrics.cpu_percent, metrics.memory_mb, metrics.memory_percent,
+            metrics.move_count, metrics.game_score, metrics.efficiency
         )
 
     def update_bot_metrics(self, move_count: int = 0, game_score: int = 0,
                           screenshot_time: float = 0.0, analysis_time: float = 0.0,
                           strategy_time: float = 0.0):
-        """Update bot-specific performance metrics"""
-        if self.metrics_history:
-            latest = self.metrics_history[-1]
-            latest.move_count = move_count
-            latest.game_score = game_score
-            latest.screenshot_time = screenshot_time
-            latest.analysis_time = analysis_time
-            latest.strategy_time = strategy_time
-
-            # Calculate efficiency and FPS
-            if move_count > 0:
-                latest.efficiency = game_score / move_count
-
-            # Calculate FPS from recent measurements
-            if len(self.metrics_history) >= 2:
-                time_diff = latest.timestamp - self.metrics_history[-2].timestamp
-                move_diff = latest.move_count - self.metrics_history[-2].move_count
-                if time_diff > 0:
-                    latest.fps = move_diff / time_diff
+        """
+        Update bot-specific performance metrics
+
+        Safe to call from the bot thread: the update is queued and applied
+        to the next sample collected by the monitor thread.
+        """
+        self._bot_events.append({
+            'move_count': move_count,
+            'game_score': game_score,
+            'screenshot_time': screenshot_time,
+            'analysis_time': analysis_time,
+            'strategy_time': strategy_time
+        })
+
+    def record_timing(self, operation_name: str, duration: float):
+        """Queue a single operation timing (screenshot, analysis or strategy)"""
+        self._bot_events.append({f"{operation_name}_time": duration})
 
     def get_current_metrics(self) -> Optional[PerformanceMetrics]:
         """Get latest performance metrics"""
-        return self.metrics_history[-1] if self.metrics_history else None
+        return self._row(self._index(0)) if self._count else None
+
+    def peek_latest(self) -> Optional[PerformanceMetrics]:
+        """
+        Get the snapshot the monitor thread stored last, without rebuilding it
+
+        The returned object is shared with the monitor and must not be modified.
+        Use get_current_metrics() for a private copy read from history.
+        """
+        return self._latest
 
     def get_average_metrics(self, window_seconds: float = 60.0) -> Dict:
         """Get average metrics over time window"""
-        if not self.metrics_history:
+        if not self._count:
             return {}
 
         current_time = time.time()
-        window_metrics = [
-            m for m in self.metrics_history
-            if current_time - m.timestamp <= window_seconds
-        ]
+        means, sample_count = window_means(
+            self._cols['timestamp'], self._averaged,
+            self._head, self._count, current_time - window_seconds
+        )
 
-        if not window_metrics:
+        if not sample_count:
             return {}
 
         # Calculate averages
-        avg = {
-            'cpu_percent': sum(m.cpu_percent for m in window_metrics) / len(window_metrics),
-            'memory_mb': sum(m.memory_mb for m in window_metrics) / len(window_metrics),
-            'memory_percent': sum(m.memory_percent for m in window_metrics) / len(window_metrics),
-            'efficiency': sum(m.efficiency for m in window_metrics) / len(window_metrics),
-            'fps': sum(m.fps for m in window_metrics) / len(window_metrics),
-            'screenshot_time': sum(m.screenshot_time for m in window_metrics) / len(window_metrics),
-            'analysis_time': sum(m.analysis_time for m in window_metrics) / len(window_metrics),
-            'strategy_time': sum(m.strategy_time for m in window_metrics) / len(window_metrics),
-            'sample_count': len(window_metrics),
-            'window_seconds': window_seconds
-        }
+        avg = dict(zip(_AVERAGE_FIELDS, means.tolist()))
+        avg['sample_count'] = sample_count
+        avg['window_seconds'] = window_seconds
 
         return avg
 
+    def tag_phase(self, label: str, timestamp: Optional[float] = None):
+        """
+        Mark the start of a named phase; later samples belong to it
+
+        Args:
+            label: Phase name used to bucket samples in the report
+            timestamp: Phase start time, defaults to now
+        """
+        self._phases.append((time.time() if timestamp is None else timestamp, label))
+        self.logger.info("🏷️ Phase started: %s", label)
+
+    def get_phase_summary(self) -> List[Dict]:
+        """Sample count and averages of the retained samples in each tagged phase"""
+        if not self._phases or not self._count:
+            return []
+
+        # Oldest-first view of the ring buffer
+        order = (self._head - self._count + np.arange(self._count)) % self.max_history
+        timestamps = self._cols['timestamp'][order]
+        values = self._averaged[:, order]
+
+        summary = []
+        ends = [start for start, _ in self._phases[1:]] + [float('inf')]
+        for (start, label), end in zip(self._phases, ends):
+            mask = (timestamps >= start) & (timestamps < end)
+            sample_count = int(np.count_nonzero(mask))
+            phase = {'phase': label, 'start': start, 'sample_count': sample_count}
+            if sample_count:
+                means = values[:, mask].mean(axis=1, dtype=np.float64)
+                phase['averages'] = {name: float(v) for name, v in zip(_AVERAGE_FIELDS, means)}
+            summary.append(phase)
+        return summary
+
     def get_performance_report(self) -> Dict:
         """Generate comprehensive performance report"""
-        if not self.metrics_history:
+        if not self._count:
             return {"error": "No metrics available"}
 
-        current = self.get_current_metrics()
         avg_1min = self.get_average_metrics(60.0)
         avg_5min = self.get_average_metrics(300.0)
 
@@ -279,12 +563,13 @@ class PerformanceMonitor:
 
         # Performance summary
         performance_summary = {
-            'monitoring_duration': time.time() - self.metrics_history[0].timestamp if self.metrics_history else 0,
-            'total_samples': len(self.metrics_history),
-            'current_metrics': asdict(current) if current else {},
+            'monitoring_duration': time.time() - float(self._cols['timestamp'][self._index(self._count - 1)]),
+            'total_samples': self._count,
+            'current_metrics': self._row_dict(self._index(0)),
             'average_1min': avg_1min,
             'average_5min': avg_5min,
-            'thresholds': self.thresholds
+            'thresholds': self.thresholds,
+            'phases': self.get_phase_summary()
         }
 
         return {
@@ -296,10 +581,37 @@ class PerformanceMonitor:
     def export_metrics(self, filepath: str):
         """Export metrics to JSON file"""
         report = self.get_performance_report()
-        with open(filepath, 'w') as f:
-            json.dump(report, f, indent=2)
+        if ORJSON_AVAILABLE:
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            with open(filepath, 'w') as f:
+                json.dump(report, f, indent=2)
         self.logger.info(f"📁 Metrics exported to {filepath}")
 
+    def enable_prometheus(self, port: Optional[int] = None) -> "CollectorRegistry":
+        """
+        Publish each sample as Prometheus gauges
+
+        Args:
+            port: If given, serve the gauges over HTTP on this port
+
+        Returns:
+            The registry holding this monitor's gauges
+        """
+        if not PROMETHEUS_AVAILABLE:
+            raise RuntimeError("prometheus_client is not installed")
+
+        registry = CollectorRegistry()
+        self._gauges = {
+            name: Gauge(f"bot_{name}", description, registry=registry)
+            for name, description in _GAUGE_DESCRIPTIONS.items()
+        }
+        if port is not None:
+            start_http_server(port, registry=registry)
+            self.logger.info(f"📡 Prometheus metrics served on port {port}")
+        return registry
+
     def add_alert_callback(self, callback: Callable):
         """Add callback function for performance alerts"""
         self.alert_callbacks.append(callback)
@@ -342,7 +654,7 @@ class PerformanceMonitor:
         if not suggestions:
             suggestions.append("Performance looks good! No optimizations needed.")
 
-        return {"suggestions": suggestions, "current_metrics": asdict(current)}
+        return {"suggestions": suggestions, "current_metrics": _metrics_to_dict(current)}
 
 # Integration with Complete2048Bot
 class PerformanceIntegration:
@@ -361,12 +673,8 @@ class PerformanceIntegration:
                 duration = time.time() - start_time
 
                 # Update relevant timing metric
-                if operation_name == "screenshot":
-                    self.monitor.update_bot_metrics(screenshot_time=duration)
-                elif operation_name == "analysis":
-                    self.monitor.update_bot_metrics(analysis_time=duration)
-                elif operation_name == "strategy":
-                    self.monitor.update_bot_metrics(strategy_time=duration)
+                if operation_name in ("screenshot", "analysis", "strategy"):
+                    self.monitor.record_timing(operation_name, duration)
 
                 return result
             return wrapper
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Performance Monitor Kernels
+Compiled aggregation over the monitor's ring buffer, with a NumPy fallback
+"""
+
+from typing import Tuple
+import numpy as np
+
+# Numba is optional; without it the NumPy implementation is used
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+def _window_means_numpy(timestamps: np.ndarray, values: np.ndarray, head: int,
+                        count: int, cutoff: float) -> Tuple[np.ndarray, int]:
+    """
+    Mean of each metric row over the samples taken at or after cutoff
+
+    Args:
+        timestamps: Ring buffer of sample timestamps
+        values: Ring buffer of metrics, shape (n_metrics, capacity)
+        head: Next write position in the ring
+        count: Number of valid samples
+        cutoff: Oldest timestamp inside the window
+
+    Returns:
+        Tuple of (per-metric means, number of samples in the window)
+    """
+    capacity = timestamps.shape[0]
+    if count < capacity:
+        segments = ((0, count),)
+    else:
+        segments = ((head, capacity), (0, head))
+
+    # Each segment is in time order, so the window start is found by binary search
+    sums = np.zeros(values.shape[0])
+    sample_count = 0
+    for start, stop in segments:
+        first = start + int(np.searchsorted(timestamps[start:stop], cutoff, side='left'))
+        if first < stop:
+            sums += values[:, first:stop].sum(axis=1, dtype=np.float64)
+            sample_count += stop - first
+
+    if sample_count:
+        sums /= sample_count
+    return sums, sample_count
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def window_means(timestamps, values, head, count, cutoff):
+        """Mean of each metric row over the samples taken at or after cutoff"""
+        capacity = timestamps.shape[0]
+        n_metrics = values.shape[0]
+        sums = np.zeros(n_metrics)
+        sample_count = 0
+
+        # Walk back from the newest sample until one falls outside the window
+        for age in range(count):
+            i = head - 1 - age
+            if i < 0:
+                i += capacity
+            if timestamps[i] < cutoff:
+                break
+            for m in range(n_metrics):
+                sums[m] += values[m, i]
+            sample_count += 1
+
+        if sample_count:
+            sums /= sample_count
+        return sums, sample_count
+else:
+    window_means = _window_means_numpy
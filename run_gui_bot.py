@@ -2,11 +2,6 @@
 """Launch the JED-2048 bot with the vaporwave pygame_gui interface."""
 
 import argparse
-import sys
-from pathlib import Path
-
-PROJECT_ROOT = Path(__file__).parent
-sys.path.append(str(PROJECT_ROOT))
 
 from gui_enhanced_2048_bot import GUIEnhanced2048Bot
 
@@ -3,12 +3,6 @@
 Run the complete 2048 bot in visible mode for performance validation
 """
 
-import sys
-from pathlib import Path
-
-# Add project root to path
-sys.path.append(str(Path(__file__).parent))
-
 from complete_2048_bot import Complete2048Bot
 
 def run_visible_performance_test():
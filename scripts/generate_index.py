@@ -6,7 +6,7 @@ Usage:
   python scripts/generate_index.py [--out docs/PROJECT_INDEX.json] [--exclude DIR ...]
 
 Defaults:
-  - Excludes: venv, __pycache__
+  - Excludes: venv, __pycache__, validation_data, hidden files and directories
   - Output: docs/PROJECT_INDEX.json
 """
 from __future__ import annotations
@@ -14,10 +14,19 @@ from __future__ import annotations
 import argparse
 import json
 import os
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List
+from typing import BinaryIO, Dict, List
+
+try:
+    import orjson
+except ImportError:  # optional: faster per-entry encoding
+    orjson = None
+
+
+# Compiled/bytecode artifacts that never belong in the index
+SKIP_SUFFIXES = (".pyc", ".pyo")
 
 
 @dataclass
@@ -27,39 +36,73 @@ class FileEntry:
     size_bytes: int
 
 
-def collect_files(root: Path, excludes: List[str]) -> List[Path]:
+def collect_files(root: Path, excludes: List[str]) -> List[FileEntry]:
     ex_dirs = {e.rstrip("/") for e in excludes}
-    files: List[Path] = []
-    for dirpath, dirnames, filenames in os.walk(root):
-        # prune excluded directories
-        dirnames[:] = [d for d in dirnames if d not in ex_dirs]
-        for name in filenames:
-            if name.endswith(".pyc"):
-                continue
-            files.append(Path(dirpath) / name)
+    files: List[FileEntry] = []
+    # scandir entries carry the file type from the directory read, so only
+    # the size lookup needs a stat() call
+    pending = [(str(root), "")]
+    while pending:
+        dirpath, prefix = pending.pop()
+        with os.scandir(dirpath) as it:
+            for entry in it:
+                name = entry.name
+                if name.startswith("."):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    # prune excluded directories
+                    if name not in ex_dirs:
+                        pending.append((entry.path, prefix + name + "/"))
+                elif entry.is_file():
+                    if name.endswith(SKIP_SUFFIXES):
+                        continue
+                    ext = os.path.splitext(name)[1].lstrip(".").lower()
+                    files.append(FileEntry(path=prefix + name, ext=ext, size_bytes=entry.stat().st_size))
     return files
 
 
-def build_index(root: Path, files: List[Path]) -> Dict:
-    entries: List[FileEntry] = []
+def build_index(root: Path, files: List[FileEntry]) -> Dict:
+    entries = sorted(files, key=lambda e: e.path.split("/"))
     counts: Dict[str, int] = {}
-    for f in sorted(files):
-        rel = f.relative_to(root).as_posix()
-        ext = f.suffix.lstrip(".").lower()
-        size = f.stat().st_size if f.exists() else 0
-        entries.append(FileEntry(path=rel, ext=ext, size_bytes=size))
-        counts[ext] = counts.get(ext, 0) + 1
+    for e in entries:
+        counts[e.ext] = counts.get(e.ext, 0) + 1
 
     index = {
         "root": str(root),
         "generated_at": datetime.now(timezone.utc).isoformat(),
         "file_count": len(entries),
         "counts_by_ext": dict(sorted(counts.items(), key=lambda kv: (-kv[1], kv[0]))),
-        "files": [asdict(e) for e in entries],
+        "files": entries,
     }
     return index
 
 
+def _dumps(value, indent: str) -> bytes:
+    """Encode a value as 2-space indented JSON nested at the given indent"""
+    if orjson is not None:
+        data = orjson.dumps(value, option=orjson.OPT_INDENT_2)
+    else:
+        if isinstance(value, FileEntry):
+            value = vars(value)
+        data = json.dumps(value, indent=2, ensure_ascii=False).encode("utf-8")
+    return data.replace(b"\n", b"\n" + indent.encode())
+
+
+def write_index(index: Dict, f: BinaryIO) -> None:
+    """Write the index as indented JSON, encoding file entries one at a time"""
+    f.write(b"{\n")
+    for key, value in index.items():
+        if key != "files":
+            f.write(b'  "%s": %s,\n' % (key.encode(), _dumps(value, "  ")))
+
+    entries = index["files"]
+    f.write(b'  "files": [')
+    for i, entry in enumerate(entries):
+        f.write(b",\n    " if i else b"\n    ")
+        f.write(_dumps(entry, "    "))
+    f.write(b"\n  ]\n}" if entries else b"]\n}")
+
+
 def main() -> None:
     parser = argparse.ArgumentParser()
     parser.add_argument(
@@ -81,8 +124,8 @@ def main() -> None:
 
     out_path = project_root / args.out
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    with out_path.open("w", encoding="utf-8") as f:
-        json.dump(index, f, indent=2, ensure_ascii=False)
+    with out_path.open("wb") as f:
+        write_index(index, f)
     print(f"Wrote index to: {out_path}")
 
 
@@ -5,9 +5,15 @@ Comprehensive performance testing and optimization analysis
 """
 
 import sys
+import shutil
+import tempfile
 from pathlib import Path
 import time
 import json
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
 
 # Add project root to path
 sys.path.append(str(Path(__file__).parent.parent))
@@ -16,25 +22,159 @@ from complete_2048_bot import Complete2048Bot
 from production.performance_monitor import PerformanceMonitor
 import logging
 
-def performance_baseline_test():
-    """Run baseline performance test"""
+# orjson is optional; the standard json module is used without it
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _append_jsonl(f, record: dict):
+    """Append one record to an open binary JSON Lines file and flush it to disk"""
+    if ORJSON_AVAILABLE:
+        line = orjson.dumps(record, option=orjson.OPT_SERIALIZE_NUMPY)
+    else:
+        line = json.dumps(record).encode('utf-8')
+    f.write(line + b"\n")
+    f.flush()
+
+class BotPool:
+    """Keeps connected bots alive between test runs so each browser is launched once"""
+
+    def __init__(self):
+        self._idle: Dict[Tuple[bool, bool, str], List[Complete2048Bot]] = {}
+
+    @staticmethod
+    def _key(config: dict) -> Tuple[bool, bool, str]:
+        """Bots are interchangeable only when their constructor settings match"""
+        return (config.get('headless', True), config.get('debug', False), config.get('log_level', 'INFO'))
+
+    @contextmanager
+    def acquire(self, config: dict):
+        """Yield an idle bot matching config, or create one; the bot returns to the pool afterwards"""
+        key = self._key(config)
+        idle = self._idle.get(key)
+        if idle:
+            bot = idle.pop()
+        else:
+            headless, debug, log_level = key
+            bot = Complete2048Bot(headless=headless, debug=debug, log_level=log_level)
+
+        try:
+            yield bot
+        finally:
+            self.release(bot, key)
+
+    def release(self, bot: Complete2048Bot, key: Tuple[bool, bool, str]):
+        """Start a fresh game on the bot and keep it, or clean it up if the browser is gone"""
+        if bot.controller.is_connected and bot.reset_for_new_game():
+            self._idle.setdefault(key, []).append(bot)
+        else:
+            bot.cleanup()
+
+    def close(self):
+        """Clean up every pooled bot and its browser"""
+        for bots in self._idle.values():
+            for bot in bots:
+                bot.cleanup()
+        self._idle.clear()
+
+def _run_one_config(config: dict) -> dict:
+    """Run one configuration in a worker process and return its result dict"""
+    print(f"\n🧪 Testing Configuration: {config['name']}")
+    print(f"   Settings: {config}")
+
+    # Each worker samples its own process; the parent only aggregates results
+    monitor = PerformanceMonitor(log_interval=2.0, enable_alerts=False)
+    monitor.start_monitoring()
+
+    # Workers share a cwd, so each bot keeps its screenshots in a private directory
+    scratch_dir = tempfile.mkdtemp(prefix=f"perf_{config['name'].replace(' ', '_')}_")
+
+    try:
+        with Complete2048Bot(
+            headless=config['headless'],
+            debug=config['debug'],
+            log_level=config['log_level'],
+            screenshot_dir=scratch_dir
+        ) as bot:
+            # Connection test
+            print("   🌐 Testing connection...")
+            connection_start = time.perf_counter()
+            connection_success = bot.connect_to_game()
+            connection_time = time.perf_counter() - connection_start
+
+            if not connection_success:
+                print("   ❌ Connection failed")
+                return {
+                    'configuration': config['name'],
+                    'connection_time': connection_time,
+                    'success': False,
+                    'error': 'Connection failed'
+                }
+
+            print(f"   ✅ Connected in {connection_time:.2f}s")
+
+            # Performance test with limited moves
+            print("   🎮 Running performance game (20 moves)...")
+            game_start = time.perf_counter()
+
+            # Track performance metrics during game
+            initial_metrics = monitor.peek_latest()
+
+            # Play short game for performance testing
+            game_results = bot.play_autonomous_game(max_moves=20)
+
+            game_duration = time.perf_counter() - game_start
+            final_metrics = monitor.peek_latest()
+
+        # Calculate performance metrics
+        config_result = {
+            'configuration': config['name'],
+            'connection_time': connection_time,
+            'game_duration': game_duration,
+            'moves_completed': game_results.get('moves_completed', 0),
+            'final_score': game_results.get('final_score', 0),
+            'efficiency': game_results.get('final_score', 0) / max(game_results.get('moves_completed', 1), 1),
+            'moves_per_second': game_results.get('moves_completed', 0) / max(game_duration, 0.1),
+            'memory_usage_mb': final_metrics.memory_mb if final_metrics else 0,
+            'cpu_percent': final_metrics.cpu_percent if final_metrics else 0,
+            'success': True
+        }
+
+        print(f"   📊 Results ({config['name']}):")
+        print(f"      Moves: {config_result['moves_completed']}")
+        print(f"      Score: {config_result['final_score']}")
+        print(f"      Efficiency: {config_result['efficiency']:.2f} points/move")
+        print(f"      Speed: {config_result['moves_per_second']:.2f} moves/sec")
+        print(f"      Memory: {config_result['memory_usage_mb']:.1f} MB")
+        print(f"      CPU: {config_result['cpu_percent']:.1f}%")
+
+        return config_result
+
+    except Exception as e:
+        print(f"   ❌ Configuration failed: {e}")
+        return {
+            'configuration': config['name'],
+            'success': False,
+            'error': str(e)
+        }
+
+    finally:
+        monitor.stop_monitoring()
+        shutil.rmtree(scratch_dir, ignore_errors=True)
+
+def performance_baseline_test(monitor: PerformanceMonitor, results_path: Optional[str] = None):
+    """Run baseline performance test, streaming each configuration's result to a JSON Lines file"""
+    if results_path is None:
+        results_path = f"performance_results_{int(time.time())}.jsonl"
+
     print("🚀 PERFORMANCE BASELINE TEST")
     print("=" * 60)
     print("📊 Testing bot performance with monitoring enabled")
     print("")
 
-    # Initialize performance monitor
-    monitor = PerformanceMonitor(log_interval=2.0, enable_alerts=True)
-
-    # Add performance alert handler
-    def performance_alert(message, metrics):
-        print(f"⚠️  PERFORMANCE ALERT: {message}")
-
-    monitor.add_alert_callback(performance_alert)
-
-    # Start monitoring
-    monitor.start_monitoring()
-    time.sleep(1)  # Let monitoring stabilize
+    monitor.tag_phase("baseline")
 
     try:
         # Test different configurations
@@ -45,93 +185,22 @@ def performance_baseline_test():
 
         results = []
 
-        for config in configurations:
-            print(f"\n🧪 Testing Configuration: {config['name']}")
-            print(f"   Settings: {config}")
-
-            config_start_time = time.time()
-
-            # Initialize bot with current configuration
-            bot = Complete2048Bot(
-                headless=config['headless'],
-                debug=config['debug'],
-                log_level=config['log_level']
-            )
-
-            try:
-                # Connection test
-                print("   🌐 Testing connection...")
-                connection_start = time.time()
-                connection_success = bot.connect_to_game()
-                connection_time = time.time() - connection_start
-
-                if connection_success:
-                    print(f"   ✅ Connected in {connection_time:.2f}s")
-
-                    # Performance test with limited moves
-                    print("   🎮 Running performance game (20 moves)...")
-                    game_start = time.time()
-
-                    # Track performance metrics during game
-                    initial_metrics = monitor.get_current_metrics()
-
-                    # Play short game for performance testing
-                    game_results = bot.play_autonomous_game(max_moves=20)
-
-                    game_duration = time.time() - game_start
-                    final_metrics = monitor.get_current_metrics()
-
-                    # Update monitor with final bot metrics
-                    monitor.update_bot_metrics(
-                        move_count=game_results.get('moves_completed', 0),
-                        game_score=game_results.get('final_score', 0)
-                    )
-
-                    # Calculate performance metrics
-                    config_result = {
-                        'configuration': config['name'],
-                        'connection_time': connection_time,
-                        'game_duration': game_duration,
-                        'moves_completed': game_results.get('moves_completed', 0),
-                        'final_score': game_results.get('final_score', 0),
-                        'efficiency': game_results.get('final_score', 0) / max(game_results.get('moves_completed', 1), 1),
-                        'moves_per_second': game_results.get('moves_completed', 0) / max(game_duration, 0.1),
-                        'memory_usage_mb': final_metrics.memory_mb if final_metrics else 0,
-                        'cpu_percent': final_metrics.cpu_percent if final_metrics else 0,
-                        'success': True
-                    }
-
-                    print(f"   📊 Results:")
-                    print(f"      Moves: {config_result['moves_completed']}")
-                    print(f"      Score: {config_result['final_score']}")
-                    print(f"      Efficiency: {config_result['efficiency']:.2f} points/move")
-                    print(f"      Speed: {config_result['moves_per_second']:.2f} moves/sec")
-                    print(f"      Memory: {config_result['memory_usage_mb']:.1f} MB")
-                    print(f"      CPU: {config_result['cpu_percent']:.1f}%")
-
-                else:
-                    print("   ❌ Connection failed")
-                    config_result = {
-                        'configuration': config['name'],
-                        'connection_time': connection_time,
-                        'success': False,
-                        'error': 'Connection failed'
-                    }
-
+        # Configurations are independent, so each runs in its own process with its own browser.
+        # Results are written as they arrive, so a crash mid-run keeps the finished ones.
+        with open(results_path, 'ab') as results_file, \
+                ProcessPoolExecutor(max_workers=len(configurations)) as executor:
+            for config_result in executor.map(_run_one_config, configurations):
                 results.append(config_result)
+                _append_jsonl(results_file, {'phase': 'baseline', **config_result})
 
-            except Exception as e:
-                print(f"   ❌ Configuration failed: {e}")
-                config_result = {
-                    'configuration': config['name'],
-                    'success': False,
-                    'error': str(e)
-                }
-                results.append(config_result)
+        print(f"\n📁 Configuration results streamed to: {results_path}")
 
-            finally:
-                bot.cleanup()
-                time.sleep(2)  # Cool down between tests
+        # Update monitor with the combined bot metrics
+        successful_runs = [r for r in results if r.get('success', False)]
+        monitor.update_bot_metrics(
+            move_count=sum(r['moves_completed'] for r in successful_runs),
+            game_score=sum(r['final_score'] for r in successful_runs)
+        )
 
         # Performance comparison
         print(f"\n{'='*60}")
@@ -153,10 +222,14 @@ def performance_baseline_test():
 
                 print(f"{config_name:<20} {moves_sec:<10} {memory_mb:<10} {cpu_pct:<8} {efficiency:<12}")
 
-            # Find best configuration
-            best_speed = max(successful_results, key=lambda x: x.get('moves_per_second', 0))
-            best_memory = min(successful_results, key=lambda x: x.get('memory_usage_mb', float('inf')))
-            best_efficiency = max(successful_results, key=lambda x: x.get('efficiency', 0))
+            # Find best configuration: one column per metric, rows in result order
+            summary = np.array([
+                (r.get('moves_per_second', 0), r.get('memory_usage_mb', float('inf')), r.get('efficiency', 0))
+                for r in successful_results
+            ])
+            best_speed = successful_results[int(summary[:, 0].argmax())]
+            best_memory = successful_results[int(summary[:, 1].argmin())]
+            best_efficiency = successful_results[int(summary[:, 2].argmax())]
 
             print(f"\n🏆 Performance Winners:")
             print(f"   Fastest: {best_speed['configuration']} ({best_speed.get('moves_per_second', 0):.2f} moves/sec)")
@@ -197,8 +270,13 @@ def performance_baseline_test():
             'timestamp': timestamp
         }
 
-        with open(export_file, 'w') as f:
-            json.dump(export_data, f, indent=2)
+        if ORJSON_AVAILABLE:
+            Path(export_file).write_bytes(
+                orjson.dumps(export_data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+            )
+        else:
+            with open(export_file, 'w') as f:
+                json.dump(export_data, f, indent=2)
 
         print(f"\n📁 Detailed report exported to: {export_file}")
 
@@ -209,47 +287,61 @@ def performance_baseline_test():
         return []
 
     finally:
-        monitor.stop_monitoring()
         print("\n✅ Performance testing completed")
 
-def memory_stress_test():
-    """Test memory usage under continuous operation"""
+def memory_stress_test(monitor: PerformanceMonitor, pool: Optional[BotPool] = None,
+                       results_path: Optional[str] = None):
+    """Test memory usage under continuous operation, appending one JSON line per game"""
+    if results_path is None:
+        results_path = f"performance_results_{int(time.time())}.jsonl"
+
     print("\n🧠 MEMORY STRESS TEST")
     print("=" * 40)
 
-    monitor = PerformanceMonitor(log_interval=1.0, enable_alerts=True)
-    monitor.start_monitoring()
+    owns_pool = pool is None
+    if owns_pool:
+        pool = BotPool()
 
-    try:
-        bot = Complete2048Bot(headless=True, debug=False)
+    monitor.tag_phase("stress")
 
-        if bot.connect_to_game():
-            print("🎮 Running continuous games to test memory stability...")
+    try:
+        config = {"headless": True, "debug": False, "log_level": "WARNING"}
+        print("🎮 Running continuous games to test memory stability...")
 
+        with open(results_path, 'ab') as results_file:
             for game_num in range(5):
-                print(f"   Game {game_num + 1}/5...")
-
-                initial_memory = monitor.get_current_metrics().memory_mb
+                # Each game takes the pooled bot back with a fresh board
+                with pool.acquire(config) as bot:
+                    if not (bot.controller.is_connected or bot.connect_to_game()):
+                        print("   ❌ Connection failed")
+                        break
 
-                # Play short game
-                bot.play_autonomous_game(max_moves=15)
+                    print(f"   Game {game_num + 1}/5...")
 
-                final_memory = monitor.get_current_metrics().memory_mb
-                memory_increase = final_memory - initial_memory
+                    initial_memory = monitor.peek_latest().memory_mb
 
-                print(f"   Memory: {initial_memory:.1f} → {final_memory:.1f} MB (Δ{memory_increase:+.1f})")
+                    # Play short game
+                    bot.play_autonomous_game(max_moves=15)
 
-                # Reset game for next iteration
-                bot.controller.reset_game()
-                time.sleep(1)
+                    final_memory = monitor.peek_latest().memory_mb
+                    memory_increase = final_memory - initial_memory
 
-        bot.cleanup()
+                    print(f"   Memory: {initial_memory:.1f} → {final_memory:.1f} MB (Δ{memory_increase:+.1f})")
+                    _append_jsonl(results_file, {
+                        'phase': 'stress',
+                        'game': game_num + 1,
+                        'initial_memory_mb': initial_memory,
+                        'final_memory_mb': final_memory,
+                        'memory_increase_mb': memory_increase
+                    })
 
-        avg_metrics = monitor.get_average_metrics(300.0)  # 5 minute window
+        # Average over this phase only, since the monitor also holds baseline samples
+        avg_metrics = monitor.get_phase_summary()[-1].get('averages', {})
         print(f"\n📊 Average Memory Usage: {avg_metrics.get('memory_mb', 0):.1f} MB")
 
     finally:
-        monitor.stop_monitoring()
+        if owns_pool:
+            pool.close()
 
 if __name__ == "__main__":
     print("🧪 2048 BOT PERFORMANCE TEST SUITE")
@@ -257,12 +349,37 @@ if __name__ == "__main__":
     print("🔬 Comprehensive performance analysis and optimization testing")
     print("")
 
+    # One monitor covers both tests as a single time series, split by phase;
+    # browsers run in worker processes, so count children
+    monitor = PerformanceMonitor(log_interval=2.0, enable_alerts=True, include_children=True)
+
+    # Add performance alert handler
+    def performance_alert(message, metrics):
+        print(f"⚠️  PERFORMANCE ALERT: {message}")
+
+    monitor.add_alert_callback(performance_alert)
+
+    # Start monitoring
+    monitor.start_monitoring()
+    time.sleep(1)  # Let monitoring stabilize
+
+    # The stress test's games share one pooled browser
+    pool = BotPool()
+
+    # Both tests append to one JSON Lines file as results arrive
+    results_path = f"performance_results_{int(time.time())}.jsonl"
+
     try:
         # Run baseline performance test
-        baseline_results = performance_baseline_test()
+        baseline_results = performance_baseline_test(monitor, results_path)
 
         # Run memory stress test
-        memory_stress_test()
+        memory_stress_test(monitor, pool, results_path)
+
+        # Export the full time series with per-phase buckets
+        monitor_file = f"performance_monitor_{int(time.time())}.json"
+        monitor.export_metrics(monitor_file)
+        print(f"\n📁 Monitor time series exported to: {monitor_file}")
 
         print(f"\n🎉 PERFORMANCE TESTING COMPLETE!")
         print("📊 Check exported JSON files for detailed analysis")
@@ -270,4 +387,8 @@ if __name__ == "__main__":
     except Exception as e:
         print(f"\n❌ Performance testing failed: {e}")
         import traceback
-        traceback.print_exc()
\ No newline at end of file
+        traceback.print_exc()
+
+    finally:
+        pool.close()
+        monitor.stop_monitoring()
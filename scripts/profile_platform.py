@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Student Platform Profiler
+Runs a synthetic competition under cProfile and prints the top cumulative hotspots
+
+This is the "is my change actually helping?" check for platform work: run it
+before and after a change and compare the top of the cumulative listing.
+
+cProfile only sees the orchestrating process. Games run in worker processes,
+so use a sampling profiler to see inside them:
+
+    py-spy record -o platform.svg --subprocesses -- python scripts/profile_platform.py
+    python -m vmprof -o platform.vmprof scripts/profile_platform.py
+
+The saved .prof file opens in SnakeViz (snakeviz competition.prof).
+"""
+
+import sys
+import argparse
+import cProfile
+import pstats
+import tempfile
+from pathlib import Path
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from student_platform import StudentPlatform
+
+# Synthetic submissions differ only in their move priority
+MOVE_PRIORITIES = [
+    ["UP", "LEFT", "DOWN", "RIGHT"],
+    ["LEFT", "UP", "RIGHT", "DOWN"],
+    ["DOWN", "LEFT", "UP", "RIGHT"],
+    ["RIGHT", "DOWN", "LEFT", "UP"],
+]
+
+SUBMISSION_TEMPLATE = '''
+from algorithms.base_algorithm import AlgorithmMetadata, AlgorithmType
+from algorithms.basic.algorithm import BasicPriorityAlgorithm
+
+class ProfiledAlgorithm(BasicPriorityAlgorithm):
+    """Synthetic profiling submission"""
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault('move_priority', {priority!r})
+        super().__init__(**kwargs)
+
+    def _get_metadata(self):
+        return AlgorithmMetadata(
+            name="Profile Submission {index}",
+            version="1.0",
+            author="profile_platform",
+            description="Synthetic submission for platform profiling",
+            algorithm_type=AlgorithmType.STUDENT_SUBMISSION,
+            parameters={{'move_priority': {priority!r}}}
+        )
+
+ALGORITHM = ProfiledAlgorithm
+'''
+
+def build_platform(platform_dir: Path, submissions: int, games: int, max_moves: int) -> StudentPlatform:
+    """Create a platform holding the synthetic submissions"""
+    platform = StudentPlatform(str(platform_dir))
+    platform.test_games_per_submission = games
+    platform.max_moves_per_game = max_moves
+
+    source_dir = platform_dir / "sources"
+    source_dir.mkdir(exist_ok=True)
+    for i in range(submissions):
+        source = source_dir / f"profile_{i:02d}.py"
+        priority = MOVE_PRIORITIES[i % len(MOVE_PRIORITIES)]
+        source.write_text(SUBMISSION_TEMPLATE.format(index=i, priority=priority))
+        platform.submit_algorithm(f"profile_{i:02d}", str(source))
+
+    return platform
+
+def profile_competition(platform: StudentPlatform, output: str, top: int):
+    """Run one competition under cProfile, save the stats and print the top cumulative entries"""
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        platform.run_competition("profile_run")
+    finally:
+        profiler.disable()
+
+    profiler.dump_stats(output)
+    print(f"\n📊 TOP {top} FUNCTIONS BY CUMULATIVE TIME")
+    print("=" * 60)
+    pstats.Stats(output).sort_stats("cumulative").print_stats(top)
+    print(f"📁 Profile saved to: {output}")
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Profile a synthetic student competition")
+    parser.add_argument("--submissions", type=int, default=10,
+                       help="Number of synthetic submissions")
+    parser.add_argument("--games", type=int, default=5,
+                       help="Test games per submission")
+    parser.add_argument("--max-moves", type=int, default=100,
+                       help="Move limit per game")
+    parser.add_argument("--platform-dir",
+                       help="Platform data directory (default: a new temporary directory)")
+    parser.add_argument("--output", default="competition.prof",
+                       help="cProfile stats file")
+    parser.add_argument("--top", type=int, default=20,
+                       help="Number of functions to print")
+
+    args = parser.parse_args()
+
+    platform_dir = Path(args.platform_dir or tempfile.mkdtemp(prefix="profile_platform_"))
+    print("🔬 STUDENT PLATFORM PROFILE")
+    print("=" * 60)
+    print(f"📝 {args.submissions} submissions x {args.games} games, {args.max_moves} max moves")
+    print(f"📁 Platform data: {platform_dir}")
+
+    platform = build_platform(platform_dir, args.submissions, args.games, args.max_moves)
+    try:
+        profile_competition(platform, args.output, args.top)
+    finally:
+        platform.close()
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,6 @@ Quick weight comparison test - shorter games to compare configurations efficient
 
 import sys
 from pathlib import Path
-import copy
 import time
 
 # Add project root to path
@@ -50,7 +49,7 @@ def quick_weight_comparison():
 
         try:
             # Set weights
-            bot.strategy.weights = copy.deepcopy(weights)
+            bot.strategy.weights = dict(weights)
 
             # Connect and play short game
             if bot.connect_to_game():
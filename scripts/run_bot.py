@@ -5,9 +5,13 @@ Main entry point for production 2048 bot execution
 """
 
 import sys
+import os
+import time
 import argparse
 import json
+import functools
 from pathlib import Path
+from typing import Optional
 
 # Add project root to path
 sys.path.append(str(Path(__file__).parent.parent))
@@ -15,11 +19,23 @@ sys.path.append(str(Path(__file__).parent.parent))
 from complete_2048_bot import Complete2048Bot
 from production.performance_monitor import PerformanceMonitor
 
+# orjson is optional; the standard json module is used without it
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(config_path: str, mtime: float) -> dict:
+    """Parse a config file; mtime is part of the cache key so edits are picked up"""
+    data = Path(config_path).read_bytes()
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
 def load_config(config_path: str) -> dict:
-    """Load configuration from JSON file"""
+    """Load configuration from JSON file (cached until the file changes; treat as read-only)"""
     try:
-        with open(config_path, 'r') as f:
-            return json.load(f)
+        return _load_config_cached(config_path, os.path.getmtime(config_path))
     except FileNotFoundError:
         print(f"⚠️ Config file not found: {config_path}")
         return get_default_config()
@@ -45,8 +61,8 @@ def get_default_config() -> dict:
         }
     }
 
-def run_production_bot(config: dict, games: int = 1):
-    """Run bot in production mode"""
+def run_production_bot(config: dict, games: int = 1, tt_cache: Optional[str] = None):
+    """Run bot in production mode, optionally warming the strategy from a saved transposition table"""
     print("🚀 PRODUCTION 2048 BOT")
     print("=" * 50)
     print(f"🎯 Games to play: {games}")
@@ -68,22 +84,27 @@ def run_production_bot(config: dict, games: int = 1):
     results = []
     successful_games = 0
 
+    # One bot (and browser) serves every game; only the page is reset between games
+    bot_config = config.get('bot', {})
+    bot = None
+
     try:
+        bot = Complete2048Bot(
+            headless=bot_config.get('headless', True),
+            debug=bot_config.get('debug', False),
+            log_level=bot_config.get('log_level', 'INFO')
+        )
+
+        if tt_cache and bot.strategy.load_tt(tt_cache):
+            print(f"🧠 Transposition table loaded from {tt_cache}")
+
         for game_num in range(games):
             print(f"\n🎮 Game {game_num + 1}/{games}")
             print("-" * 30)
 
-            # Initialize bot with config
-            bot_config = config.get('bot', {})
-            bot = Complete2048Bot(
-                headless=bot_config.get('headless', True),
-                debug=bot_config.get('debug', False),
-                log_level=bot_config.get('log_level', 'INFO')
-            )
-
             try:
-                # Connect to game
-                if bot.connect_to_game():
+                # Connects on the first game, reloads the page afterwards
+                if bot.reset_for_new_game():
                     # Play game
                     game_result = bot.play_autonomous_game(
                         max_moves=bot_config.get('max_moves', 200)
@@ -110,9 +131,6 @@ def run_production_bot(config: dict, games: int = 1):
             except Exception as e:
                 print(f"❌ Game {game_num + 1} failed: {e}")
 
-            finally:
-                bot.cleanup()
-
         # Summary
         print(f"\n{'='*50}")
         print("📊 PRODUCTION RUN SUMMARY")
@@ -151,6 +169,11 @@ def run_production_bot(config: dict, games: int = 1):
             print(f"   📁 Detailed report: {report_file}")
 
     finally:
+        if bot:
+            if tt_cache:
+                bot.strategy.save_tt(tt_cache)
+                print(f"💾 Transposition table saved to {tt_cache}")
+            bot.cleanup()
         if monitor:
             monitor.stop_monitoring()
 
@@ -165,6 +188,8 @@ def main():
                        help="Number of games to play")
     parser.add_argument("--production", action="store_true",
                        help="Use production defaults")
+    parser.add_argument("--tt-cache",
+                       help="Load/save the strategy transposition table at this path")
 
     args = parser.parse_args()
 
@@ -181,14 +206,12 @@ def main():
     Path("reports").mkdir(exist_ok=True)
 
     # Run production bot
-    import time
-    results = run_production_bot(config, args.games)
+    results = run_production_bot(config, args.games, args.tt_cache)
 
     print(f"\n🎉 Production run completed!")
     return len([r for r in results if r.get('final_score', 0) > 0]) > 0
 
 if __name__ == "__main__":
-    import time
     success = main()
     exit_code = 0 if success else 1
     sys.exit(exit_code)
\ No newline at end of file
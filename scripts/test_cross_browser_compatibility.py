@@ -6,15 +6,36 @@ Tests Chromium, Firefox, and WebKit browser engines
 
 import sys
 from pathlib import Path
-import time
 import copy
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 
 # Add project root to path
 sys.path.append(str(Path(__file__).parent))
 
 from core.playwright_controller import PlaywrightController
 from core.vision import BoardVision
-from core.strategy import BasicStrategy
+from production.error_handler import retry_on_failure
+
+# Vision holds no per-browser state; each worker process builds it once at import
+_VISION = BoardVision()
+
+def installed_engines(pw, browser_names: list) -> list:
+    """Engines whose Playwright browser build is installed, checked without launching them"""
+    installed = []
+    for name in browser_names:
+        try:
+            if Path(getattr(pw, name).executable_path).exists():
+                installed.append(name)
+                continue
+        except Exception:
+            pass
+        print(f"⏭️ Skipping {name}: browser not installed (run: playwright install {name})")
+    return installed
+
+def _copy_or_none(array):
+    """Copy an optional array"""
+    return None if array is None else array.copy()
 
 def test_browser_engine(browser_name: str):
     """Test 2048 bot functionality with specific browser engine"""
@@ -26,8 +47,6 @@ def test_browser_engine(browser_name: str):
         browser_type=browser_name.lower(),
         headless=False  # Visible testing as requested
     )
-    vision = BoardVision()
-    strategy = BasicStrategy()
 
     test_results = {
         'browser': browser_name,
@@ -42,10 +61,11 @@ def test_browser_engine(browser_name: str):
     try:
         # Test 1: Browser connection
         print(f"🌐 Testing {browser_name} connection to 2048game.com...")
-        if controller.connect():
+        # Transient connect failures are retried with backoff instead of failing the engine
+        if retry_on_failure(controller.connect)():
             test_results['connection'] = True
             print(f"✅ {browser_name} connected successfully")
-            time.sleep(2)  # Allow page to load
+            controller.wait_for_board_stable()
         else:
             print(f"❌ {browser_name} connection failed")
             return test_results
@@ -62,7 +82,7 @@ def test_browser_engine(browser_name: str):
 
         # Test 3: Vision system compatibility
         print(f"👁️ Testing {browser_name} vision system compatibility...")
-        analysis_result = vision.analyze_board(screenshot)
+        analysis_result = _VISION.analyze_board(screenshot)
         if analysis_result and 'board_state' in analysis_result:
             board_state = analysis_result['board_state']
             if board_state is not None and len(board_state) == 4:
@@ -81,22 +101,31 @@ def test_browser_engine(browser_name: str):
         test_moves = ['ArrowUp', 'ArrowLeft', 'ArrowDown']
         moves_successful = 0
 
+        # The board after one move is the board before the next, so each
+        # move only needs its after screenshot analysed
+        before_board = board_state
+        before_crop = _copy_or_none(controller.get_board_crop(screenshot))
+        frame = screenshot  # Analysed already, so its buffer can be reused
+
         for i, move in enumerate(test_moves):
             print(f"   Testing move {i+1}: {move}")
 
-            # Take before screenshot
-            before_screenshot = controller.take_screenshot()
-            before_analysis = vision.analyze_board(before_screenshot)
-            before_board = before_analysis.get('board_state') if before_analysis else None
-
             # Execute move
             if controller.send_key(move):
-                time.sleep(1.5)  # Wait for animation
+                controller.wait_for_board_stable()
+
+                # Take after screenshot, decoding into the previous frame's buffer
+                after_screenshot = controller.take_screenshot(out=frame)
+                if after_screenshot is not None:
+                    frame = after_screenshot
+                after_crop = controller.get_board_crop(after_screenshot)
 
-                # Take after screenshot
-                after_screenshot = controller.take_screenshot()
-                after_analysis = vision.analyze_board(after_screenshot)
-                after_board = after_analysis.get('board_state') if after_analysis else None
+                # Identical board pixels mean an identical board, so skip the vision pass
+                if before_crop is not None and after_crop is not None and np.array_equal(before_crop, after_crop):
+                    after_board = before_board
+                else:
+                    after_analysis = _VISION.analyze_board(after_screenshot) if after_screenshot is not None else None
+                    after_board = after_analysis.get('board_state') if after_analysis else None
 
                 # Check if board changed
                 if before_board != after_board:
@@ -104,6 +133,9 @@ def test_browser_engine(browser_name: str):
                     print(f"   ✅ Move {i+1} successful - board changed")
                 else:
                     print(f"   ⚠️ Move {i+1} - board unchanged (may be valid)")
+
+                before_board = after_board
+                before_crop = _copy_or_none(after_crop)  # The frame buffer is overwritten next move
             else:
                 print(f"   ❌ Move {i+1} failed to execute")
 
@@ -120,7 +152,6 @@ def test_browser_engine(browser_name: str):
 
     finally:
         controller.cleanup()
-        time.sleep(2)  # Brief pause between browser tests
 
     return test_results
 
@@ -129,15 +160,28 @@ def run_comprehensive_browser_test():
     print("🧪 CROSS-BROWSER COMPATIBILITY TEST")
     print("=" * 60)
     print("🖥️ Testing 2048 bot with all Playwright browser engines")
-    print("⏱️ This will test each browser sequentially with visible windows")
+    print("⏱️ This will test all browsers in parallel with visible windows")
     print("")
 
-    browsers_to_test = ['chromium', 'firefox', 'webkit']
-    results = []
+    from playwright.sync_api import sync_playwright
+
+    with sync_playwright() as pw:
+        browsers_to_test = installed_engines(pw, ['chromium', 'firefox', 'webkit'])
+    if not browsers_to_test:
+        print("❌ No Playwright browsers installed")
+        return []
 
-    for browser in browsers_to_test:
-        result = test_browser_engine(browser)
-        results.append(result)
+    # Each engine gets its own process, so the tests no longer wait on each other
+    with ProcessPoolExecutor(max_workers=len(browsers_to_test)) as executor:
+        results = list(executor.map(test_browser_engine, browsers_to_test))
+
+    print_compatibility_report(results)
+    return results
+
+def print_compatibility_report(results: list) -> bool:
+    """Print per-browser summaries and the comparison table; True if every browser passed"""
+    for result in results:
+        browser = result['browser']
 
         # Brief summary
         success_count = sum([
@@ -148,10 +192,6 @@ def run_comprehensive_browser_test():
         ])
         print(f"📊 {browser.upper()} Summary: {success_count}/4 tests passed")
 
-        if browser != browsers_to_test[-1]:  # Not the last browser
-            print(f"\n⏳ Waiting 3 seconds before testing next browser...")
-            time.sleep(3)
-
     # Final comparison report
     print(f"\n{'='*60}")
     print("📊 CROSS-BROWSER COMPATIBILITY RESULTS")
@@ -192,7 +232,7 @@ def run_comprehensive_browser_test():
         print("⚠️ SOME COMPATIBILITY ISSUES DETECTED")
         print("   Review failed tests above for browser-specific issues")
 
-    return results
+    return all_compatible
 
 if __name__ == "__main__":
     run_comprehensive_browser_test()
\ No newline at end of file
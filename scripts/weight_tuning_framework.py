@@ -5,8 +5,11 @@ Tests different heuristic weight configurations with visible gameplay
 """
 
 import sys
+import shutil
+import tempfile
 from pathlib import Path
-import copy
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Optional
 
 # Add project root to path
 sys.path.append(str(Path(__file__).parent))
@@ -63,8 +66,18 @@ class WeightTuningFramework:
             }
         }
 
-    def test_weight_configuration(self, config_name: str, max_moves: int = 100):
-        """Test a specific weight configuration with visible gameplay"""
+    def test_weight_configuration(self, config_name: str, max_moves: int = 100,
+                                  headless: bool = False, worker_id: Optional[int] = None):
+        """
+        Test a specific weight configuration
+
+        Args:
+            config_name: Key into weight_configurations
+            max_moves: Move limit for the test game
+            headless: Run the browser without a window
+            worker_id: Set when running alongside other configurations; the bot then
+                       writes its screenshots to a private scratch directory
+        """
         print(f"\n🎯 TESTING CONFIGURATION: {config_name.upper()}")
         print("=" * 60)
 
@@ -73,15 +86,20 @@ class WeightTuningFramework:
         for key, value in weights.items():
             print(f"   {key}: {value}")
 
-        # Create bot with visible browser
+        # Concurrent bots must not share (or clean up) each other's screenshot files
+        scratch_dir = None
+        if worker_id is not None:
+            scratch_dir = tempfile.mkdtemp(prefix=f"weight_tuning_{worker_id}_")
+
         bot = Complete2048Bot(
-            headless=False,  # Always visible as requested
-            debug=True
+            headless=headless,
+            debug=True,
+            screenshot_dir=scratch_dir
         )
 
         try:
             # Update strategy weights
-            bot.strategy.weights = copy.deepcopy(weights)
+            bot.strategy.weights = dict(weights)
 
             print(f"\n🌐 Connecting to game...")
             if not bot.connect_to_game():
@@ -129,30 +147,47 @@ class WeightTuningFramework:
             return None
         finally:
             bot.cleanup()
+            if scratch_dir:
+                shutil.rmtree(scratch_dir, ignore_errors=True)
+
+    def run_weight_comparison(self, max_moves_per_test: int = 50, headless: bool = True):
+        """
+        Run comparison tests across different weight configurations
+
+        Each configuration plays in its own worker process and browser, so total
+        time is roughly that of the slowest game. Visible mode is only practical
+        for watching a single configuration, so the comparison defaults to headless.
+        """
+        configs = ["baseline", "empty_focus", "balanced_optimized", "merge_focused"]
 
-    def run_weight_comparison(self, max_moves_per_test: int = 50):
-        """Run comparison tests across different weight configurations"""
         print("🧪 HEURISTIC WEIGHT TUNING COMPARISON")
         print("=" * 70)
-        print("🖥️  All tests running in VISIBLE mode")
+        print(f"🖥️  {len(configs)} tests running in parallel ({'HEADLESS' if headless else 'VISIBLE'} mode)")
         print(f"⏱️  Max {max_moves_per_test} moves per test for quick comparison")
         print("")
 
         results = []
         baseline_efficiency = None
 
-        for config_name in ["baseline", "empty_focus", "balanced_optimized", "merge_focused"]:
-            print(f"\n{'='*70}")
-            result = self.test_weight_configuration(config_name, max_moves_per_test)
+        with ProcessPoolExecutor(max_workers=len(configs)) as executor:
+            futures = {
+                executor.submit(self.test_weight_configuration, config_name, max_moves_per_test,
+                                headless=headless, worker_id=i): config_name
+                for i, config_name in enumerate(configs)
+            }
 
-            if result:
-                results.append(result)
-                if config_name == "baseline":
-                    baseline_efficiency = result['efficiency']
+            for future in as_completed(futures):
+                config_name = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    print(f"\n❌ {config_name} worker failed: {e}")
+                    continue
 
-            print(f"\n⏳ Waiting 3 seconds before next test...")
-            import time
-            time.sleep(3)
+                if result:
+                    results.append(result)
+                    if config_name == "baseline":
+                        baseline_efficiency = result['efficiency']
 
         # Performance comparison
         print(f"\n{'='*70}")
@@ -166,6 +201,7 @@ class WeightTuningFramework:
             print(f"{'Rank':<5} {'Configuration':<20} {'Efficiency':<12} {'Score':<8} {'Tile':<6} {'Improvement':<12}")
             print("-" * 70)
 
+            rows = []
             for i, result in enumerate(results, 1):
                 config = result['config_name']
                 efficiency = result['efficiency']
@@ -178,7 +214,8 @@ class WeightTuningFramework:
                 else:
                     improvement_str = "N/A"
 
-                print(f"{i:<5} {config:<20} {efficiency:<12.3f} {score:<8} {tile:<6} {improvement_str:<12}")
+                rows.append(f"{i:<5} {config:<20} {efficiency:<12.3f} {score:<8} {tile:<6} {improvement_str:<12}")
+            print("\n".join(rows))
 
             best_config = results[0]
             print(f"\n🏆 BEST CONFIGURATION: {best_config['config_name'].upper()}")
@@ -196,7 +233,7 @@ def main():
     print("🎯 2048 STRATEGY WEIGHT TUNING FRAMEWORK")
     print("=" * 50)
     print("🔧 Optimizing heuristic weights for maximum performance")
-    print("🖥️  All gameplay will be visible in browser window")
+    print("🖥️  Configurations run in parallel headless browsers")
     print("")
 
     # Run comparison with shorter games for quick testing
@@ -4,24 +4,239 @@ Student Competition Platform
 Educational platform for algorithm development and competition
 """
 
+import os
 import sys
+import multiprocessing
+import multiprocessing.util
 from pathlib import Path
 import time
 import json
 import shutil
+import sqlite3
+import tempfile
 import importlib.util
+from types import ModuleType
 from typing import Dict, List, Any, Optional, Tuple
 import logging
 from dataclasses import dataclass, asdict
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 # Add project root to path
 sys.path.append(str(Path(__file__).parent))
 
-from enhanced_2048_bot import Enhanced2048Bot
 from algorithms import AlgorithmManager, BaseAlgorithm
+from student_platform_hot import aggregate_games, rank_entries
+
+# orjson is optional; fall back to the stdlib encoder when it is missing
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _dumps_json(data: Any) -> bytes:
+    """Compact JSON encoding of one value"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data, default=str).encode()
+
+def _write_json(path: Path, data: Dict[str, Any]):
+    """Write data as indented JSON; datetimes are stored as ISO strings either way"""
+    if ORJSON_AVAILABLE:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2, default=str)
+
+# Interpreter for game workers; lets the platform itself run under PyPy while
+# the browser and OpenCV stack stays on CPython
+GAME_PYTHON_ENV = "JED2048_GAME_PYTHON"
+
+def _game_pool(max_workers: int) -> ProcessPoolExecutor:
+    """Process pool for test games, spawned with $JED2048_GAME_PYTHON when it is set"""
+    game_python = os.environ.get(GAME_PYTHON_ENV)
+    if not game_python:
+        return ProcessPoolExecutor(max_workers=max_workers)
+
+    context = multiprocessing.get_context("spawn")
+    context.set_executable(game_python)
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=context)
+
+# Test games each game worker plays in turn; later games reuse the worker's
+# browser through reset_for_new_game() instead of launching a new one
+GAMES_PER_WORKER = 2
+
+def _game_worker_count(games: int, budget: int) -> int:
+    """Game workers for one submission: within budget, each playing about GAMES_PER_WORKER games"""
+    return max(1, min(budget, -(-games // GAMES_PER_WORKER)))
+
+# Bots owned by this game worker process, one per algorithm, kept between games
+_worker_bots: Dict[str, Any] = {}
+
+def _cleanup_worker_bots():
+    """Close every bot this worker process kept alive"""
+    for bot in _worker_bots.values():
+        bot.cleanup()
+        shutil.rmtree(bot.screenshot_dir, ignore_errors=True)
+    _worker_bots.clear()
+
+def _worker_bot(algorithm_id: str):
+    """
+    Return this worker's connected bot for algorithm_id, ready for a new game
+
+    The browser is launched once per worker process; later games only reload
+    the game page. Returns None if the bot could not connect.
+    """
+    # Imported here so the orchestrating process never loads the bot's
+    # CPython-only dependencies (OpenCV, Playwright)
+    from enhanced_2048_bot import Enhanced2048Bot
+
+    bot = _worker_bots.get(algorithm_id)
+    if bot is not None:
+        return bot if bot.reset_for_new_game() else None
+
+    if not _worker_bots:
+        # Workers exit through multiprocessing, which skips atexit but runs its finalizers
+        multiprocessing.util.Finalize(None, _cleanup_worker_bots, exitpriority=10)
+
+    # Games run side by side, so each bot keeps its screenshots to itself
+    bot = Enhanced2048Bot(
+        headless=True,  # Fast testing
+        debug=False,
+        algorithm_id=algorithm_id,
+        screenshot_dir=tempfile.mkdtemp(prefix="student_game_")
+    )
+    _worker_bots[algorithm_id] = bot
+    return bot if bot.connect_to_game() else None
+
+def _run_single_game(algorithm_id: str, max_moves: int) -> Optional[Dict[str, Any]]:
+    """Play one headless test game in a worker process; None if the game never connected"""
+    bot = _worker_bot(algorithm_id)
+    if bot is None:
+        return None
+    return bot.play_autonomous_game(max_moves=max_moves)
+
+def _is_algorithm_class(attr) -> bool:
+    """True for concrete BaseAlgorithm subclasses"""
+    return isinstance(attr, type) and issubclass(attr, BaseAlgorithm) and attr != BaseAlgorithm
+
+def _find_algorithm_class(module) -> Optional[type]:
+    """
+    Return the algorithm class of a loaded submission module
+
+    Submissions name their class with a top-level ``ALGORITHM = MyAlgorithm``.
+    Older submissions without it fall back to scanning the module for the
+    first BaseAlgorithm subclass.
+    """
+    declared = getattr(module, 'ALGORITHM', None)
+    if _is_algorithm_class(declared):
+        return declared
+
+    for attr_name in dir(module):
+        attr = getattr(module, attr_name)
+        if _is_algorithm_class(attr):
+            return attr
+    return None
+
+def _load_submission_module(submission_id: str, file_path: str) -> Optional[ModuleType]:
+    """Import a submission file as a standalone module; None if it is not importable Python"""
+    spec = importlib.util.spec_from_file_location(f"student_{submission_id}", file_path)
+    if not spec or not spec.loader:
+        return None
+
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def _play_test_games(algorithm_id: str, games: int, max_moves: int, student_name: str,
+                     max_workers: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Play a submission's test games in parallel worker processes and aggregate the results
+
+    Args:
+        max_workers: Most game workers (and so browsers) for this submission; defaults
+                     to the CPU count. Callers testing several submissions at once pass
+                     their share of the cores. The pool is kept below the game count
+                     so workers reuse their browser across games.
+    """
+    logger = logging.getLogger("student_platform")
+    game_results = []
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = _game_worker_count(games, max_workers)
+    with _game_pool(max_workers) as executor:
+        futures = [
+            executor.submit(_run_single_game, algorithm_id, max_moves)
+            for _ in range(games)
+        ]
+
+        for game_num, future in enumerate(futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                logger.error(f"Game {game_num + 1} failed for {student_name}: {e}")
+                continue
+
+            if result:
+                game_results.append(result)
 
-@dataclass
+    # Calculate performance metrics
+    return aggregate_games(game_results)
+
+def _test_one_submission(file_path: str, submission_id: str, games: int, max_moves: int,
+                         game_workers: Optional[int] = None) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """
+    Load and test one submission inside a worker process
+
+    The algorithm is imported here rather than pickled from the parent.
+    Test results are None when no algorithm class could be loaded.
+    game_workers caps this submission's game pool (see _play_test_games).
+    """
+    module = _load_submission_module(submission_id, file_path)
+    if module is None or not _find_algorithm_class(module):
+        return submission_id, None
+
+    algorithm_id = f"student_{submission_id}"
+    return submission_id, _play_test_games(algorithm_id, games, max_moves, submission_id,
+                                           max_workers=game_workers)
+
+# Platform state lives in SQLite so a new submission or leaderboard is a row-level write
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS submissions (
+    id TEXT PRIMARY KEY,
+    student TEXT NOT NULL,
+    algorithm TEXT NOT NULL,
+    file_path TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    validated INTEGER NOT NULL DEFAULT 0,
+    performance_score REAL,
+    ranking INTEGER
+);
+CREATE TABLE IF NOT EXISTS leaderboard (
+    rank INTEGER NOT NULL,
+    submission_id TEXT NOT NULL,
+    student TEXT NOT NULL,
+    algorithm TEXT NOT NULL,
+    efficiency REAL NOT NULL,
+    average_score REAL NOT NULL,
+    highest_tile INTEGER NOT NULL,
+    games_completed INTEGER NOT NULL,
+    submission_date TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_submissions_student ON submissions (student);
+CREATE INDEX IF NOT EXISTS idx_leaderboard_rank ON leaderboard (rank);
+"""
+
+# Competition leaderboard row; fields are projected from a leaderboard entry
+ROW_FMT = "{rank:<5} {student:<15} {algorithm:<20} {efficiency:<12.2f} {tile:<12}"
+
+# Slotted dataclasses need Python 3.10+
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_OPTIONS)
 class StudentSubmission:
     """Student algorithm submission"""
     student_name: str
@@ -33,7 +248,20 @@ class StudentSubmission:
     performance_score: Optional[float] = None
     ranking: Optional[int] = None
 
-@dataclass
+    def to_dict(self) -> Dict[str, Any]:
+        """Flat field dict, built directly instead of through the recursive asdict walk"""
+        return {
+            'student_name': self.student_name,
+            'algorithm_name': self.algorithm_name,
+            'submission_id': self.submission_id,
+            'file_path': self.file_path,
+            'timestamp': self.timestamp,
+            'validated': self.validated,
+            'performance_score': self.performance_score,
+            'ranking': self.ranking
+        }
+
+@dataclass(**_DATACLASS_OPTIONS)
 class CompetitionResults:
     """Competition results data"""
     competition_id: str
@@ -62,6 +290,7 @@ class StudentPlatform:
         self.submissions_dir = self.platform_dir / "submissions"
         self.results_dir = self.platform_dir / "results"
         self.leaderboard_file = self.platform_dir / "leaderboard.json"
+        self.db_file = self.platform_dir / "platform.db"
 
         # Create directories
         self.platform_dir.mkdir(exist_ok=True)
@@ -73,6 +302,14 @@ class StudentPlatform:
         self.submissions: List[StudentSubmission] = []
         self.leaderboard: List[Dict[str, Any]] = []
 
+        # Loaded submission modules and their algorithm classes, keyed by (file_path, mtime)
+        self._module_cache: Dict[Tuple[str, float], Optional[ModuleType]] = {}
+        self._class_cache: Dict[Tuple[str, float], Optional[type]] = {}
+
+        # Top-N leaderboard views, keyed by (leaderboard version, limit)
+        self._leaderboard_version = 0
+        self._leaderboard_views: Dict[Tuple[int, int], List[Dict[str, Any]]] = {}
+
         # Competition settings
         self.test_games_per_submission = 5
         self.max_moves_per_game = 100
@@ -80,7 +317,9 @@ class StudentPlatform:
         # Setup logging
         self.logger = logging.getLogger("student_platform")
 
-        # Load existing data
+        # Open the platform database and load existing data
+        self._db = sqlite3.connect(str(self.db_file))
+        self._db.executescript(_SCHEMA)
         self._load_platform_data()
 
     def submit_algorithm(self, student_name: str, algorithm_file: str,
@@ -113,44 +352,19 @@ class StudentPlatform:
                 'error': f"Algorithm file not found: {algorithm_file}"
             }
 
-        # Copy to submissions directory
-        submission_file = self.submissions_dir / f"{submission_id}.py"
-        try:
-            shutil.copy2(algorithm_path, submission_file)
-        except Exception as e:
-            return {
-                'success': False,
-                'error': f"Failed to copy submission: {e}"
-            }
-
-        # Create submission record
+        # Create submission record, validated in place before anything is copied
         submission = StudentSubmission(
             student_name=student_name,
             algorithm_name=algorithm_name,
             submission_id=submission_id,
-            file_path=str(submission_file),
+            file_path=str(algorithm_path),
             timestamp=timestamp
         )
 
         # Validate submission
         validation_result = self._validate_submission(submission)
 
-        if validation_result['valid']:
-            submission.validated = True
-            self.submissions.append(submission)
-            self._save_platform_data()
-
-            print(f"✅ Submission accepted: {submission_id}")
-            return {
-                'success': True,
-                'submission_id': submission_id,
-                'validation': validation_result,
-                'message': 'Algorithm submitted successfully and validated'
-            }
-        else:
-            # Remove invalid submission file
-            submission_file.unlink(missing_ok=True)
-
+        if not validation_result['valid']:
             print(f"❌ Submission rejected: {validation_result['error']}")
             return {
                 'success': False,
@@ -158,6 +372,30 @@ class StudentPlatform:
                 'validation_details': validation_result
             }
 
+        # Copy to submissions directory
+        submission_file = self.submissions_dir / f"{submission_id}.py"
+        try:
+            shutil.copy2(algorithm_path, submission_file)
+        except Exception as e:
+            return {
+                'success': False,
+                'error': f"Failed to copy submission: {e}"
+            }
+        self._move_cache_entries(submission.file_path, str(submission_file))
+
+        submission.file_path = str(submission_file)
+        submission.validated = True
+        self.submissions.append(submission)
+        self._save_submission(submission)
+
+        print(f"✅ Submission accepted: {submission_id}")
+        return {
+            'success': True,
+            'submission_id': submission_id,
+            'validation': validation_result,
+            'message': 'Algorithm submitted successfully and validated'
+        }
+
     def _validate_submission(self, submission: StudentSubmission) -> Dict[str, Any]:
         """
         Validate student submission
@@ -170,29 +408,14 @@ class StudentPlatform:
         """
         try:
             # Load the submitted module
-            spec = importlib.util.spec_from_file_location(
-                f"student_{submission.submission_id}",
-                submission.file_path
-            )
-
-            if not spec or not spec.loader:
+            if self._load_module_cached(submission) is None:
                 return {
                     'valid': False,
                     'error': 'Invalid Python file format'
                 }
 
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-
             # Look for algorithm class
-            algorithm_class = None
-            for attr_name in dir(module):
-                attr = getattr(module, attr_name)
-                if (isinstance(attr, type) and
-                    issubclass(attr, BaseAlgorithm) and
-                    attr != BaseAlgorithm):
-                    algorithm_class = attr
-                    break
+            algorithm_class = self._load_algorithm_class_cached(submission)
 
             if not algorithm_class:
                 return {
@@ -241,12 +464,17 @@ class StudentPlatform:
                 'error': f'Failed to load submission: {e}'
             }
 
-    def run_competition(self, competition_name: str = None) -> CompetitionResults:
+    def run_competition(self, competition_name: str = None,
+                        max_workers: Optional[int] = None) -> CompetitionResults:
         """
         Run competition with all validated submissions
 
         Args:
             competition_name: Optional competition identifier
+            max_workers: Submissions tested at once (default: one per submission, up to
+                         the CPU count). The cores are split between them, so each
+                         submission plays its games on about cpu_count // max_workers
+                         browsers and the total stays near the CPU count
 
         Returns:
             Competition results
@@ -275,33 +503,42 @@ class StudentPlatform:
         print(f"🎮 {self.max_moves_per_game} max moves per game")
         print()
 
-        # Test each submission
+        # Test submissions in parallel; each worker loads its own copy of the algorithm
         results = []
+        if max_workers is None:
+            max_workers = min(len(validated_submissions), os.cpu_count() or 1)
+        game_workers = max(1, (os.cpu_count() or 1) // max_workers)
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    _test_one_submission,
+                    submission.file_path,
+                    submission.submission_id,
+                    self.test_games_per_submission,
+                    self.max_moves_per_game,
+                    game_workers
+                ): submission
+                for submission in validated_submissions
+            }
 
-        for i, submission in enumerate(validated_submissions, 1):
-            print(f"🧪 Testing {i}/{len(validated_submissions)}: {submission.student_name}")
+            for i, future in enumerate(as_completed(futures), 1):
+                submission = futures[future]
+                print(f"🧪 Tested {i}/{len(validated_submissions)}: {submission.student_name}")
 
-            # Load algorithm
-            try:
-                algorithm_class = self._load_algorithm_class(submission)
-                if not algorithm_class:
-                    print(f"   ❌ Failed to load algorithm")
+                try:
+                    _, submission_results = future.result()
+                except Exception as e:
+                    print(f"   ❌ Testing failed: {e}")
                     continue
 
-                # Register and test algorithm
-                algorithm_id = f"student_{submission.submission_id}"
-                self.algorithm_manager.register_algorithm(algorithm_class, override=True)
+                if submission_results is None:
+                    print(f"   ❌ Failed to load algorithm")
+                    continue
 
-                # Run test games
-                submission_results = self._test_submission(algorithm_id, submission)
                 results.append((submission, submission_results))
-
                 print(f"   ✅ Completed: {submission_results['average_efficiency']:.2f} avg efficiency")
 
-            except Exception as e:
-                print(f"   ❌ Testing failed: {e}")
-                continue
-
         # Generate leaderboard
         leaderboard = self._generate_leaderboard(results)
 
@@ -320,7 +557,7 @@ class StudentPlatform:
 
         # Update leaderboard
         self.leaderboard = leaderboard
-        self._save_platform_data()
+        self._save_leaderboard()
 
         # Display results
         self._display_competition_results(competition_results)
@@ -328,77 +565,51 @@ class StudentPlatform:
         return competition_results
 
     def _test_submission(self, algorithm_id: str, submission: StudentSubmission) -> Dict[str, Any]:
-        """Test individual submission with multiple games"""
-        total_score = 0
-        total_moves = 0
-        highest_tiles = []
-        game_results = []
-
-        for game_num in range(self.test_games_per_submission):
-            try:
-                # Create bot with student algorithm
-                bot = Enhanced2048Bot(
-                    headless=True,  # Fast testing
-                    debug=False,
-                    algorithm_id=algorithm_id
-                )
-
-                if bot.connect_to_game():
-                    result = bot.play_autonomous_game(max_moves=self.max_moves_per_game)
-
-                    total_score += result.get('final_score', 0)
-                    total_moves += result.get('moves_completed', 0)
-                    highest_tiles.append(result.get('highest_tile', 0))
-                    game_results.append(result)
-
-                bot.cleanup()
-
-            except Exception as e:
-                self.logger.error(f"Game {game_num + 1} failed for {submission.student_name}: {e}")
-
-        # Calculate performance metrics
-        games_completed = len(game_results)
-        average_efficiency = total_score / max(total_moves, 1)
-        average_score = total_score / max(games_completed, 1)
-        max_tile = max(highest_tiles) if highest_tiles else 0
-
-        return {
-            'games_completed': games_completed,
-            'total_score': total_score,
-            'total_moves': total_moves,
-            'average_efficiency': average_efficiency,
-            'average_score': average_score,
-            'highest_tile': max_tile,
-            'game_results': game_results
-        }
+        """Test individual submission with multiple games, played in parallel worker processes"""
+        return _play_test_games(algorithm_id, self.test_games_per_submission,
+                                self.max_moves_per_game, submission.student_name)
 
     def _load_algorithm_class(self, submission: StudentSubmission):
         """Load algorithm class from submission file"""
         try:
-            spec = importlib.util.spec_from_file_location(
-                f"student_{submission.submission_id}",
-                submission.file_path
-            )
-
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-
-            # Find algorithm class
-            for attr_name in dir(module):
-                attr = getattr(module, attr_name)
-                if (isinstance(attr, type) and
-                    issubclass(attr, BaseAlgorithm) and
-                    attr != BaseAlgorithm):
-                    return attr
-
-            return None
+            return self._load_algorithm_class_cached(submission)
 
         except Exception as e:
             self.logger.error(f"Failed to load algorithm from {submission.file_path}: {e}")
             return None
 
-    def _generate_leaderboard(self, results: List[Tuple[StudentSubmission, Dict]]) -> List[Dict[str, Any]]:
-        """Generate leaderboard from competition results"""
+    def _load_module_cached(self, submission: StudentSubmission) -> Optional[ModuleType]:
+        """Import a submission once per file version; later calls are a dict lookup"""
+        key = (submission.file_path, os.path.getmtime(submission.file_path))
+        if key not in self._module_cache:
+            self._module_cache[key] = _load_submission_module(submission.submission_id, submission.file_path)
+        return self._module_cache[key]
+
+    def _load_algorithm_class_cached(self, submission: StudentSubmission) -> Optional[type]:
+        """Find a submission's algorithm class once per file version"""
+        key = (submission.file_path, os.path.getmtime(submission.file_path))
+        if key not in self._class_cache:
+            module = self._load_module_cached(submission)
+            self._class_cache[key] = _find_algorithm_class(module) if module else None
+        return self._class_cache[key]
+
+    def _move_cache_entries(self, src_path: str, dst_path: str):
+        """Re-key a validated module under its copied path; copy2 keeps the mtime, so it is still current"""
+        src_key = (src_path, os.path.getmtime(src_path))
+        dst_key = (dst_path, os.path.getmtime(dst_path))
+        for cache in (self._module_cache, self._class_cache):
+            if src_key in cache:
+                cache[dst_key] = cache.pop(src_key)
+
+    def _generate_leaderboard(self, results: List[Tuple[StudentSubmission, Dict]],
+                              top_k: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Generate leaderboard from competition results
+
+        Args:
+            results: (submission, test results) pairs
+            top_k: Keep only the best top_k entries (default: all)
+        """
         leaderboard = []
 
         for submission, test_results in results:
@@ -415,14 +626,8 @@ class StudentPlatform:
             }
             leaderboard.append(entry)
 
-        # Sort by average efficiency (descending)
-        leaderboard.sort(key=lambda x: x['average_efficiency'], reverse=True)
-
-        # Assign ranks
-        for i, entry in enumerate(leaderboard):
-            entry['rank'] = i + 1
-
-        return leaderboard
+        # Sort by average efficiency (descending) and assign ranks
+        return rank_entries(leaderboard, top_k)
 
     def _calculate_baseline_comparison(self, leaderboard: List[Dict]) -> Dict[str, float]:
         """Calculate comparison with baseline algorithms"""
@@ -460,14 +665,18 @@ class StudentPlatform:
         print(f"{'Rank':<5} {'Student':<15} {'Algorithm':<20} {'Efficiency':<12} {'Highest Tile':<12}")
         print("-" * 70)
 
-        for entry in results.leaderboard[:10]:  # Top 10
-            rank = entry['rank']
-            student = entry['student_name'][:14]
-            algorithm = entry['algorithm_name'][:19]
-            efficiency = f"{entry['average_efficiency']:.2f}"
-            tile = entry['highest_tile']
-
-            print(f"{rank:<5} {student:<15} {algorithm:<20} {efficiency:<12} {tile:<12}")
+        # Build the table once and write it with a single print
+        rows = [
+            ROW_FMT.format_map({
+                'rank': e['rank'],
+                'student': e['student_name'][:14],
+                'algorithm': e['algorithm_name'][:19],
+                'efficiency': e['average_efficiency'],
+                'tile': e['highest_tile']
+            })
+            for e in results.leaderboard[:10]  # Top 10
+        ]
+        print("\n".join(rows))
 
         # Baseline comparison
         if results.baseline_comparison:
@@ -484,66 +693,156 @@ class StudentPlatform:
         """Save competition results to file"""
         results_file = self.results_dir / f"{results.competition_id}.json"
 
-        results_data = {
+        header = {
             'competition_id': results.competition_id,
             'timestamp': results.timestamp.isoformat(),
             'submissions_count': len(results.submissions),
-            'leaderboard': results.leaderboard,
             'test_games': results.test_games,
             'baseline_comparison': results.baseline_comparison
         }
 
+        # Leaderboard rows are encoded one at a time instead of as one big document
         try:
-            with open(results_file, 'w') as f:
-                json.dump(results_data, f, indent=2)
+            with open(results_file, 'wb') as f:
+                f.write(_dumps_json(header)[:-1])
+                f.write(b', "leaderboard": [')
+                for i, entry in enumerate(results.leaderboard):
+                    f.write(b',\n  ' if i else b'\n  ')
+                    f.write(_dumps_json(entry))
+                f.write(b'\n]}\n')
         except Exception as e:
             self.logger.error(f"Failed to save competition results: {e}")
 
-    def _save_platform_data(self):
-        """Save platform state"""
+    def _save_submission(self, submission: StudentSubmission):
+        """Insert or update one submission row"""
         try:
-            platform_data = {
-                'submissions': [asdict(s) for s in self.submissions],
-                'leaderboard': self.leaderboard,
-                'last_updated': datetime.now().isoformat()
-            }
+            with self._db:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO submissions VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (submission.submission_id, submission.student_name, submission.algorithm_name,
+                     submission.file_path, submission.timestamp.isoformat(), int(submission.validated),
+                     submission.performance_score, submission.ranking)
+                )
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to save submission {submission.submission_id}: {e}")
 
-            with open(self.leaderboard_file, 'w') as f:
-                json.dump(platform_data, f, indent=2, default=str)
+    def _save_leaderboard(self):
+        """Replace the stored leaderboard in a single transaction"""
+        self._leaderboard_version += 1
+        self._leaderboard_views.clear()
 
-        except Exception as e:
-            self.logger.error(f"Failed to save platform data: {e}")
+        try:
+            with self._db:
+                self._db.execute("DELETE FROM leaderboard")
+                self._db.executemany(
+                    "INSERT INTO leaderboard VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    [(e['rank'], e['submission_id'], e['student_name'], e['algorithm_name'],
+                      e['average_efficiency'], e['average_score'], e['highest_tile'],
+                      e['games_completed'], e['submission_date'])
+                     for e in self.leaderboard]
+                )
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to save leaderboard: {e}")
 
     def _load_platform_data(self):
-        """Load existing platform data"""
+        """Load existing platform data, importing a legacy leaderboard.json on first run"""
         try:
-            if self.leaderboard_file.exists():
-                with open(self.leaderboard_file, 'r') as f:
-                    data = json.load(f)
-
-                # Load submissions
-                for sub_data in data.get('submissions', []):
-                    submission = StudentSubmission(
-                        student_name=sub_data['student_name'],
-                        algorithm_name=sub_data['algorithm_name'],
-                        submission_id=sub_data['submission_id'],
-                        file_path=sub_data['file_path'],
-                        timestamp=datetime.fromisoformat(sub_data['timestamp']),
-                        validated=sub_data.get('validated', False),
-                        performance_score=sub_data.get('performance_score'),
-                        ranking=sub_data.get('ranking')
-                    )
-                    self.submissions.append(submission)
-
-                # Load leaderboard
-                self.leaderboard = data.get('leaderboard', [])
+            submission_rows = self._db.execute(
+                "SELECT id, student, algorithm, file_path, timestamp, validated, performance_score, ranking "
+                "FROM submissions ORDER BY timestamp"
+            ).fetchall()
+
+            if not submission_rows and self.leaderboard_file.exists():
+                self._import_platform_json()
+                return
+
+            # Load submissions
+            for (submission_id, student, algorithm, file_path, timestamp,
+                 validated, performance_score, ranking) in submission_rows:
+                self.submissions.append(StudentSubmission(
+                    student_name=student,
+                    algorithm_name=algorithm,
+                    submission_id=submission_id,
+                    file_path=file_path,
+                    timestamp=datetime.fromisoformat(timestamp),
+                    validated=bool(validated),
+                    performance_score=performance_score,
+                    ranking=ranking
+                ))
+
+            # Load leaderboard
+            leaderboard_rows = self._db.execute(
+                "SELECT rank, student, algorithm, submission_id, efficiency, average_score, "
+                "highest_tile, games_completed, submission_date FROM leaderboard ORDER BY rank"
+            ).fetchall()
+            self.leaderboard = [
+                {
+                    'rank': rank,
+                    'student_name': student,
+                    'algorithm_name': algorithm,
+                    'submission_id': submission_id,
+                    'average_efficiency': efficiency,
+                    'average_score': average_score,
+                    'highest_tile': highest_tile,
+                    'games_completed': games_completed,
+                    'submission_date': submission_date
+                }
+                for (rank, student, algorithm, submission_id, efficiency, average_score,
+                     highest_tile, games_completed, submission_date) in leaderboard_rows
+            ]
 
         except Exception as e:
             self.logger.error(f"Failed to load platform data: {e}")
 
+    def _import_platform_json(self):
+        """Migrate platform state written by the JSON-backed platform into the database"""
+        if ORJSON_AVAILABLE:
+            data = orjson.loads(self.leaderboard_file.read_bytes())
+        else:
+            with open(self.leaderboard_file, 'r') as f:
+                data = json.load(f)
+
+        for sub_data in data.get('submissions', []):
+            submission = StudentSubmission(
+                student_name=sub_data['student_name'],
+                algorithm_name=sub_data['algorithm_name'],
+                submission_id=sub_data['submission_id'],
+                file_path=sub_data['file_path'],
+                timestamp=datetime.fromisoformat(sub_data['timestamp']),
+                validated=sub_data.get('validated', False),
+                performance_score=sub_data.get('performance_score'),
+                ranking=sub_data.get('ranking')
+            )
+            self.submissions.append(submission)
+            self._save_submission(submission)
+
+        self.leaderboard = data.get('leaderboard', [])
+        self._save_leaderboard()
+        self.logger.info(f"Imported {len(self.submissions)} submissions from {self.leaderboard_file}")
+
+    def export_platform_json(self, path: Optional[str] = None) -> Path:
+        """Write submissions and leaderboard to a JSON file for debugging (default: leaderboard.json)"""
+        export_file = Path(path) if path else self.leaderboard_file
+        platform_data = {
+            'submissions': [s.to_dict() for s in self.submissions],
+            'leaderboard': self.leaderboard,
+            'last_updated': datetime.now().isoformat()
+        }
+
+        _write_json(export_file, platform_data)
+        return export_file
+
+    def close(self):
+        """Close the platform database"""
+        self._db.close()
+
     def get_leaderboard(self, limit: int = 20) -> List[Dict[str, Any]]:
-        """Get current leaderboard"""
-        return self.leaderboard[:limit]
+        """Get current leaderboard; views are reused until the next competition updates it"""
+        key = (self._leaderboard_version, limit)
+        view = self._leaderboard_views.get(key)
+        if view is None:
+            view = self._leaderboard_views[key] = self.leaderboard[:limit]
+        return view
 
     def get_student_progress(self, student_name: str) -> Dict[str, Any]:
         """Get progress for specific student"""
@@ -566,7 +865,7 @@ class StudentPlatform:
             'total_submissions': len(student_submissions),
             'best_ranking': best_ranking if best_ranking != float('inf') else None,
             'best_submission': best_submission,
-            'all_submissions': [asdict(s) for s in student_submissions]
+            'all_submissions': [s.to_dict() for s in student_submissions]
         }
 
 if __name__ == "__main__":
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Student Platform Hot Paths
+Per-submission game aggregation and leaderboard ranking
+
+Kept free of platform imports and fully annotated so it can be compiled with
+mypyc (``mypyc student_platform_hot.py``). The compiled extension shadows this
+file on import; without it the same code runs as plain Python.
+"""
+
+import heapq
+from typing import Any, Dict, List, Optional
+
+def _efficiency_key(entry: Dict[str, Any]) -> float:
+    """Leaderboard sort key"""
+    return float(entry['average_efficiency'])
+
+def aggregate_games(game_results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Summarize a submission's completed test games
+
+    Args:
+        game_results: Result dicts from play_autonomous_game
+
+    Returns:
+        Totals, averages and the highest tile across the games
+    """
+    total_score: int = 0
+    total_moves: int = 0
+    max_tile: int = 0
+
+    for result in game_results:
+        total_score += int(result.get('final_score', 0))
+        total_moves += int(result.get('moves_completed', 0))
+        tile = int(result.get('highest_tile', 0))
+        if tile > max_tile:
+            max_tile = tile
+
+    games_completed = len(game_results)
+    return {
+        'games_completed': games_completed,
+        'total_score': total_score,
+        'total_moves': total_moves,
+        'average_efficiency': total_score / max(total_moves, 1),
+        'average_score': total_score / max(games_completed, 1),
+        'highest_tile': max_tile,
+        'game_results': game_results
+    }
+
+def rank_entries(entries: List[Dict[str, Any]], top_k: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Order leaderboard entries by average efficiency and assign 1-based ranks
+
+    Args:
+        entries: Leaderboard entries with an 'average_efficiency' value
+        top_k: Keep only the best top_k entries (default: all)
+    """
+    # A partial heap sort is enough for a top-k board
+    if top_k is not None and top_k < len(entries):
+        ranked = heapq.nlargest(top_k, entries, key=_efficiency_key)
+    else:
+        ranked = sorted(entries, key=_efficiency_key, reverse=True)
+
+    for i, entry in enumerate(ranked):
+        entry['rank'] = i + 1
+    return ranked
@@ -0,0 +1,25 @@
+"""
+Shared pytest hooks for the test suite
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import cv2
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+# OpenCV threads on all but one core, or one per worker when pytest-xdist runs files in parallel
+cv2.setNumThreads(1 if os.environ.get("PYTEST_XDIST_WORKER") else max(1, (os.cpu_count() or 1) - 1))
+
+def pytest_configure(config):
+    """Compile the strategy kernels once, before pytest-xdist starts its workers"""
+    if os.environ.get("PYTEST_XDIST_WORKER"):
+        return
+
+    # Importing compiles the fixed-signature Numba kernels into the on-disk
+    # cache (or loads them from it), so workers start from a warm cache
+    import core.strategy_kernels  # noqa: F401
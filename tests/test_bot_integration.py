@@ -6,7 +6,9 @@ Tests the complete bot system with mocked browser for safety.
 Tests all components working together without requiring actual browser.
 """
 
+import os
 import sys
+import tempfile
 import unittest
 from unittest.mock import Mock, MagicMock, patch
 from pathlib import Path
@@ -52,26 +54,44 @@ class TestGameSession(unittest.TestCase):
         self.assertEqual(session.final_score, 200)
         self.assertEqual(session.efficiency, 200.0)  # 200 score / 1 move
 
+    def test_malformed_board_kept(self):
+        """Boards that are not 4x4 are logged as given and still count toward the highest tile"""
+        session = GameSession()
+        board = [[2, 4, 8], [0, 128, 0]]
+
+        session.add_move(Move.LEFT, board, None, 0)
+
+        self.assertEqual(session.move_log[0]['board_before'], board)
+        self.assertEqual(session.board_states, [board])
+        self.assertEqual(session.highest_tile, 128)
+
+    def test_move_count_assignment(self):
+        """Assigning moves directly leaves the recorded log intact"""
+        session = GameSession()
+        board = [[2, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0]]
+        session.add_move(Move.UP, board, None, 0)
+
+        session.moves = 100
+        session.add_move(Move.DOWN, board, None, 4)
+
+        self.assertEqual([entry['move'] for entry in session.move_log], ['UP', 'DOWN'])
+        self.assertEqual(len(session.board_states), 2)
+
 class TestGameBotIntegration(unittest.TestCase):
     """Test game bot with mocked dependencies"""
 
     def setUp(self):
         """Setup test fixtures"""
         # Create mocked bot to avoid actual browser
-        with patch('core.game_bot.BrowserController') as mock_browser_class, \
-             patch('core.game_bot.ImprovedBoardVision') as mock_vision_class, \
-             patch('core.game_bot.BasicStrategy') as mock_strategy_class:
-
-            # Setup mocks
-            self.mock_browser = Mock()
-            self.mock_vision = Mock()
-            self.mock_strategy = Mock()
-
-            mock_browser_class.return_value = self.mock_browser
-            mock_vision_class.return_value = self.mock_vision
-            mock_strategy_class.return_value = self.mock_strategy
-
-            # Create bot
+        self.mock_browser = Mock()
+        self.mock_vision = Mock()
+        self.mock_strategy = Mock()
+
+        # The bot builds its components in __init__, so the patches only need to cover construction
+        with patch.multiple('core.game_bot',
+                            BrowserController=Mock(return_value=self.mock_browser),
+                            ImprovedBoardVision=Mock(return_value=self.mock_vision),
+                            BasicStrategy=Mock(return_value=self.mock_strategy)):
             self.bot = GameBot(browser_type=BrowserType.FIREFOX, headless=True, debug_mode=True)
 
     def test_bot_initialization(self):
@@ -206,23 +226,68 @@ class TestBotComponents(unittest.TestCase):
         self.assertEqual(GameAction.LEFT.value, 'ArrowLeft')
         self.assertEqual(GameAction.RIGHT.value, 'ArrowRight')
 
+class TestInitialTilesWait(unittest.TestCase):
+    """Test the standalone bots' startup wait against CanonicalBoardVision results"""
+
+    def setUp(self):
+        import numpy as np
+        from core.canonical_vision import CanonicalBoardVision
+
+        # The bots' error handler writes logs/ into the working directory
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+
+        # A real canonical result dict (same keys), marked as a board with two tiles
+        self.result = CanonicalBoardVision().analyze_board(np.zeros((400, 400, 3), dtype=np.uint8))
+        self.result['success'] = True
+        self.result['board_state'] = [[2, 0, 0, 0], [0, 0, 0, 0], [0, 0, 2, 0], [0, 0, 0, 0]]
+
+    def tearDown(self):
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def _check_bot(self, bot):
+        bot.controller.take_screenshot.return_value = Mock()
+        bot.vision = Mock()
+        bot.vision.analyze_board.return_value = self.result
+        bot.error_handler.handle_error = Mock()
+
+        with patch('time.sleep'):
+            self.assertTrue(bot._wait_for_initial_tiles())
+
+        bot.error_handler.handle_error.assert_not_called()
+        self.assertEqual(bot.vision.analyze_board.call_count, 1)
+
+    def test_complete_bot_finds_tiles(self):
+        """Complete2048Bot accepts the canonical result on the first check"""
+        with patch('complete_2048_bot.PlaywrightController'):
+            from complete_2048_bot import Complete2048Bot
+            bot = Complete2048Bot(headless=True, debug=False, screenshot_dir=self._tmp.name)
+        self._check_bot(bot)
+
+    def test_enhanced_bot_finds_tiles(self):
+        """Enhanced2048Bot accepts the canonical result on the first check"""
+        from enhanced_2048_bot import Enhanced2048Bot
+        bot = Enhanced2048Bot(headless=True, debug=False, screenshot_dir=self._tmp.name,
+                              controller=Mock())
+        self._check_bot(bot)
+
+INTEGRATION_TEST_CASES = (TestGameSession, TestGameBotIntegration, TestBotComponents,
+                          TestInitialTilesWait)
+
 def run_integration_tests():
     """Run all bot integration tests"""
     print("🤖 Running Bot Integration Tests")
     print("=" * 40)
     print("Testing complete bot system with mocked dependencies\n")
 
-    # Create test suite
+    # Create test suite (a fresh one per run: TestSuite drops its tests once they have run)
     loader = unittest.TestLoader()
-    suite = unittest.TestSuite()
+    suite = unittest.TestSuite(loader.loadTestsFromTestCase(case) for case in INTEGRATION_TEST_CASES)
 
-    # Add test cases
-    suite.addTests(loader.loadTestsFromTestCase(TestGameSession))
-    suite.addTests(loader.loadTestsFromTestCase(TestGameBotIntegration))
-    suite.addTests(loader.loadTestsFromTestCase(TestBotComponents))
-
-    # Run tests
-    runner = unittest.TextTestRunner(verbosity=2)
+    # Run tests, without the per-test listing under CI
+    runner = unittest.TextTestRunner(verbosity=0 if os.environ.get('CI') else 2)
     result = runner.run(suite)
 
     # Summary
@@ -231,23 +296,12 @@ def run_integration_tests():
     print(f"   Failures: {len(result.failures)}")
     print(f"   Errors: {len(result.errors)}")
 
+    # The runner has already printed each failure's traceback
     if result.wasSuccessful():
         print(f"   ✅ All bot integration tests passed!")
         return True
     else:
         print(f"   ❌ Some tests failed")
-
-        # Show failures
-        if result.failures:
-            print("\n❌ Failures:")
-            for test, traceback in result.failures:
-                print(f"   {test}: {traceback.split('AssertionError:')[-1].strip()}")
-
-        if result.errors:
-            print("\n💥 Errors:")
-            for test, traceback in result.errors:
-                print(f"   {test}: {traceback.split(':')[-1].strip()}")
-
         return False
 
 if __name__ == "__main__":
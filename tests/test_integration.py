@@ -8,40 +8,85 @@ Uses real screenshot data for comprehensive end-to-end validation.
 
 import sys
 import unittest
+import functools
 from pathlib import Path
+from typing import Dict, Optional
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from core.improved_vision import ImprovedBoardVision
-from core.strategy import BasicStrategy, Move
+from core.strategy import BasicStrategy, Move, DIRECTIONS
+from core.strategy_kernels import simulate_move
 import cv2
+import numpy as np
+
+# Board fixtures, built once at import
+EXPECTED_MATURE = np.array([[2, 8, 4, 2], [2, 8, 64, 32], [32, 128, 8, 4], [4, 32, 16, 2]], dtype=np.int32)
+EMPTY_BOARD = np.zeros((4, 4), dtype=np.int32)
+FULL_BOARD = np.tile(np.array([2, 4, 8, 16], dtype=np.int32), (4, 1))
+SINGLE_TILE_BOARD = np.zeros((4, 4), dtype=np.int32)
+SINGLE_TILE_BOARD[0, 0] = 2
+for _board in (EXPECTED_MATURE, EMPTY_BOARD, FULL_BOARD, SINGLE_TILE_BOARD):
+    _board.setflags(write=False)
+
+# Malformed boards are ragged, so they stay as nested lists
+INVALID_BOARDS = (
+    [],  # Empty board
+    [[1, 2, 3]],  # Wrong size
+    [[1, 2, 3, 4], [1, 2, 3, 4]],  # Incomplete
+    [[1, 2, 3, -1], [0, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0]],  # Negative values
+)
+
+@functools.lru_cache(maxsize=32)
+def _load_rgb(path: str) -> Optional[np.ndarray]:
+    """
+    Decode a validation screenshot once per process (None if it cannot be read)
+
+    Returns a read-only RGB view of the decoded BGR pixels rather than a
+    converted copy; the vision code copies before drawing its debug images.
+    """
+    image = cv2.imread(path, cv2.IMREAD_COLOR)
+    if image is None:
+        return None
+    # Shared between tests, so it must never be modified in place
+    image.setflags(write=False)
+    return image[..., ::-1]
+
+_analysis_cache: Dict[str, dict] = {}
+
+def _analyze_screenshot(vision: ImprovedBoardVision, path: str) -> dict:
+    """analyze_board() on a validation screenshot, once per path; fixtures never change within a run"""
+    results = _analysis_cache.get(path)
+    if results is None:
+        results = vision.analyze_board(_load_rgb(path))
+        _analysis_cache[path] = results
+    return results
 
 class TestIntegration(unittest.TestCase):
     """End-to-end integration tests"""
 
-    def setUp(self):
-        self.vision = ImprovedBoardVision()
-        self.strategy = BasicStrategy(debug_mode=False)
+    @classmethod
+    def setUpClass(cls):
+        # Shared by every test: vision is stateless and the strategy only caches features
+        cls.vision = ImprovedBoardVision()
+        cls.strategy = BasicStrategy(debug_mode=False)
 
     def test_complete_pipeline_mature_game(self):
         """Test complete pipeline on mature game state"""
         # Load real screenshot
         image_path = project_root / "validation_data" / "easy_captures" / "2048_capture_20250917_222936_01.png"
-        image = cv2.imread(str(image_path))
+        image = _load_rgb(str(image_path))
         self.assertIsNotNone(image, "Screenshot should load successfully")
 
-        # Convert BGR to RGB
-        image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-
         # Vision: Extract board state
-        vision_results = self.vision.analyze_board(image)
+        vision_results = _analyze_screenshot(self.vision, str(image_path))
         self.assertTrue(vision_results['success'], "Vision analysis should succeed")
 
         board_state = vision_results['board_state']
-        expected_board = [[2,8,4,2], [2,8,64,32], [32,128,8,4], [4,32,16,2]]
-        self.assertEqual(board_state, expected_board, "Should extract correct board state")
+        self.assertTrue(np.array_equal(vision_results['board_array'], EXPECTED_MATURE),
+                        "Should extract correct board state")
 
         # Strategy: Get move recommendation
         move, analysis = self.strategy.get_best_move(board_state)
@@ -55,13 +100,11 @@ class TestIntegration(unittest.TestCase):
         """Test complete pipeline on early game state"""
         # Load early game screenshot
         image_path = project_root / "validation_data" / "easy_captures" / "2048_capture_20250917_212313_01.png"
-        image = cv2.imread(str(image_path))
+        image = _load_rgb(str(image_path))
         self.assertIsNotNone(image)
 
-        image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-
         # Vision analysis
-        vision_results = self.vision.analyze_board(image)
+        vision_results = _analyze_screenshot(self.vision, str(image_path))
         self.assertTrue(vision_results['success'])
 
         board_state = vision_results['board_state']
@@ -79,13 +122,11 @@ class TestIntegration(unittest.TestCase):
         """Test pipeline handles game over state correctly"""
         # Load game over screenshot
         image_path = project_root / "validation_data" / "easy_captures" / "2048_capture_20250917_223121_01.png"
-        image = cv2.imread(str(image_path))
+        image = _load_rgb(str(image_path))
         self.assertIsNotNone(image)
 
-        image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-
         # Vision analysis
-        vision_results = self.vision.analyze_board(image)
+        vision_results = _analyze_screenshot(self.vision, str(image_path))
         self.assertTrue(vision_results['success'])
 
         board_state = vision_results['board_state']
@@ -101,7 +142,7 @@ class TestIntegration(unittest.TestCase):
     def test_strategy_consistency(self):
         """Test that strategy gives consistent results for same board state"""
         # Use a known board state
-        board_state = [[2,8,4,2], [2,8,64,32], [32,128,8,4], [4,32,16,2]]
+        board_state = EXPECTED_MATURE.tolist()
 
         # Run strategy multiple times
         results = []
@@ -117,9 +158,16 @@ class TestIntegration(unittest.TestCase):
         """Test that move simulation produces valid results"""
         board_state = [[2,0,2,0], [0,4,0,0], [0,0,8,0], [0,0,0,16]]
 
+        board_array = np.asarray(board_state, dtype=np.int32)
+
         for move in Move:
             result = self.strategy._simulate_move(board_state, move)
 
+            # Compiled kernel must agree with the list-based reference
+            kernel_result = simulate_move(board_array, DIRECTIONS.index(move.value))
+            self.assertEqual(None if kernel_result is None else kernel_result.tolist(), result,
+                             f"Kernel and reference disagree for {move.value}")
+
             if result is not None:
                 # Result should be valid 4x4 board
                 self.assertEqual(len(result), 4, "Result should have 4 rows")
@@ -131,33 +179,23 @@ class TestIntegration(unittest.TestCase):
 class TestSystemReliability(unittest.TestCase):
     """Test system reliability and error handling"""
 
-    def setUp(self):
-        self.vision = ImprovedBoardVision()
-        self.strategy = BasicStrategy(debug_mode=False)
+    @classmethod
+    def setUpClass(cls):
+        # Shared by every test: vision is stateless and the strategy only caches features
+        cls.vision = ImprovedBoardVision()
+        cls.strategy = BasicStrategy(debug_mode=False)
 
     def test_invalid_board_handling(self):
         """Test strategy handles invalid boards gracefully"""
-        invalid_boards = [
-            [],  # Empty board
-            [[1, 2, 3]],  # Wrong size
-            [[1, 2, 3, 4], [1, 2, 3, 4]],  # Incomplete
-            [[1, 2, 3, -1], [0, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0]],  # Negative values
-        ]
-
-        for invalid_board in invalid_boards:
+        for invalid_board in INVALID_BOARDS:
             move, analysis = self.strategy.get_best_move(invalid_board)
             self.assertIn('error', analysis, "Should include error information")
 
     def test_strategy_robustness(self):
         """Test strategy with edge case board states"""
-        edge_cases = [
-            [[0, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0]],  # Empty board
-            [[2, 4, 8, 16], [2, 4, 8, 16], [2, 4, 8, 16], [2, 4, 8, 16]],  # Full board
-            [[2, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0]],  # Single tile
-        ]
-
-        for board in edge_cases:
-            move, analysis = self.strategy.get_best_move(board)
+        # The strategy takes nested lists
+        for board in (EMPTY_BOARD, FULL_BOARD, SINGLE_TILE_BOARD):
+            move, analysis = self.strategy.get_best_move(board.tolist())
             self.assertIsInstance(move, Move, "Should return valid move even for edge cases")
 
 def run_integration_tests():
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Performance Monitor Tests
+Tests metrics storage and aggregation without starting the monitor thread.
+"""
+
+import sys
+import time
+import unittest
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from production.performance_monitor import PerformanceMonitor, PerformanceMetrics, PROMETHEUS_AVAILABLE
+
+def make_metrics(timestamp: float, cpu_percent: float = 10.0, memory_mb: float = 100.0) -> PerformanceMetrics:
+    """Build a metrics snapshot with fixed system values"""
+    return PerformanceMetrics(
+        timestamp=timestamp,
+        cpu_percent=cpu_percent,
+        memory_mb=memory_mb,
+        memory_percent=1.0,
+        disk_io_read=0,
+        disk_io_write=0,
+        network_sent=0,
+        network_recv=0
+    )
+
+class TestMetricsHistory(unittest.TestCase):
+    """Test ring buffer storage of metrics"""
+
+    def setUp(self):
+        self.monitor = PerformanceMonitor(enable_alerts=False)
+
+    def test_empty_monitor(self):
+        """Test queries before any sample is collected"""
+        self.assertIsNone(self.monitor.get_current_metrics())
+        self.assertEqual(self.monitor.get_average_metrics(), {})
+        self.assertIn('error', self.monitor.get_performance_report())
+
+    def test_current_metrics_is_latest_sample(self):
+        """Test the newest sample is returned as current"""
+        now = time.time()
+        self.monitor._process_metrics(make_metrics(now - 1, cpu_percent=5.0))
+        self.monitor._process_metrics(make_metrics(now, cpu_percent=25.0))
+
+        current = self.monitor.get_current_metrics()
+        self.assertEqual(current.timestamp, now)
+        self.assertAlmostEqual(current.cpu_percent, 25.0)
+
+    def test_peek_latest(self):
+        """Test the last stored snapshot is returned without a copy"""
+        self.assertIsNone(self.monitor.peek_latest())
+
+        metrics = make_metrics(time.time(), memory_mb=321.0)
+        self.monitor._process_metrics(metrics)
+        self.assertIs(self.monitor.peek_latest(), metrics)
+        self.assertAlmostEqual(self.monitor.get_current_metrics().memory_mb, 321.0)
+
+    def test_history_wraps_at_capacity(self):
+        """Test the oldest samples are overwritten once history is full"""
+        now = time.time()
+        total = self.monitor.max_history + 5
+        for i in range(total):
+            self.monitor._process_metrics(make_metrics(now - total + i + 1, memory_mb=float(i)))
+
+        report = self.monitor.get_performance_report()
+        self.assertEqual(report['performance_summary']['total_samples'], self.monitor.max_history)
+        self.assertAlmostEqual(self.monitor.get_current_metrics().memory_mb, float(total - 1))
+
+    def test_average_respects_window(self):
+        """Test only samples inside the window are averaged"""
+        now = time.time()
+        self.monitor._process_metrics(make_metrics(now - 120, cpu_percent=90.0))
+        self.monitor._process_metrics(make_metrics(now - 10, cpu_percent=20.0))
+        self.monitor._process_metrics(make_metrics(now - 5, cpu_percent=40.0))
+
+        avg = self.monitor.get_average_metrics(60.0)
+        self.assertEqual(avg['sample_count'], 2)
+        self.assertAlmostEqual(avg['cpu_percent'], 30.0, places=4)
+
+    def test_average_window_after_wrap(self):
+        """Test the window is found across the ring buffer wrap point"""
+        now = time.time()
+        total = self.monitor.max_history + 10
+        for i in range(total):
+            # Oldest samples are far outside the window, the last 20 are inside
+            age = 10.0 if i >= total - 20 else 1000.0
+            self.monitor._process_metrics(make_metrics(now - age + i * 1e-3, cpu_percent=float(age)))
+
+        avg = self.monitor.get_average_metrics(60.0)
+        self.assertEqual(avg['sample_count'], 20)
+        self.assertAlmostEqual(avg['cpu_percent'], 10.0)
+
+    def test_update_bot_metrics(self):
+        """Test queued bot metrics are folded into the next sample"""
+        now = time.time()
+        self.monitor._process_metrics(make_metrics(now - 2))
+        self.monitor.update_bot_metrics(move_count=10, game_score=200, screenshot_time=0.5)
+        self.assertEqual(self.monitor.get_current_metrics().move_count, 0)
+
+        self.monitor._process_metrics(make_metrics(now))
+
+        current = self.monitor.get_current_metrics()
+        self.assertEqual(current.move_count, 10)
+        self.assertEqual(current.game_score, 200)
+        self.assertAlmostEqual(current.efficiency, 20.0)
+        self.assertAlmostEqual(current.fps, 5.0, places=3)
+        self.assertAlmostEqual(current.screenshot_time, 0.5)
+
+    def test_record_timing_keeps_bot_counters(self):
+        """Test a timing update does not reset move count or score"""
+        now = time.time()
+        self.monitor.update_bot_metrics(move_count=4, game_score=40)
+        self.monitor.record_timing("analysis", 0.25)
+        self.monitor._process_metrics(make_metrics(now))
+
+        current = self.monitor.get_current_metrics()
+        self.assertEqual(current.move_count, 4)
+        self.assertAlmostEqual(current.analysis_time, 0.25)
+
+    def test_timing_only_tick_carries_counters(self):
+        """Test a tick with only timings keeps the move count and never reports negative FPS"""
+        now = time.time()
+        self.monitor._process_metrics(make_metrics(now - 2))
+        self.monitor.update_bot_metrics(move_count=10, game_score=200)
+        self.monitor._process_metrics(make_metrics(now - 1))
+
+        self.monitor.record_timing("strategy", 0.1)
+        self.monitor._process_metrics(make_metrics(now))
+
+        current = self.monitor.get_current_metrics()
+        self.assertEqual(current.move_count, 10)
+        self.assertEqual(current.game_score, 200)
+        self.assertAlmostEqual(current.efficiency, 20.0)
+        self.assertEqual(current.fps, 0.0)
+        self.assertAlmostEqual(current.strategy_time, 0.1)
+        self.assertGreaterEqual(self.monitor.get_average_metrics(60)['fps'], 0.0)
+
+    def test_phase_summary(self):
+        """Test samples are bucketed by the phase tagged before them"""
+        now = time.time()
+        self.monitor.tag_phase("baseline", timestamp=now - 30)
+        self.monitor._process_metrics(make_metrics(now - 20, cpu_percent=10.0))
+        self.monitor._process_metrics(make_metrics(now - 15, cpu_percent=30.0))
+        self.monitor.tag_phase("stress", timestamp=now - 10)
+        self.monitor._process_metrics(make_metrics(now - 5, cpu_percent=70.0))
+
+        phases = self.monitor.get_performance_report()['performance_summary']['phases']
+        self.assertEqual([p['phase'] for p in phases], ["baseline", "stress"])
+        self.assertEqual([p['sample_count'] for p in phases], [2, 1])
+        self.assertAlmostEqual(phases[0]['averages']['cpu_percent'], 20.0, places=4)
+        self.assertAlmostEqual(phases[1]['averages']['cpu_percent'], 70.0, places=4)
+
+@unittest.skipUnless(PROMETHEUS_AVAILABLE, "prometheus_client not installed")
+class TestPrometheusExport(unittest.TestCase):
+    """Test Prometheus gauge publishing"""
+
+    def test_gauges_follow_samples(self):
+        """Test gauges hold the latest sample values"""
+        monitor = PerformanceMonitor(enable_alerts=False)
+        registry = monitor.enable_prometheus()
+        monitor._process_metrics(make_metrics(time.time(), cpu_percent=42.0, memory_mb=256.0))
+
+        self.assertEqual(registry.get_sample_value('bot_cpu_percent'), 42.0)
+        self.assertEqual(registry.get_sample_value('bot_memory_mb'), 256.0)
+
+class TestAlerts(unittest.TestCase):
+    """Test threshold alerts"""
+
+    def setUp(self):
+        self.monitor = PerformanceMonitor(enable_alerts=True)
+        self.alerts = []
+        self.monitor.add_alert_callback(lambda message, metrics: self.alerts.append(message))
+
+    def test_no_alerts_within_thresholds(self):
+        """Test a healthy sample raises nothing"""
+        self.monitor._process_metrics(make_metrics(time.time()))
+        self.assertEqual(self.alerts, [])
+
+    def test_upper_thresholds(self):
+        """Test exceeded thresholds produce one alert each"""
+        self.monitor._process_metrics(make_metrics(time.time(), cpu_percent=95.0, memory_mb=2048.0))
+        self.assertEqual(self.alerts, ["High CPU usage: 95.0%", "High memory usage: 2048.0 MB"])
+
+    def test_set_threshold(self):
+        """Test runtime threshold changes are applied"""
+        self.monitor.set_threshold('cpu_percent', 5.0)
+        self.monitor._process_metrics(make_metrics(time.time(), cpu_percent=10.0))
+        self.assertEqual(self.alerts, ["High CPU usage: 10.0%"])
+
+        with self.assertRaises(KeyError):
+            self.monitor.set_threshold('unknown', 1.0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,6 +10,7 @@ import numpy as np
 from pathlib import Path
 import sys
 import cv2
+from typing import Optional
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
@@ -17,12 +18,31 @@ sys.path.insert(0, str(project_root))
 
 from core.vision import BoardVision
 
+def load_rgb_view(path: Path) -> Optional[np.ndarray]:
+    """Read a screenshot as a read-only RGB view of OpenCV's BGR pixels (no converted copy)"""
+    image_bgr = cv2.imread(str(path), cv2.IMREAD_COLOR)
+    if image_bgr is None:
+        return None
+    image_bgr.setflags(write=False)
+    return image_bgr[..., ::-1]
+
 class TestBoardVisionRealWorld:
     """Test vision system with real screenshots"""
 
+    @classmethod
+    def setup_class(cls):
+        """Build the vision system once; tests only read its configuration"""
+        cls.vision = BoardVision()
+
+        # Find the screenshots once; every test analyzes the most recent one
+        validation_dir = project_root / "validation_data"
+        cls.available_screenshots = [p for p in validation_dir.glob("**/*.png") if "debug" not in str(p)]
+        cls.latest_screenshot = None
+        if cls.available_screenshots:
+            cls.latest_screenshot = max(cls.available_screenshots, key=lambda p: p.stat().st_mtime)
+
     def setup_method(self):
         """Setup for each test"""
-        self.vision = BoardVision()
         self.validation_dir = project_root / "validation_data"
         self.debug_dir = project_root / "validation_data" / "debug_vision"
         self.debug_dir.mkdir(parents=True, exist_ok=True)
@@ -30,28 +50,22 @@ class TestBoardVisionRealWorld:
         if not self.validation_dir.exists():
             pytest.skip("No validation_data directory present; capture real screenshots before running vision tests.")
 
-        screenshots = [p for p in self.validation_dir.glob("**/*.png") if "debug" not in str(p)]
-        if not screenshots:
+        if not self.available_screenshots:
             pytest.skip("No real screenshots found. Run easy_capture.py to generate validation images.")
 
-        self.available_screenshots = screenshots
-
     def test_board_detection_real_screenshot(self):
         """Test board detection on real captured screenshot - NO SIMULATION"""
         print("\n🎯 Testing Real Board Detection")
         print("=" * 35)
 
-        screenshots = self.available_screenshots
-
         # Test on most recent screenshot
-        test_image_path = max(screenshots, key=lambda p: p.stat().st_mtime)
+        test_image_path = self.latest_screenshot
         print(f"📁 Testing: {test_image_path.name}")
 
         # Load real image
-        image_bgr = cv2.imread(str(test_image_path))
-        assert image_bgr is not None, f"Could not load {test_image_path}"
+        image_rgb = load_rgb_view(test_image_path)
+        assert image_rgb is not None, f"Could not load {test_image_path}"
 
-        image_rgb = cv2.cvtColor(image_bgr, cv2.COLOR_BGR2RGB)
         height, width = image_rgb.shape[:2]
 
         print(f"✅ Image loaded: {width}x{height}")
@@ -87,11 +101,9 @@ class TestBoardVisionRealWorld:
         print("=" * 35)
 
         # Load real screenshot
-        screenshots = self.available_screenshots
-        test_image_path = max(screenshots, key=lambda p: p.stat().st_mtime)
+        test_image_path = self.latest_screenshot
 
-        image_bgr = cv2.imread(str(test_image_path))
-        image_rgb = cv2.cvtColor(image_bgr, cv2.COLOR_BGR2RGB)
+        image_rgb = load_rgb_view(test_image_path)
 
         # Extract board
         board_image = self.vision.extract_board_image(image_rgb)
@@ -120,10 +132,8 @@ class TestBoardVisionRealWorld:
         print("=" * 32)
 
         # Get real board image
-        screenshots = self.available_screenshots
-        test_image_path = max(screenshots, key=lambda p: p.stat().st_mtime)
-        image_bgr = cv2.imread(str(test_image_path))
-        image_rgb = cv2.cvtColor(image_bgr, cv2.COLOR_BGR2RGB)
+        test_image_path = self.latest_screenshot
+        image_rgb = load_rgb_view(test_image_path)
 
         board_image = self.vision.extract_board_image(image_rgb)
         assert board_image is not None, "Need valid board image"
@@ -160,10 +170,8 @@ class TestBoardVisionRealWorld:
         print("=" * 42)
 
         # Load real screenshot
-        screenshots = self.available_screenshots
-        test_image_path = max(screenshots, key=lambda p: p.stat().st_mtime)
-        image_bgr = cv2.imread(str(test_image_path))
-        image_rgb = cv2.cvtColor(image_bgr, cv2.COLOR_BGR2RGB)
+        test_image_path = self.latest_screenshot
+        image_rgb = load_rgb_view(test_image_path)
 
         print(f"📁 Analyzing: {test_image_path.name}")
 
@@ -176,21 +184,13 @@ class TestBoardVisionRealWorld:
         assert 'board_state' in results, "Results should have board state"
         assert 'confidence_scores' in results, "Results should have confidence scores"
 
-        # Check board state structure
-        board = results['board_state']
-        assert len(board) == 4, f"Board should have 4 rows, got {len(board)}"
-
-        for row in board:
-            assert len(row) == 4, f"Each row should have 4 columns"
-
-        # Check confidence scores structure
-        confidence = results['confidence_scores']
-        assert len(confidence) == 4, "Confidence should have 4 rows"
-
-        for row in confidence:
-            assert len(row) == 4, "Each confidence row should have 4 columns"
-            for score in row:
-                assert 0.0 <= score <= 1.0, f"Confidence score out of range: {score}"
+        # Check board state and confidence arrays
+        board_arr = results['board_array']
+        conf_arr = results['confidence_array']
+        assert board_arr.shape == (4, 4), f"Board should be 4x4, got {board_arr.shape}"
+        assert conf_arr.shape == (4, 4), f"Confidence should be 4x4, got {conf_arr.shape}"
+        assert board_arr.tolist() == results['board_state'], "Board array should match board state"
+        assert np.all((conf_arr >= 0.0) & (conf_arr <= 1.0)), f"Confidence scores out of range: {conf_arr}"
 
         print(f"✅ Analysis completed:")
         print(f"   Success: {results['success']}")
@@ -202,8 +202,7 @@ class TestBoardVisionRealWorld:
             print(f"   Board region: ({x}, {y}) {w}x{h}")
 
         # Count detected tiles
-        board = results['board_state']
-        non_empty = sum(1 for row in board for tile in row if tile > 0)
+        non_empty = int(np.count_nonzero(board_arr > 0))
         print(f"   Non-empty tiles detected: {non_empty}/16")
 
         print("\n📋 MANUAL VERIFICATION REQUIRED:")
@@ -212,10 +211,9 @@ class TestBoardVisionRealWorld:
         # Print detected board
         print("   📋 Detected:")
         print("      ┌─────┬─────┬─────┬─────┐")
-        for row in range(4):
+        for row, values in enumerate(board_arr.tolist()):
             row_str = "      │"
-            for col in range(4):
-                value = board[row][col]
+            for value in values:
                 if value == 0:
                     cell = "     "
                 else:
@@ -242,6 +240,7 @@ def manual_vision_test_runner():
     print("These tests analyze real screenshots and require manual verification.")
     print("Ensure you have captured screenshots with easy_capture.py first.\n")
 
+    TestBoardVisionRealWorld.setup_class()
     test_instance = TestBoardVisionRealWorld()
     test_instance.setup_method()
 
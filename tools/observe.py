@@ -0,0 +1,8 @@
+"""
+Shared switch for the browser tools' visual pauses
+"""
+
+import os
+
+# Set JED_OBSERVE=1 to keep the visual pauses for watching the browser
+OBSERVE = os.environ.get("JED_OBSERVE") == "1"
@@ -4,8 +4,10 @@ Quick Strategy Verification
 Non-interactive version for batch verification of all screenshots.
 """
 
+import os
 import sys
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
@@ -15,22 +17,22 @@ from core.strategy import BasicStrategy, Move
 from core.improved_vision import ImprovedBoardVision
 import cv2
 
-def display_board_compact(board, title="Board"):
-    """Display board in compact format"""
-    print(f"{title}:")
+def format_board_compact(board, title="Board") -> list:
+    """Board in compact format, as report lines"""
+    lines = [f"{title}:"]
     for row in board:
-        print("   [" + ", ".join(f"{tile:3d}" for tile in row) + "]")
+        lines.append("   [" + ", ".join(f"{tile:3d}" for tile in row) + "]")
+    return lines
 
-def quick_verification(image_path):
-    """Quick verification of strategy for one screenshot"""
-    print(f"\n📁 {image_path.name}")
-    print("─" * 50)
+def quick_verification(image_path) -> str:
+    """Quick verification of strategy for one screenshot; returns the report text"""
+    lines = [f"\n📁 {image_path.name}", "─" * 50]
 
     # Load image
     image = cv2.imread(str(image_path))
     if image is None:
-        print(f"❌ Could not load image")
-        return
+        lines.append(f"❌ Could not load image")
+        return "\n".join(lines)
 
     image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
 
@@ -39,8 +41,8 @@ def quick_verification(image_path):
     vision_results = vision.analyze_board(image)
 
     if not vision_results['success']:
-        print(f"❌ Vision failed: {vision_results.get('debug_info', {}).get('error', 'Unknown')}")
-        return
+        lines.append(f"❌ Vision failed: {vision_results.get('debug_info', {}).get('error', 'Unknown')}")
+        return "\n".join(lines)
 
     board = vision_results['board_state']
 
@@ -49,26 +51,27 @@ def quick_verification(image_path):
     best_move, analysis = strategy.get_best_move(board)
 
     # Display results
-    display_board_compact(board, "Board State")
+    lines.extend(format_board_compact(board, "Board State"))
 
-    print(f"\n🎯 Strategy Decision:")
-    print(f"   Recommended: {best_move.value} (score: {analysis['best_score']:.1f})")
+    lines.append(f"\n🎯 Strategy Decision:")
+    lines.append(f"   Recommended: {best_move.value} (score: {analysis['best_score']:.1f})")
 
-    print(f"\n📊 Move Scores:")
+    lines.append(f"\n📊 Move Scores:")
     for move in [Move.UP, Move.DOWN, Move.LEFT, Move.RIGHT]:
         score = analysis['all_scores'][move]
         possible = analysis['move_analysis'][move].get('possible', True)
         marker = "👈" if move == best_move else "  "
         status = "✅" if possible else "❌"
-        print(f"      {status} {move.value:>5}: {score:>8.1f} {marker}")
+        lines.append(f"      {status} {move.value:>5}: {score:>8.1f} {marker}")
 
     # Key metrics
     empty_tiles = strategy._count_empty_tiles(board)
     max_tile = strategy._get_max_tile(board)
-    print(f"\n📈 Key Metrics:")
-    print(f"   Empty tiles: {empty_tiles}/16")
-    print(f"   Max tile: {max_tile}")
-    print(f"   Corner strategy: {strategy._evaluate_corner_strategy(board):.1f}")
+    lines.append(f"\n📈 Key Metrics:")
+    lines.append(f"   Empty tiles: {empty_tiles}/16")
+    lines.append(f"   Max tile: {max_tile}")
+    lines.append(f"   Corner strategy: {strategy._evaluate_corner_strategy(board):.1f}")
+    return "\n".join(lines)
 
 def main():
     print("⚡ Quick Strategy Verification")
@@ -85,9 +88,10 @@ def main():
 
     print(f"Found {len(screenshots)} screenshots")
 
-    # Process each screenshot
-    for screenshot in screenshots:
-        quick_verification(screenshot)
+    # Screenshots are independent, so they are analyzed in parallel and reported in order
+    with ProcessPoolExecutor(max_workers=min(len(screenshots), os.cpu_count() or 1)) as executor:
+        for report in executor.map(quick_verification, screenshots):
+            print(report)
 
     print(f"\n✅ Verification complete!")
     print(f"Analyzed {len(screenshots)} scenarios")
@@ -11,6 +11,8 @@ import time
 # Add project root to path
 sys.path.append(str(Path(__file__).parent.parent))
 
+from tools.observe import OBSERVE
+
 def test_simple_key():
     """Simplest possible key test"""
     print("🧪 Simple Key Test")
@@ -43,20 +45,24 @@ def test_simple_key():
             print("📋 Loading test page...")
             page.goto(f'data:text/html,{simple_html}')
 
-            print("📋 Waiting 3 seconds for you to see the page...")
-            time.sleep(3)
+            page.wait_for_load_state("domcontentloaded")
+            if OBSERVE:
+                print("📋 Waiting 3 seconds for you to see the page...")
+                time.sleep(3)
 
             print("📋 Sending 'a' key...")
             page.keyboard.press('a')
 
-            print("📋 Waiting 2 seconds to see result...")
-            time.sleep(2)
+            if OBSERVE:
+                print("📋 Waiting 2 seconds to see result...")
+                time.sleep(2)
 
             print("📋 Sending Arrow key...")
             page.keyboard.press('ArrowUp')
 
-            print("📋 Waiting 3 seconds to see result...")
-            time.sleep(3)
+            if OBSERVE:
+                print("📋 Waiting 3 seconds to see result...")
+                time.sleep(3)
 
             # Check if text changed
             output_text = page.locator('#output').text_content()
@@ -11,13 +11,15 @@ import time
 # Add project root to path
 sys.path.append(str(Path(__file__).parent.parent))
 
+from tools.observe import OBSERVE
+
 def test_2048_automated():
     """Automated 2048 test with screenshot comparison"""
     print("🎯 Automated 2048 Game Test")
     print("=" * 40)
 
     try:
-        from playwright.sync_api import sync_playwright
+        from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
         import cv2
         import numpy as np
 
@@ -29,11 +31,18 @@ def test_2048_automated():
             print("📋 Loading 2048game.com...")
             try:
                 page.goto("https://2048game.com/", timeout=15000)
-                time.sleep(3)
-                print("✅ Game loaded successfully")
-            except:
-                print("❌ Failed to load 2048game.com, using local game...")
+            except Exception as e:
+                print(f"❌ Failed to load 2048game.com ({e}), using local game...")
                 return test_local_game_automated(page)
+            try:
+                page.wait_for_selector(".game-container", timeout=5000)
+            except PlaywrightTimeoutError:
+                # The page answered but the board rendered slowly; not a site failure
+                print("⏱️ 2048game.com loaded but .game-container took over 5s, using local game...")
+                return test_local_game_automated(page)
+            if OBSERVE:
+                time.sleep(3)
+            print("✅ Game loaded successfully")
 
             # Take initial screenshot
             print("\n📸 Capturing initial state...")
@@ -222,7 +231,9 @@ def test_local_game_automated(page):
 
     try:
         page.goto(f'data:text/html,{local_html}')
-        time.sleep(2)
+        page.wait_for_load_state("domcontentloaded")
+        if OBSERVE:
+            time.sleep(2)
         print("✅ Local game loaded")
 
         # Test moves
@@ -230,7 +241,8 @@ def test_local_game_automated(page):
         for i, key in enumerate(moves):
             print(f"📋 Testing {key}...")
             page.keyboard.press(key)
-            time.sleep(1)
+            if OBSERVE:
+                time.sleep(1)  # The counter updates in the keydown handler
 
             # Check move counter
             move_count = page.locator('#moves').text_content()
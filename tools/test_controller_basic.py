@@ -10,8 +10,6 @@ from pathlib import Path
 # Add project root to path
 sys.path.append(str(Path(__file__).parent.parent))
 
-from core.playwright_controller import PlaywrightController
-
 def test_basic_functionality():
     """Test basic browser functionality without external dependencies"""
     print("🧪 Basic Controller Test")
@@ -20,6 +18,8 @@ def test_basic_functionality():
     # Test 1: Controller creation
     print("\n📋 Test 1: Controller Creation")
     try:
+        # Imported here so loading this module does not pay for Playwright and OpenCV
+        from core.playwright_controller import PlaywrightController
         controller = PlaywrightController(headless=False, browser_type="chromium", block_ads=True)
         print("✅ Controller created successfully")
     except Exception as e:
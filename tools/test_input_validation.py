@@ -12,8 +12,6 @@ import time
 # Add project root to path
 sys.path.append(str(Path(__file__).parent.parent))
 
-from core.playwright_controller import PlaywrightController
-
 def test_input_with_keyboard_test_page():
     """Test input validation using a controlled keyboard test page"""
     print("🧪 Input Validation Test - Controlled Environment")
@@ -167,6 +165,8 @@ def test_input_with_keyboard_test_page():
 
     print("\n📋 Test 1: Controller Setup")
     try:
+        # Imported here so loading this module does not pay for Playwright and OpenCV
+        from core.playwright_controller import PlaywrightController
         controller = PlaywrightController(headless=False, browser_type="chromium", block_ads=False)
         print("✅ Controller created")
     except Exception as e:
@@ -12,6 +12,7 @@ import time
 sys.path.append(str(Path(__file__).parent.parent))
 
 from core.improved_vision import ImprovedBoardVision
+from tools.observe import OBSERVE
 
 def test_2048_game_sites():
     """Test with multiple 2048 game sites"""
@@ -41,7 +42,9 @@ def test_2048_game_sites():
                     page.goto(site, timeout=15000)  # 15 second timeout
 
                     # Wait for page load
-                    time.sleep(3)
+                    page.wait_for_load_state("domcontentloaded")
+                    if OBSERVE:
+                        time.sleep(3)
 
                     # Look for common 2048 game elements
                     if (page.locator(".game-container").count() > 0 or
@@ -259,8 +262,10 @@ def test_local_2048_game(page):
 
     try:
         page.goto(f'data:text/html,{local_game_html}')
+        page.wait_for_load_state("domcontentloaded")
         print("✅ Local test game loaded")
-        time.sleep(2)
+        if OBSERVE:
+            time.sleep(2)
 
         return test_game_interaction(page, "Local Test Game")
 
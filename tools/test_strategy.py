@@ -9,6 +9,7 @@ NO SIMULATIONS - uses actual screenshot data for all tests.
 import sys
 from pathlib import Path
 import unittest
+import tempfile
 from typing import Dict
 
 # Add project root to path
@@ -85,6 +86,68 @@ class TestBasicStrategy(unittest.TestCase):
         result = self.strategy._simulate_move(board, Move.LEFT)
         self.assertIsNone(result)
 
+    def test_transposition_table_reuse(self):
+        """Test cached board features give the same score and survive re-weighting"""
+        board = [[2, 4, 8, 16], [0, 2, 0, 4], [2048, 0, 0, 2], [0, 0, 0, 2]]
+        first = self.strategy.evaluate_board(board)
+        self.assertEqual(self.strategy.evaluate_board(board), first)
+
+        self.strategy.weights = dict(self.strategy.weights, max_tile_value=0.0)
+        self.assertAlmostEqual(self.strategy.evaluate_board(board), first - 2048 * 15.0)
+
+    def test_transposition_table_persistence(self):
+        """Test a saved table warms a fresh strategy"""
+        board = [[2, 2, 0, 0], [4, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0]]
+        self.strategy.evaluate_board(board)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = str(Path(tmp) / "tt.npz")
+            self.strategy.save_tt(path)
+
+            warm = BasicStrategy()
+            self.assertTrue(warm.load_tt(path))
+            self.assertFalse(BasicStrategy(tt_bits=8).load_tt(path))
+
+        key = warm._board_key(board)
+        self.assertIn(key, {int(k) for k in warm._tt_keys})
+
+    def test_batch_evaluation_matches_single(self):
+        """Test vectorized batch evaluation scores boards exactly like evaluate_board"""
+        boards = [
+            [[2, 4, 8, 16], [0, 2, 0, 4], [2048, 0, 0, 2], [0, 0, 0, 2]],
+            [[16, 8, 4, 2], [8, 4, 2, 0], [4, 2, 0, 0], [2, 0, 0, 0]],
+            [[2, 16, 4, 2], [8, 4, 2, 0], [4, 2, 0, 0], [3, 0, 0, 0]],  # Not packable
+            [[0, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0]],
+            [[1, 2, 3]]  # Invalid
+        ]
+        expected = [BasicStrategy().evaluate_board(board) for board in boards]
+        self.assertEqual(self.strategy.evaluate_boards(boards), expected)
+        self.assertEqual(self.strategy.evaluate_boards(boards), expected)  # Served from the table
+
+    def test_move_scores_match_simulation(self):
+        """Test move scores equal evaluating each simulated move separately"""
+        boards = [
+            [[2, 2, 0, 0], [0, 4, 4, 0], [0, 0, 0, 0], [0, 0, 0, 0]],
+            [[2, 4, 8, 16], [2, 4, 8, 16], [2, 4, 8, 16], [2, 4, 8, 16]],
+            [[4, 0, 4, 4], [8, 8, 0, 2], [0, 2, 2, 2], [16, 0, 0, 16]]
+        ]
+        for board in boards:
+            expected = []
+            for move in (Move.UP, Move.DOWN, Move.LEFT, Move.RIGHT):
+                new_board = self.strategy._simulate_move(board, move)
+                expected.append(self.strategy.evaluate_board(new_board) if new_board is not None else -999.0)
+            self.assertEqual(self.strategy.get_move_scores(board), expected)
+
+    def test_move_scores_beyond_int32_merges(self):
+        """Test a merge that would overflow int32 still scores like the simulation"""
+        board = [[2 ** 30, 2 ** 30, 0, 0], [2, 4, 8, 16], [4, 8, 16, 32], [8, 16, 32, 64]]
+        expected = []
+        for move in (Move.UP, Move.DOWN, Move.LEFT, Move.RIGHT):
+            new_board = self.strategy._simulate_move(board, move)
+            expected.append(self.strategy.evaluate_board(new_board) if new_board is not None else -999.0)
+        self.assertEqual(self.strategy.get_move_scores(board), expected)
+        self.assertGreater(expected[2], 1e10)  # LEFT merges into a 2**31 tile
+
 class StrategyValidator:
     """Validates strategy with real screenshot data"""
 
@@ -117,15 +180,16 @@ class StrategyValidator:
         ]
 
         for scenario in test_scenarios:
-            print(f"\\n📋 Testing: {scenario['name']}")
-            print(f"📄 {scenario['description']}")
+            # Each scenario's report is buffered and printed in one call
+            lines = [f"\\n📋 Testing: {scenario['name']}", f"📄 {scenario['description']}"]
 
             # Load screenshot
             image_path = project_root / "validation_data" / "easy_captures" / scenario["image"]
             image = cv2.imread(str(image_path))
 
             if image is None:
-                print(f"❌ Could not load: {scenario['image']}")
+                lines.append(f"❌ Could not load: {scenario['image']}")
+                print("\n".join(lines))
                 continue
 
             # Convert BGR to RGB
@@ -135,7 +199,8 @@ class StrategyValidator:
             vision_results = self.vision.analyze_board(image)
 
             if not vision_results['success']:
-                print(f"❌ Vision analysis failed: {vision_results.get('debug_info', {}).get('error')}")
+                lines.append(f"❌ Vision analysis failed: {vision_results.get('debug_info', {}).get('error')}")
+                print("\n".join(lines))
                 continue
 
             detected_board = vision_results['board_state']
@@ -156,17 +221,18 @@ class StrategyValidator:
             results["test_results"].append(test_result)
 
             # Display results
-            print(f"✅ Strategy Analysis Complete")
-            print(f"   🎯 Recommended Move: {best_move.value}")
-            print(f"   📊 Best Score: {analysis['best_score']:.1f}")
-            print(f"   💭 Reasoning: {analysis['reasoning']}")
+            lines.append(f"✅ Strategy Analysis Complete")
+            lines.append(f"   🎯 Recommended Move: {best_move.value}")
+            lines.append(f"   📊 Best Score: {analysis['best_score']:.1f}")
+            lines.append(f"   💭 Reasoning: {analysis['reasoning']}")
 
             # Show all move scores for manual verification
-            print(f"\\n   📋 All Move Scores:")
+            lines.append(f"\\n   📋 All Move Scores:")
             for move, score in analysis['all_scores'].items():
                 possible = analysis['move_analysis'][move].get('possible', True)
                 status = "✅" if possible else "❌"
-                print(f"      {status} {move.value}: {score:.1f}")
+                lines.append(f"      {status} {move.value}: {score:.1f}")
+            print("\n".join(lines))
 
         # Generate summary
         total_tests = len(results["test_results"])
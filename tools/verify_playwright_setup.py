@@ -31,21 +31,23 @@ def run_setup_verification():
         print(f"⚠️  CLI check failed: {e}")
 
     # Test 3: Browser availability
+    # Each engine is launched once with one page; later checks reuse that page
     print("\n📋 Test 3: Browser Availability")
     browsers_working = []
 
     with sync_playwright() as p:
+        launched = {}
+        pages = {}
         for browser_name, browser_launcher in [
             ('Chromium', p.chromium),
             ('Firefox', p.firefox),
             ('WebKit', p.webkit)
         ]:
             try:
-                browser = browser_launcher.launch(headless=True)
-                page = browser.new_page()
+                launched[browser_name] = browser_launcher.launch(headless=True)
+                page = pages[browser_name] = launched[browser_name].new_page()
                 page.goto('data:text/html,<h1>Test</h1>')
                 content = page.content()
-                browser.close()
 
                 if 'Test' in content:
                     print(f"✅ {browser_name} working")
@@ -56,8 +58,29 @@ def run_setup_verification():
             except Exception as e:
                 print(f"❌ {browser_name} failed: {str(e)[:50]}...")
 
-    # Test 4: Controller class
-    print("\n📋 Test 4: Controller Class")
+        # Test 4: Screenshot capability, navigating the Chromium page from Test 3
+        print("\n📋 Test 4: Screenshot Capability")
+        try:
+            if 'Chromium' not in pages:
+                raise RuntimeError("Chromium did not launch")
+
+            page = pages['Chromium']
+            page.goto('data:text/html,<div style="width:400px;height:300px;background:red;">Test</div>')
+            screenshot_bytes = page.screenshot()
+
+            if len(screenshot_bytes) > 1000:  # Basic size check
+                print("✅ Screenshot capture working")
+            else:
+                print("❌ Screenshot too small")
+
+        except Exception as e:
+            print(f"❌ Screenshot test failed: {e}")
+
+        for browser in launched.values():
+            browser.close()
+
+    # Test 5: Controller class
+    print("\n📋 Test 5: Controller Class")
     try:
         import sys
         from pathlib import Path
@@ -77,24 +100,6 @@ def run_setup_verification():
         print(f"❌ Controller test failed: {e}")
         return False
 
-    # Test 5: Screenshot capability
-    print("\n📋 Test 5: Screenshot Capability")
-    try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            page.goto('data:text/html,<div style="width:400px;height:300px;background:red;">Test</div>')
-            screenshot_bytes = page.screenshot()
-            browser.close()
-
-            if len(screenshot_bytes) > 1000:  # Basic size check
-                print("✅ Screenshot capture working")
-            else:
-                print("❌ Screenshot too small")
-
-    except Exception as e:
-        print(f"❌ Screenshot test failed: {e}")
-
     # Summary
     print("\n🎯 Setup Verification Summary")
     print("=" * 50)